@@ -1,6 +1,8 @@
 """Addons client for Supervisor."""
 
-from typing import Any
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from typing import IO, Any, Self
 
 from .client import _SupervisorComponentClient
 from .const import TIMEOUT_60_SECONDS, ResponseType
@@ -15,6 +17,92 @@ from .models.addons import (
     InstalledAddon,
     InstalledAddonComplete,
 )
+from .models.base import LogCursor, LogsOptions, LogsPage
+from .options import options_changes
+
+
+class AddonStdinWriter:
+    """Coalesce many small writes to stdin of an addon into fewer requests.
+
+    Buffered data is sent once max_size bytes are waiting or max_delay seconds
+    after the oldest unsent write, whichever comes first. Requests are sent one
+    at a time so data arrives in order. A write waits while max_size bytes are
+    buffered, which bounds memory. An error sending in the background is
+    raised by the next call.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes], Awaitable[None]],
+        *,
+        max_delay: float = 0.05,
+        max_size: int = 65536,
+    ) -> None:
+        """Initialize writer sending with write."""
+        self._write = write
+        self._max_delay = max_delay
+        self._max_size = max_size
+        self._buffer = bytearray()
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        self._error: BaseException | None = None
+
+    def _raise_error(self) -> None:
+        """Raise error of a background flush."""
+        if (error := self._error) is not None:
+            self._error = None
+            raise error
+
+    def _flush_later(self) -> None:
+        """Flush in the background once max delay passed."""
+        self._timer = None
+        task = asyncio.create_task(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task[None]) -> None:
+        """Keep error of a background flush for the next call."""
+        self._flushes.discard(task)
+        if not task.cancelled() and (error := task.exception()):
+            self._error = error
+
+    async def write(self, data: bytes) -> None:
+        """Write data, sending it once enough is buffered or max delay passed."""
+        self._raise_error()
+        self._buffer += data
+        if len(self._buffer) >= self._max_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._max_delay, self._flush_later
+            )
+
+    async def flush(self) -> None:
+        """Send all buffered data now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._buffer:
+                return
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            await self._write(data)
+
+    async def close(self) -> None:
+        """Send remaining data and wait for background sends to finish."""
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+        self._raise_error()
+
+    async def __aenter__(self) -> Self:
+        """Async enter."""
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Send remaining data."""
+        await self.close()
 
 
 class AddonsClient(_SupervisorComponentClient):
@@ -22,13 +110,15 @@ class AddonsClient(_SupervisorComponentClient):
 
     async def list(self) -> list[InstalledAddon]:
         """Get installed addons."""
-        result = await self._client.get("addons")
-        return AddonsList.from_dict(result.data).addons
+        result = await self._client.get("addons", model=AddonsList)
+        return result.data.addons
 
     async def addon_info(self, addon: str) -> InstalledAddonComplete:
         """Get all info for addon."""
-        result = await self._client.get(f"addons/{addon}/info")
-        return InstalledAddonComplete.from_dict(result.data)
+        result = await self._client.get(
+            f"addons/{addon}/info", model=InstalledAddonComplete
+        )
+        return result.data
 
     async def uninstall_addon(
         self,
@@ -58,6 +148,18 @@ class AddonsClient(_SupervisorComponentClient):
         """Set options for addon."""
         await self._client.post(f"addons/{addon}/options", json=options.to_dict())
 
+    async def set_addon_options_if_changed(
+        self, addon: InstalledAddonComplete, options: AddonsOptions
+    ) -> AddonsOptions | None:
+        """Set only options which differ from the current state of addon.
+
+        Returns the options sent, or None if nothing differs and Supervisor was
+        not called.
+        """
+        if (changes := options_changes(addon, options)) is not None:
+            await self.set_addon_options(addon.slug, changes)
+        return changes
+
     async def addon_config_validate(
         self,
         addon: str,
@@ -68,8 +170,9 @@ class AddonsClient(_SupervisorComponentClient):
             f"addons/{addon}/options/validate",
             response_type=ResponseType.JSON,
             json=config,
+            model=AddonsConfigValidate,
         )
-        return AddonsConfigValidate.from_dict(result.data)
+        return result.data
 
     async def addon_config(self, addon: str) -> dict[str, Any]:
         """Get config for addon."""
@@ -91,6 +194,29 @@ class AddonsClient(_SupervisorComponentClient):
         """Write to stdin of an addon (if supported by addon)."""
         await self._client.post(f"addons/{addon}/stdin", data=stdin)
 
+    async def write_addon_stdin_stream(
+        self, addon: str, stdin: AsyncIterable[bytes] | IO[bytes]
+    ) -> None:
+        """Stream to stdin of an addon from an async iterable or binary file.
+
+        Data is sent in one request as it is read, without holding all of it in
+        memory. Supervisor passes it on once the request is complete.
+        """
+        await self._client.post(f"addons/{addon}/stdin", data=stdin, timeout=None)
+
+    def addon_stdin_writer(
+        self, addon: str, *, max_delay: float = 0.05, max_size: int = 65536
+    ) -> AddonStdinWriter:
+        """Get writer batching many small writes to stdin of an addon.
+
+        Use it as an async context manager so remaining data is sent on exit.
+        """
+
+        async def _write(data: bytes) -> None:
+            await self.write_addon_stdin(addon, data)
+
+        return AddonStdinWriter(_write, max_delay=max_delay, max_size=max_size)
+
     async def set_addon_security(
         self, addon: str, options: AddonsSecurityOptions
     ) -> None:
@@ -99,7 +225,23 @@ class AddonsClient(_SupervisorComponentClient):
 
     async def addon_stats(self, addon: str) -> AddonsStats:
         """Get stats for addon."""
-        result = await self._client.get(f"addons/{addon}/stats")
-        return AddonsStats.from_dict(result.data)
+        result = await self._client.get(f"addons/{addon}/stats", model=AddonsStats)
+        return result.data
+
+    async def addon_logs(
+        self, addon: str, options: LogsOptions | None = None
+    ) -> AsyncIterator[str]:
+        """Get logs for addon as a stream of lines."""
+        return await self._get_logs(f"addons/{addon}/logs", options)
 
-    # Omitted for now - Log endpoints
+    async def addon_logs_page(
+        self,
+        addon: str,
+        cursor: LogCursor | None = None,
+        entries: int = 100,
+        options: LogsOptions | None = None,
+    ) -> LogsPage:
+        """Get a page of log entries for addon starting at cursor."""
+        return await self._get_logs_page(
+            f"addons/{addon}/logs", cursor, entries, options
+        )
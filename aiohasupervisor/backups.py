@@ -33,13 +33,13 @@ class BackupsClient(_SupervisorComponentClient):
 
     async def list(self) -> list[Backup]:
         """List backups."""
-        result = await self._client.get("backups")
-        return BackupList.from_dict(result.data).backups
+        result = await self._client.get("backups", model=BackupList)
+        return result.data.backups
 
     async def info(self) -> BackupsInfo:
         """Get backups info."""
-        result = await self._client.get("backups/info")
-        return BackupsInfo.from_dict(result.data)
+        result = await self._client.get("backups/info", model=BackupsInfo)
+        return result.data
 
     async def set_options(self, options: BackupsOptions) -> None:
         """Set options for backups."""
@@ -71,8 +71,9 @@ class BackupsClient(_SupervisorComponentClient):
             json=options.to_dict() if options else None,
             response_type=ResponseType.JSON,
             **kwargs,
+            model=NewBackup,
         )
-        return NewBackup.from_dict(result.data)
+        return result.data
 
     async def partial_backup(self, options: PartialBackupOptions) -> NewBackup:
         """Create a new partial backup."""
@@ -86,13 +87,14 @@ class BackupsClient(_SupervisorComponentClient):
             json=options.to_dict(),
             response_type=ResponseType.JSON,
             **kwargs,
+            model=NewBackup,
         )
-        return NewBackup.from_dict(result.data)
+        return result.data
 
     async def backup_info(self, backup: str) -> BackupComplete:
         """Get backup details."""
-        result = await self._client.get(f"backups/{backup}/info")
-        return BackupComplete.from_dict(result.data)
+        result = await self._client.get(f"backups/{backup}/info", model=BackupComplete)
+        return result.data
 
     async def remove_backup(
         self, backup: str, options: RemoveBackupOptions | None = None
@@ -116,8 +118,9 @@ class BackupsClient(_SupervisorComponentClient):
             json=options.to_dict() if options else None,
             response_type=ResponseType.JSON,
             **kwargs,
+            model=BackupJob,
         )
-        return BackupJob.from_dict(result.data)
+        return result.data
 
     async def partial_restore(
         self, backup: str, options: PartialRestoreOptions
@@ -133,8 +136,9 @@ class BackupsClient(_SupervisorComponentClient):
             json=options.to_dict(),
             response_type=ResponseType.JSON,
             **kwargs,
+            model=BackupJob,
         )
-        return BackupJob.from_dict(result.data)
+        return result.data
 
     async def upload_backup(
         self, stream: AsyncIterator[bytes], options: UploadBackupOptions | None = None
@@ -156,9 +160,10 @@ class BackupsClient(_SupervisorComponentClient):
                 data=mp,
                 response_type=ResponseType.JSON,
                 timeout=None,
+                model=UploadedBackup,
             )
 
-        return UploadedBackup.from_dict(result.data).slug
+        return result.data.slug
 
     async def download_backup(
         self, backup: str, options: DownloadBackupOptions | None = None
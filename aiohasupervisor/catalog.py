@@ -0,0 +1,526 @@
+"""Searchable catalog and caches of store addons."""
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from hashlib import sha256
+import logging
+from pathlib import Path
+import re
+from typing import Any
+
+import orjson
+
+from .exceptions import SupervisorError
+from .models.addons import (
+    AddonStage,
+    CpuArch,
+    InstalledAddon,
+    Repository,
+    StoreAddon,
+    StoreInfo,
+)
+from .store import StoreClient
+from .utils.cache import DiskCache, LRUCache
+
+_LOGGER = logging.getLogger(__name__)
+
+# Increase when the cache file layout or store models change incompatibly
+CACHE_VERSION = 1
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> set[str]:
+    """Split text into lowercase word tokens."""
+    return set(_TOKEN.findall(text.casefold()))
+
+
+async def _load_once[K, V](
+    pending: dict[K, asyncio.Task[V]],
+    key: K,
+    load: Callable[[], Coroutine[Any, Any, V]],
+) -> V:
+    """Load value for key, concurrent loads of the same key share one task."""
+    if (task := pending.get(key)) is None:
+        task = pending[key] = asyncio.create_task(load())
+        task.add_done_callback(lambda _: pending.pop(key, None))
+    return await asyncio.shield(task)
+
+
+class StoreCatalogCache:
+    """Store info persisted to a local file.
+
+    The file holds the decoded store info along with the digest of the raw
+    store payload it came from, so a refresh can skip decoding and rewriting
+    when Supervisor returns the same payload again.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialize cache stored at path."""
+        self._path = Path(path)
+        self.digest: str | None = None
+
+    def _read(self) -> StoreInfo | None:
+        """Read store info from cache file."""
+        try:
+            content = orjson.loads(self._path.read_bytes())
+            if content["version"] != CACHE_VERSION:
+                return None
+            info = StoreInfo.from_dict(content["info"])
+            digest = content["digest"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, LookupError, TypeError) as err:
+            _LOGGER.warning("Ignoring unusable store cache %s: %s", self._path, err)
+            return None
+        self.digest = digest
+        return info
+
+    def _write(self, digest: str, info: StoreInfo) -> None:
+        """Write store info to cache file atomically."""
+        content = {"version": CACHE_VERSION, "digest": digest, "info": info.to_dict()}
+        temp_path = self._path.with_name(f"{self._path.name}.tmp")
+        temp_path.write_bytes(orjson.dumps(content))
+        temp_path.replace(self._path)
+
+    async def load(self) -> StoreInfo | None:
+        """Load store info from cache file, if there is a usable one."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._read)
+
+    async def refresh(self, store: StoreClient) -> StoreInfo | None:
+        """Get store info and save it if it changed, else return None."""
+        digest, info = await store.info_if_changed(self.digest)
+        if info is None:
+            return None
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, digest, info
+        )
+        self.digest = digest
+        return info
+
+
+class StoreCatalog:
+    """In-memory index of store addons.
+
+    Keeps a map of addons by slug, an inverted index of the words in their name
+    and description and facet indexes for repository, stage, architecture,
+    installed and update_available. Updates only reindex addons which changed.
+    """
+
+    def __init__(
+        self,
+        addons: Iterable[StoreAddon] = (),
+        repositories: Iterable[Repository] = (),
+    ) -> None:
+        """Initialize catalog."""
+        self._addons: dict[str, StoreAddon] = {}
+        self._repositories: dict[str, Repository] = {}
+        self._tokens: dict[str, set[str]] = {}
+        self._sorted_tokens: list[str] | None = None
+        self._facets: dict[str, dict[Any, set[str]]] = {
+            "repository": {},
+            "stage": {},
+            "arch": {},
+            "installed": {},
+            "update_available": {},
+        }
+        self.update(addons, repositories)
+
+    def __len__(self) -> int:
+        """Get number of addons in catalog."""
+        return len(self._addons)
+
+    def __contains__(self, slug: object) -> bool:
+        """Check if catalog has an addon with slug."""
+        return slug in self._addons
+
+    @property
+    def addons(self) -> list[StoreAddon]:
+        """Get all addons in catalog."""
+        return list(self._addons.values())
+
+    @property
+    def repositories(self) -> list[Repository]:
+        """Get all repositories in catalog."""
+        return list(self._repositories.values())
+
+    def get(self, slug: str) -> StoreAddon | None:
+        """Get addon by slug."""
+        return self._addons.get(slug)
+
+    def repository(self, slug: str) -> Repository | None:
+        """Get repository by slug."""
+        return self._repositories.get(slug)
+
+    def _facet_values(self, addon: StoreAddon) -> Iterable[tuple[str, Any]]:
+        """Get facet values of addon."""
+        yield "repository", addon.repository
+        yield "stage", addon.stage
+        yield "installed", addon.installed
+        yield "update_available", addon.update_available
+        for arch in addon.arch:
+            yield "arch", arch
+
+    def _index(self, addon: StoreAddon) -> None:
+        """Add addon to indexes."""
+        for token in _tokenize(f"{addon.name} {addon.description}"):
+            if token not in self._tokens:
+                self._tokens[token] = set()
+                self._sorted_tokens = None
+            self._tokens[token].add(addon.slug)
+        for facet, value in self._facet_values(addon):
+            self._facets[facet].setdefault(value, set()).add(addon.slug)
+
+    def _unindex(self, addon: StoreAddon) -> None:
+        """Remove addon from indexes."""
+        for token in _tokenize(f"{addon.name} {addon.description}"):
+            slugs = self._tokens[token]
+            slugs.discard(addon.slug)
+            if not slugs:
+                del self._tokens[token]
+                self._sorted_tokens = None
+        for facet, value in self._facet_values(addon):
+            slugs = self._facets[facet][value]
+            slugs.discard(addon.slug)
+            if not slugs:
+                del self._facets[facet][value]
+
+    def update(
+        self,
+        addons: Iterable[StoreAddon],
+        repositories: Iterable[Repository] | None = None,
+    ) -> set[str]:
+        """Replace catalog contents, return slugs of addons added, changed or removed.
+
+        Repositories are left as is if not provided.
+        """
+        if repositories is not None:
+            self._repositories = {repo.slug: repo for repo in repositories}
+
+        new = {addon.slug: addon for addon in addons}
+        changed: set[str] = set()
+        for slug in self._addons.keys() - new.keys():
+            self._unindex(self._addons.pop(slug))
+            changed.add(slug)
+        for slug, addon in new.items():
+            if (old := self._addons.get(slug)) == addon:
+                continue
+            if old is not None:
+                self._unindex(old)
+            self._index(addon)
+            changed.add(slug)
+
+        self._addons = new
+        return changed
+
+    async def refresh(
+        self,
+        store: StoreClient,
+        *,
+        reload: bool = False,
+        cache: StoreCatalogCache | None = None,
+    ) -> set[str]:
+        """Update catalog from store, optionally reloading the store first.
+
+        With a cache, store info is only decoded and indexed if it changed
+        since it was last saved to the cache. An empty catalog is seeded from
+        the cache when store info did not change.
+        """
+        if reload:
+            await store.reload()
+        info: StoreInfo | None
+        if cache is None:
+            info = await store.info()
+        elif (info := await cache.refresh(store)) is None and (
+            self._addons or (info := await cache.load()) is None
+        ):
+            return set()
+        return self.update(info.addons, info.repositories)
+
+    def _match_prefix(self, prefix: str) -> set[str]:
+        """Get slugs of addons with a token starting with prefix."""
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._tokens)
+        matches: set[str] = set()
+        index = bisect_left(self._sorted_tokens, prefix)
+        while index < len(self._sorted_tokens) and self._sorted_tokens[
+            index
+        ].startswith(prefix):
+            matches |= self._tokens[self._sorted_tokens[index]]
+            index += 1
+        return matches
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        repository: str | None = None,
+        stage: AddonStage | None = None,
+        arch: CpuArch | None = None,
+        installed: bool | None = None,
+        update_available: bool | None = None,
+        limit: int | None = None,
+    ) -> list[StoreAddon]:
+        """Find addons matching every word of query and all given facets.
+
+        Words of the query match words in name or description they are a prefix
+        of, so partially typed words match as well. Results are ordered by name.
+        """
+        candidates: list[set[str]] = [
+            self._match_prefix(token) for token in _tokenize(query)
+        ]
+        for facet, value in (
+            ("repository", repository),
+            ("stage", stage),
+            ("arch", arch),
+            ("installed", installed),
+            ("update_available", update_available),
+        ):
+            if value is not None:
+                candidates.append(self._facets[facet].get(value, set()))
+
+        if candidates:
+            candidates.sort(key=len)
+            slugs = candidates[0].intersection(*candidates[1:])
+            results = [self._addons[slug] for slug in slugs]
+        else:
+            results = list(self._addons.values())
+
+        results.sort(key=lambda addon: addon.name.casefold())
+        return results[:limit]
+
+
+def _text_size(text: str) -> int:
+    """Get size of text in bytes, as encoded in UTF-8."""
+    return len(text.encode())
+
+
+class StoreDocsCache:
+    """Cache of addon changelogs and documentation.
+
+    Both only change with the latest version of an addon, so texts are cached
+    by slug and version_latest. Recently used texts are kept in memory and, if
+    a path is given, on disk as well. Both tiers are bounded in size (bytes).
+    Texts got from either tier count as hits, from Supervisor as misses.
+    """
+
+    def __init__(
+        self,
+        store: StoreClient,
+        path: Path | str | None = None,
+        *,
+        max_memory: int = 2 * 1024 * 1024,
+        max_disk: int = 32 * 1024 * 1024,
+    ) -> None:
+        """Initialize cache for store."""
+        self._store = store
+        self._memory: LRUCache[tuple[str, str, str], str] = LRUCache(
+            max_memory, _text_size
+        )
+        self._disk = DiskCache(path, max_disk) if path else None
+        self._pending: dict[tuple[str, str, str], asyncio.Task[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def _load(
+        self, key: tuple[str, str, str], fetch: Callable[[str], Awaitable[str]]
+    ) -> str:
+        """Load text from disk or Supervisor and cache it."""
+        loop = asyncio.get_running_loop()
+        disk_key = "/".join(key)
+        if (
+            self._disk
+            and (data := await loop.run_in_executor(None, self._disk.get, disk_key))
+            is not None
+        ):
+            text = data.decode()
+            self.hits += 1
+        else:
+            text = await fetch(key[1])
+            self.misses += 1
+            if self._disk:
+                await loop.run_in_executor(
+                    None, self._disk.set, disk_key, text.encode()
+                )
+        self._memory.set(key, text)
+        return text
+
+    async def _get(
+        self,
+        kind: str,
+        addon: str,
+        version: str,
+        fetch: Callable[[str], Awaitable[str]],
+    ) -> str:
+        """Get text from cache, concurrent misses share one request."""
+        key = (kind, addon, version)
+        if (text := self._memory.get(key)) is not None:
+            self.hits += 1
+            return text
+        return await _load_once(self._pending, key, lambda: self._load(key, fetch))
+
+    async def changelog(self, addon: str, version: str) -> str:
+        """Get changelog of version of addon."""
+        return await self._get("changelog", addon, version, self._store.addon_changelog)
+
+    async def documentation(self, addon: str, version: str) -> str:
+        """Get documentation of version of addon."""
+        return await self._get(
+            "documentation", addon, version, self._store.addon_documentation
+        )
+
+    async def prefetch(
+        self,
+        addons: Iterable[StoreAddon | InstalledAddon],
+        *,
+        documentation: bool = False,
+        concurrency: int = 4,
+    ) -> None:
+        """Fetch changelogs of all addons with an update available.
+
+        Optionally documentation is fetched as well. Addons without changelog
+        or documentation are skipped.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch(
+            method: Callable[[str, str], Awaitable[str]],
+            addon: StoreAddon | InstalledAddon,
+        ) -> None:
+            async with semaphore:
+                try:
+                    await method(addon.slug, addon.version_latest)
+                except SupervisorError as err:
+                    _LOGGER.debug("Could not prefetch for %s: %s", addon.slug, err)
+
+        fetches = []
+        for addon in addons:
+            if not addon.update_available:
+                continue
+            fetches.append(_fetch(self.changelog, addon))
+            if documentation and getattr(addon, "documentation", True):
+                fetches.append(_fetch(self.documentation, addon))
+        await asyncio.gather(*fetches)
+
+
+class StoreImageCache:
+    """Cache of addon icons and logos.
+
+    Images are cached by slug and version_latest of the addon. They are stored
+    content addressed, a new version with the same image does not store it
+    again. Recently used images are kept in memory and, if a path is given, on
+    disk as well. Both tiers are bounded in size (bytes). Images got from either
+    tier count as hits, from Supervisor as misses.
+    """
+
+    def __init__(
+        self,
+        store: StoreClient,
+        path: Path | str | None = None,
+        *,
+        max_memory: int = 8 * 1024 * 1024,
+        max_disk: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Initialize cache for store."""
+        self._store = store
+        self._memory: LRUCache[str, bytes] = LRUCache(max_memory, len)
+        self._digests: LRUCache[tuple[str, str, str], str] = LRUCache(4096)
+        self._disk = DiskCache(path, max_disk) if path else None
+        self._pending: dict[tuple[str, str, str], asyncio.Task[bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _read_disk(
+        disk: DiskCache, key: tuple[str, str, str]
+    ) -> tuple[str, bytes] | None:
+        """Read digest and image for key from disk."""
+        if (digest := disk.get("/".join(key))) is None:
+            return None
+        if (data := disk.get(digest.decode())) is None:
+            return None
+        return digest.decode(), data
+
+    @staticmethod
+    def _write_disk(
+        disk: DiskCache, key: tuple[str, str, str], digest: str, data: bytes
+    ) -> None:
+        """Write image for key to disk, image is stored under its digest."""
+        disk.set(digest, data)
+        disk.set("/".join(key), digest.encode())
+
+    async def _load(
+        self, key: tuple[str, str, str], fetch: Callable[[str], Awaitable[bytes]]
+    ) -> bytes:
+        """Load image from disk or Supervisor and cache it."""
+        loop = asyncio.get_running_loop()
+        if self._disk and (
+            cached := await loop.run_in_executor(None, self._read_disk, self._disk, key)
+        ):
+            digest, data = cached
+            self.hits += 1
+        else:
+            data = await fetch(key[1])
+            self.misses += 1
+            digest = sha256(data).hexdigest()
+            if self._disk:
+                await loop.run_in_executor(
+                    None, self._write_disk, self._disk, key, digest, data
+                )
+        self._digests.set(key, digest)
+        self._memory.set(digest, data)
+        return data
+
+    async def _get(
+        self,
+        kind: str,
+        addon: StoreAddon | InstalledAddon,
+        fetch: Callable[[str], Awaitable[bytes]],
+    ) -> bytes | None:
+        """Get image from cache if addon has one."""
+        if not getattr(addon, kind):
+            return None
+        key = (kind, addon.slug, addon.version_latest)
+        if (digest := self._digests.get(key)) and (
+            data := self._memory.get(digest)
+        ) is not None:
+            self.hits += 1
+            return data
+        return await _load_once(self._pending, key, lambda: self._load(key, fetch))
+
+    async def icon(self, addon: StoreAddon | InstalledAddon) -> bytes | None:
+        """Get icon of addon, None if addon has no icon."""
+        return await self._get("icon", addon, self._store.addon_icon)
+
+    async def logo(self, addon: StoreAddon | InstalledAddon) -> bytes | None:
+        """Get logo of addon, None if addon has no logo."""
+        return await self._get("logo", addon, self._store.addon_logo)
+
+    async def prefetch(
+        self,
+        addons: Iterable[StoreAddon | InstalledAddon],
+        *,
+        logos: bool = False,
+        concurrency: int = 8,
+    ) -> None:
+        """Fetch icons, and optionally logos, of all addons which have them."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch(
+            method: Callable[[StoreAddon | InstalledAddon], Awaitable[bytes | None]],
+            addon: StoreAddon | InstalledAddon,
+        ) -> None:
+            async with semaphore:
+                try:
+                    await method(addon)
+                except SupervisorError as err:
+                    _LOGGER.debug("Could not prefetch for %s: %s", addon.slug, err)
+
+        fetches = []
+        for addon in addons:
+            if addon.icon:
+                fetches.append(_fetch(self.icon, addon))
+            if logos and addon.logo:
+                fetches.append(_fetch(self.logo, addon))
+        await asyncio.gather(*fetches)
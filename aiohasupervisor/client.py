@@ -1,21 +1,24 @@
 """Internal client for making requests and managing session with Supervisor."""
 
-from dataclasses import dataclass, field
+import asyncio
+from collections.abc import AsyncIterator
+from contextvars import copy_context
+from dataclasses import dataclass, field, replace
 from http import HTTPMethod, HTTPStatus
 from importlib import metadata
+import time
 from typing import Any
 
-from aiohttp import (
-    ClientError,
-    ClientResponse,
-    ClientResponseError,
-    ClientSession,
-    ClientTimeout,
-)
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout
 from multidict import MultiDict
 from yarl import URL
 
-from .const import DEFAULT_TIMEOUT, ResponseType
+from .const import (
+    DEFAULT_TIMEOUT,
+    OFFLOAD_DECODE_SIZE,
+    TIMEOUT_60_SECONDS,
+    ResponseType,
+)
 from .exceptions import (
     ERROR_KEYS,
     SupervisorAuthenticationError,
@@ -28,13 +31,28 @@ from .exceptions import (
     SupervisorServiceUnavailableError,
     SupervisorTimeoutError,
 )
-from .models.base import Response, ResultType
-from .utils.aiohttp import ChunkAsyncStreamIterator
+from .instrumentation import Instrumentation, RequestInfo, current_request
+from .logs import parse_log_timestamp, strip_log_prefix
+from .models.base import (
+    LogCursor,
+    LogsOptions,
+    LogsPage,
+    Response,
+    ResponseData,
+    ResultType,
+)
+from .transport import (
+    SessionTransport,
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+from .utils.aiohttp import ChunkAsyncStreamIterator, LineAsyncStreamIterator
 
 VERSION = metadata.version(__package__)
 
 
-def is_json(response: ClientResponse, *, raise_on_fail: bool = False) -> bool:
+def is_json(response: TransportResponse, *, raise_on_fail: bool = False) -> bool:
     """Check if response is json according to Content-Type."""
     content_type = response.headers.get("Content-Type", "")
     if "application/json" not in content_type:
@@ -47,6 +65,20 @@ def is_json(response: ClientResponse, *, raise_on_fail: bool = False) -> bool:
     return True
 
 
+def _decode(body: str | bytes, model: type[ResponseData] | None) -> Response:
+    """Decode JSON response, and its data into model if given."""
+    result = Response.from_json(body)
+    if model is None:
+        return result
+    return replace(result, data=model.from_dict(result.data))
+
+
+async def _body_received(info: RequestInfo, response: TransportResponse) -> None:
+    """Record body of response was received, read is cached once it was."""
+    info.body_received = time.monotonic()
+    info.bytes_in = len(await response.read())
+
+
 @dataclass(slots=True)
 class _SupervisorClient:
     """Main class for handling connections with Supervisor."""
@@ -54,9 +86,12 @@ class _SupervisorClient:
     api_host: str
     token: str
     session: ClientSession | None = None
+    transport: Transport | None = None
+    instrumentation: Instrumentation | None = None
+    offload_decode_size: int | None = OFFLOAD_DECODE_SIZE
     _close_session: bool = field(default=False, init=False)
 
-    async def _raise_on_status(self, response: ClientResponse) -> None:
+    async def _raise_on_status(self, response: TransportResponse) -> None:
         """Raise appropriate exception on status."""
         if response.status >= HTTPStatus.BAD_REQUEST.value:
             exc_type: type[SupervisorError] = SupervisorError
@@ -92,7 +127,9 @@ class _SupervisorClient:
         response_type: ResponseType,
         json: dict[str, Any] | None = None,
         data: Any = None,
+        headers: dict[str, str] | None = None,
         timeout: ClientTimeout | None = DEFAULT_TIMEOUT,
+        model: type[ResponseData] | None = None,
     ) -> Response:
         """Handle a request to Supervisor."""
         try:
@@ -113,36 +150,92 @@ class _SupervisorClient:
             case _:
                 accept = "application/json, text/plain, */*"
 
-        headers = {
+        request_headers = {
             "User-Agent": f"AioHASupervisor/{VERSION}",
             "Accept": accept,
             "Authorization": f"Bearer {self.token}",
         }
+        if headers:
+            request_headers.update(headers)
 
-        if self.session is None:
-            self.session = ClientSession()
-            self._close_session = True
+        if (transport := self.transport) is None:
+            if self.session is None:
+                self.session = (
+                    self.instrumentation.create_session()
+                    if self.instrumentation
+                    else ClientSession()
+                )
+                self._close_session = True
+            transport = self.transport = SessionTransport(self.session)
 
+        request = TransportRequest(
+            method,
+            url,
+            request_headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=timeout,
+        )
+        if self.instrumentation is None:
+            return await self._perform(transport, request, response_type, model)
+
+        info = self.instrumentation.start(method, uri)
         try:
-            response = await self.session.request(
-                method.value,
-                url,
-                timeout=timeout,
-                headers=headers,
-                params=params,
-                json=json,
-                data=data,
+            return await self._perform(
+                transport, replace(request, info=info), response_type, model
             )
+        except SupervisorError as err:
+            info.error = err
+            raise
+        finally:
+            self.instrumentation.end(info)
+
+    async def _perform(
+        self,
+        transport: Transport,
+        request: TransportRequest,
+        response_type: ResponseType,
+        model: type[ResponseData] | None,
+    ) -> Response:
+        """Perform request with transport and decode response."""
+        info = request.info
+        try:
+            response = await transport.request(request)
+            if info:
+                info.headers_received = time.monotonic()
+                info.status = response.status
             await self._raise_on_status(response)
             match response_type:
                 case ResponseType.JSON:
                     is_json(response, raise_on_fail=True)
-                    return Response.from_json(await response.text())
+                    text = await response.text()
+                    if info:
+                        await _body_received(info, response)
+                    return await self.decode(text, model)
+                case ResponseType.RAW_JSON:
+                    is_json(response, raise_on_fail=True)
+                    body = await response.read()
+                    if info:
+                        await _body_received(info, response)
+                    return Response(ResultType.OK, body)
                 case ResponseType.TEXT:
-                    return Response(ResultType.OK, await response.text())
+                    text = await response.text()
+                    if info:
+                        await _body_received(info, response)
+                    return Response(ResultType.OK, text)
+                case ResponseType.BYTES:
+                    body = await response.read()
+                    if info:
+                        await _body_received(info, response)
+                    return Response(ResultType.OK, body)
                 case ResponseType.STREAM:
+                    content = response.content
+                    if info and self.instrumentation:
+                        content = self.instrumentation.stream(info, content)
                     return Response(
-                        ResultType.OK, ChunkAsyncStreamIterator(response.content)
+                        ResultType.OK,
+                        ChunkAsyncStreamIterator(content, response.headers),
                     )
                 case _:
                     return Response(ResultType.OK)
@@ -158,21 +251,49 @@ class _SupervisorClient:
                 "Error occurred connecting to supervisor",
             ) from err
 
+    async def decode(
+        self, body: str | bytes, model: type[ResponseData] | None = None
+    ) -> Response:
+        """Decode JSON response, and its data into model if given.
+
+        Bodies of offload decode size or larger are decoded in an executor so
+        decoding does not block the event loop. The decode runs in a copy of
+        the current context, so it is attributed to the current request, which
+        records when decoding ended.
+        """
+        if self.offload_decode_size is None or len(body) < self.offload_decode_size:
+            result = _decode(body, model)
+        else:
+            result = await asyncio.get_running_loop().run_in_executor(
+                None, copy_context().run, _decode, body, model
+            )
+        if self.instrumentation and (info := current_request()):
+            info.decoded = time.monotonic()
+        return result
+
     async def get(
         self,
         uri: str,
         *,
         params: dict[str, str] | MultiDict[str] | None = None,
         response_type: ResponseType = ResponseType.JSON,
+        headers: dict[str, str] | None = None,
         timeout: ClientTimeout | None = DEFAULT_TIMEOUT,
+        model: type[ResponseData] | None = None,
     ) -> Response:
-        """Handle a GET request to Supervisor."""
+        """Handle a GET request to Supervisor.
+
+        Data of a JSON response is decoded into model if given, so decoding
+        the model is measured and offloaded along with decoding the body.
+        """
         return await self._request(
             HTTPMethod.GET,
             uri,
             params=params,
             response_type=response_type,
+            headers=headers,
             timeout=timeout,
+            model=model,
         )
 
     async def post(
@@ -184,8 +305,12 @@ class _SupervisorClient:
         json: dict[str, Any] | None = None,
         data: Any = None,
         timeout: ClientTimeout | None = DEFAULT_TIMEOUT,
+        model: type[ResponseData] | None = None,
     ) -> Response:
-        """Handle a POST request to Supervisor."""
+        """Handle a POST request to Supervisor.
+
+        Data of a JSON response is decoded into model if given.
+        """
         return await self._request(
             HTTPMethod.POST,
             uri,
@@ -194,6 +319,7 @@ class _SupervisorClient:
             json=json,
             data=data,
             timeout=timeout,
+            model=model,
         )
 
     async def put(
@@ -244,3 +370,86 @@ class _SupervisorComponentClient:
     def __init__(self, client: _SupervisorClient) -> None:
         """Initialize sub module with client for API calls."""
         self._client = client
+
+    async def _stream_logs(
+        self,
+        uri: str,
+        options: LogsOptions | None = None,
+        *,
+        identifier: str | None = None,
+        log_range: str | None = None,
+    ) -> ChunkAsyncStreamIterator:
+        """Request a logs endpoint of a component and return the raw stream."""
+        if options and options.boot is not None:
+            uri = f"{uri}/boots/{options.boot}"
+        if identifier:
+            uri = f"{uri}/identifiers/{identifier}"
+        if follow := bool(options and options.follow):
+            uri = f"{uri}/follow"
+
+        # Supervisor only accepts these exact media types for logs
+        headers = {
+            "Accept": "text/x-log" if options and options.verbose else "text/plain"
+        }
+        if log_range:
+            headers["Range"] = log_range
+        params: dict[str, str] = {}
+        if options and options.lines is not None:
+            params["lines"] = str(options.lines)
+
+        result = await self._client.get(
+            uri,
+            params=params,
+            response_type=ResponseType.STREAM,
+            headers=headers,
+            timeout=None if follow else TIMEOUT_60_SECONDS,
+        )
+        return result.data
+
+    async def _get_logs(
+        self,
+        uri: str,
+        options: LogsOptions | None = None,
+        *,
+        identifier: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Get log lines from a logs endpoint of a component."""
+        return LineAsyncStreamIterator(
+            await self._stream_logs(uri, options, identifier=identifier)
+        )
+
+    async def _get_logs_page(
+        self,
+        uri: str,
+        cursor: LogCursor | None,
+        entries: int,
+        options: LogsOptions | None = None,
+        *,
+        identifier: str | None = None,
+    ) -> LogsPage:
+        """Get a page of log entries from a logs endpoint of a component."""
+        if options and (options.follow or options.lines is not None):
+            raise ValueError("Follow and lines cannot be used when paging logs")
+        cursor = cursor or LogCursor()
+
+        # Verbose lines tell where entries start, only those have a timestamp
+        stream = await self._stream_logs(
+            uri,
+            replace(options, verbose=True) if options else LogsOptions(verbose=True),
+            identifier=identifier,
+            log_range=f"entries={cursor.cursor}:{cursor.skip}:{entries}",
+        )
+        lines = [line async for line in LineAsyncStreamIterator(stream)]
+        received = sum(
+            1
+            for index, line in enumerate(lines)
+            if index == 0 or parse_log_timestamp(line)
+        )
+        if not (options and options.verbose):
+            lines = [strip_log_prefix(line) for line in lines]
+
+        # Supervisor only reports the cursor of the first entry, the next page
+        # starts after skipping all entries received from that one
+        if first_cursor := stream.headers.get("X-First-Cursor"):
+            return LogsPage(lines, LogCursor(first_cursor, received))
+        return LogsPage(lines, cursor)
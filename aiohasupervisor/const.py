@@ -7,11 +7,16 @@ from aiohttp import ClientTimeout
 DEFAULT_TIMEOUT = ClientTimeout(total=10)
 TIMEOUT_60_SECONDS = ClientTimeout(total=60)
 
+# JSON responses from this size on are decoded in an executor
+OFFLOAD_DECODE_SIZE = 64 * 1024
+
 
 class ResponseType(StrEnum):
     """Expected response type."""
 
     NONE = "none"
+    BYTES = "bytes"
     JSON = "json"
+    RAW_JSON = "raw_json"
     STREAM = "stream"
     TEXT = "text"
@@ -12,13 +12,15 @@ class DiscoveryClient(_SupervisorComponentClient):
 
     async def list(self) -> list[Discovery]:
         """List discovered active services."""
-        result = await self._client.get("discovery", timeout=TIMEOUT_60_SECONDS)
-        return DiscoveryList.from_dict(result.data).discovery
+        result = await self._client.get(
+            "discovery", timeout=TIMEOUT_60_SECONDS, model=DiscoveryList
+        )
+        return result.data.discovery
 
     async def get(self, uuid: UUID) -> Discovery:
         """Get discovery details for a service."""
-        result = await self._client.get(f"discovery/{uuid.hex}")
-        return Discovery.from_dict(result.data)
+        result = await self._client.get(f"discovery/{uuid.hex}", model=Discovery)
+        return result.data
 
     async def delete(self, uuid: UUID) -> None:
         """Remove discovery for a service."""
@@ -27,6 +29,9 @@ class DiscoveryClient(_SupervisorComponentClient):
     async def set(self, config: DiscoveryConfig) -> UUID:
         """Inform supervisor of an available service."""
         result = await self._client.post(
-            "discovery", json=config.to_dict(), response_type=ResponseType.JSON
+            "discovery",
+            json=config.to_dict(),
+            response_type=ResponseType.JSON,
+            model=SetDiscovery,
         )
-        return SetDiscovery.from_dict(result.data).uuid
+        return result.data.uuid
@@ -1,6 +1,9 @@
 """Home Assistant client for supervisor."""
 
+from collections.abc import AsyncIterator
+
 from .client import _SupervisorComponentClient
+from .models.base import LogsOptions
 from .models.homeassistant import (
     HomeAssistantInfo,
     HomeAssistantOptions,
@@ -17,13 +20,13 @@ class HomeAssistantClient(_SupervisorComponentClient):
 
     async def info(self) -> HomeAssistantInfo:
         """Get Home Assistant info."""
-        result = await self._client.get("core/info")
-        return HomeAssistantInfo.from_dict(result.data)
+        result = await self._client.get("core/info", model=HomeAssistantInfo)
+        return result.data
 
     async def stats(self) -> HomeAssistantStats:
         """Get Home Assistant stats."""
-        result = await self._client.get("core/stats")
-        return HomeAssistantStats.from_dict(result.data)
+        result = await self._client.get("core/stats", model=HomeAssistantStats)
+        return result.data
 
     async def set_options(self, options: HomeAssistantOptions) -> None:
         """Set Home Assistant options."""
@@ -64,3 +67,7 @@ class HomeAssistantClient(_SupervisorComponentClient):
             json=options.to_dict() if options else None,
             timeout=None,
         )
+
+    async def logs(self, options: LogsOptions | None = None) -> AsyncIterator[str]:
+        """Get Home Assistant logs as a stream of lines."""
+        return await self._get_logs("core/logs", options)
@@ -1,7 +1,10 @@
 """Host client for supervisor."""
 
+from collections.abc import AsyncIterator
+
 from .client import _SupervisorComponentClient
 from .const import TIMEOUT_60_SECONDS
+from .models.base import LogCursor, LogsOptions, LogsPage
 from .models.host import (
     DiskUsage,
     HostInfo,
@@ -18,8 +21,8 @@ class HostClient(_SupervisorComponentClient):
 
     async def info(self) -> HostInfo:
         """Get host info."""
-        result = await self._client.get("host/info")
-        return HostInfo.from_dict(result.data)
+        result = await self._client.get("host/info", model=HostInfo)
+        return result.data
 
     async def reboot(self, options: RebootOptions | None = None) -> None:
         """Reboot host."""
@@ -45,15 +48,36 @@ class HostClient(_SupervisorComponentClient):
 
     async def services(self) -> list[Service]:
         """Get list of available services on host."""
-        result = await self._client.get("host/services")
-        return ServiceList.from_dict(result.data).services
+        result = await self._client.get("host/services", model=ServiceList)
+        return result.data.services
 
     async def get_disk_usage(self, max_depth: int = 1) -> DiskUsage:
         """Get disk usage."""
         result = await self._client.get(
             "host/disks/default/usage",
             params={"max_depth": str(max_depth)},
+            model=DiskUsage,
         )
-        return DiskUsage.from_dict(result.data)
+        return result.data
+
+    async def logs(
+        self, options: LogsOptions | None = None, identifier: str | None = None
+    ) -> AsyncIterator[str]:
+        """Get host logs as a stream of lines.
 
-    # Omitted for now - Log endpoints
+        Without an identifier this returns the journal entries of the default
+        host services. Otherwise only entries with that syslog identifier.
+        """
+        return await self._get_logs("host/logs", options, identifier=identifier)
+
+    async def logs_page(
+        self,
+        cursor: LogCursor | None = None,
+        entries: int = 100,
+        options: LogsOptions | None = None,
+        identifier: str | None = None,
+    ) -> LogsPage:
+        """Get a page of host log entries starting at cursor."""
+        return await self._get_logs_page(
+            "host/logs", cursor, entries, options, identifier=identifier
+        )
@@ -15,8 +15,8 @@ class IngressClient(_SupervisorComponentClient):
 
     async def panels(self) -> dict[str, IngressPanel]:
         """Get ingress panels, returns a map of addon slug to panel info."""
-        result = await self._client.get("ingress/panels")
-        return IngressPanels.from_dict(result.data).panels
+        result = await self._client.get("ingress/panels", model=IngressPanels)
+        return result.data.panels
 
     async def create_session(self, options: CreateSessionOptions | None = None) -> str:
         """Create a new ingress session."""
@@ -24,8 +24,9 @@ class IngressClient(_SupervisorComponentClient):
             "ingress/session",
             json=options.to_dict() if options else None,
             response_type=ResponseType.JSON,
+            model=Session,
         )
-        return Session.from_dict(result.data).session
+        return result.data.session
 
     async def validate_session(self, session: str) -> None:
         """Validate an existing ingress session."""
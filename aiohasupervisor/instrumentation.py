@@ -0,0 +1,340 @@
+"""Instrumentation of requests made by the client.
+
+An Instrumentation passed to the client gets a RequestInfo for every request
+when it starts and when it ends. It keeps latency histograms per route and
+status, requests in flight and bytes transferred per route. Routes are
+templates such as addons/{addon}/info so requests for different addons,
+backups and so on are counted together.
+
+Connection reuse, connection pool wait and bytes sent are only known when
+requests are made with an aiohttp session using the trace config of the
+instrumentation. The client adds it to the session it creates, add it to
+sessions passed to the client.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from http import HTTPMethod
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionQueuedStartParams,
+    TraceConnectionReuseconnParams,
+    TraceRequestChunkSentParams,
+)
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from .exceptions import SupervisorError
+    from .transport import ChunkReader
+
+_LOGGER = logging.getLogger(__name__)
+
+# Segment following these routes names a resource, unless it is one of the literals
+_PARAMETERS: dict[str, tuple[str, frozenset[str]]] = {
+    "addons": ("{addon}", frozenset({"reload"})),
+    "backups": (
+        "{backup}",
+        frozenset({"freeze", "info", "new", "options", "reload", "thaw"}),
+    ),
+    "discovery": ("{uuid}", frozenset()),
+    "jobs": ("{job}", frozenset({"info", "options", "reset"})),
+    "mounts": ("{name}", frozenset({"options"})),
+    "network/interface": ("{interface}", frozenset()),
+    "network/interface/{interface}/vlan": ("{vlan}", frozenset()),
+    "resolution/check": ("{check}", frozenset()),
+    "resolution/issue": ("{issue}", frozenset()),
+    "resolution/suggestion": ("{suggestion}", frozenset()),
+    "store/addons": ("{addon}", frozenset()),
+    "store/repositories": ("{repository}", frozenset()),
+}
+# Segment following these in logs of any component names a resource
+_LOGS_PARAMETERS = {"boots": "{boot}", "identifiers": "{identifier}"}
+
+
+@lru_cache(maxsize=1024)
+def route_template(uri: str) -> str:
+    """Get route template of the uri of a request, like addons/{addon}/info."""
+    route: list[str] = []
+    for segment in uri.strip("/").split("/"):
+        if route and "logs" in route and route[-1] in _LOGS_PARAMETERS:
+            route.append(_LOGS_PARAMETERS[route[-1]])
+        elif (parameter := _PARAMETERS.get("/".join(route))) and (
+            segment not in parameter[1]
+        ):
+            route.append(parameter[0])
+        else:
+            route.append(segment)
+    return "/".join(route)
+
+
+@dataclass(slots=True)
+class RequestInfo:
+    """Measurements of a request, filled in as the request progresses.
+
+    Times are from time.monotonic. Fields which could not be measured, like
+    the body of a streamed response before it is read, are None.
+    """
+
+    method: HTTPMethod
+    route: str
+    uri: str
+    started: float
+    status: int | None = None
+    bytes_out: int | None = None
+    bytes_in: int | None = None
+    reused_connection: bool | None = None
+    queue_wait: float | None = None
+    connect: float | None = None
+    headers_received: float | None = None
+    body_received: float | None = None
+    decoded: float | None = None
+    ended: float | None = None
+    error: SupervisorError | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Get seconds from start to end of the request."""
+        return None if self.ended is None else self.ended - self.started
+
+    @property
+    def network(self) -> float | None:
+        """Get seconds waiting for Supervisor, until the body was received."""
+        received = self.body_received or self.headers_received
+        return None if received is None else received - self.started
+
+    @property
+    def decode(self) -> float | None:
+        """Get seconds spent decoding the body and its model once received."""
+        if self.body_received is None or self.decoded is None:
+            return None
+        return self.decoded - self.body_received
+
+
+_CURRENT_REQUEST: ContextVar[RequestInfo | None] = ContextVar(
+    "current_request", default=None
+)
+
+
+def current_request() -> RequestInfo | None:
+    """Get info of the last instrumented request started in the current task.
+
+    Responses are decoded into models right after their request, in the same
+    task, so this attributes work like decoding to the request it is for.
+    """
+    return _CURRENT_REQUEST.get()
+
+
+class LatencyHistogram:
+    """Histogram of latencies in buckets doubling in size from 1 ms."""
+
+    BOUNDS: tuple[float, ...] = tuple(0.001 * 2**i for i in range(17))
+
+    __slots__ = ("count", "counts", "sum")
+
+    def __init__(self) -> None:
+        """Initialize empty histogram."""
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add a latency to the histogram."""
+        self.counts[bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Get cumulative count of latencies up to each bound, the last is inf."""
+        result = []
+        total = 0
+        for bound, count in zip((*self.BOUNDS, float("inf")), self.counts, strict=True):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> float | None:
+        """Get upper bound of the bucket holding quantile q, None if empty."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.buckets():
+            if total >= rank:
+                return bound
+        return float("inf")
+
+
+class _CountingChunks:
+    """Chunk reader counting bytes of a streamed body as they are read."""
+
+    __slots__ = ("_info", "_instrumentation", "_stream")
+
+    def __init__(
+        self, stream: ChunkReader, info: RequestInfo, instrumentation: Instrumentation
+    ) -> None:
+        """Initialize with stream of the response to request of info."""
+        self._stream = stream
+        self._info = info
+        self._instrumentation = instrumentation
+
+    async def readchunk(self) -> tuple[bytes, bool]:
+        """Get next chunk and count it."""
+        chunk = await self._stream.readchunk()
+        if size := len(chunk[0]):
+            self._info.bytes_in = (self._info.bytes_in or 0) + size
+            self._instrumentation.received[(self._info.method, self._info.route)] += (
+                size
+            )
+        return chunk
+
+
+type RequestCallback = Callable[[RequestInfo], None]
+type RouteKey = tuple[HTTPMethod, str]
+
+
+class Instrumentation:
+    """Hooks, latency histograms and counters for requests made by a client.
+
+    Histograms are kept per method, route and status, None when no response
+    was received. Decode histograms hold the time spent decoding bodies and
+    their models per method and route, so it can be told apart from time
+    waiting for Supervisor. Bytes received include streamed bodies as they
+    are read.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_start: RequestCallback | None = None,
+        on_end: RequestCallback | None = None,
+    ) -> None:
+        """Initialize with callbacks for start and end of each request."""
+        self._on_start = on_start
+        self._on_end = on_end
+        self.histograms: dict[tuple[HTTPMethod, str, int | None], LatencyHistogram] = {}
+        self.decode_histograms: dict[RouteKey, LatencyHistogram] = {}
+        self.in_flight: defaultdict[RouteKey, int] = defaultdict(int)
+        self.received: defaultdict[RouteKey, int] = defaultdict(int)
+        self.sent: defaultdict[RouteKey, int] = defaultdict(int)
+        self.trace_config = TraceConfig()
+        self.trace_config.on_connection_queued_start.append(self._queued_start)
+        self.trace_config.on_connection_queued_end.append(self._queued_end)
+        self.trace_config.on_connection_create_start.append(self._create_start)
+        self.trace_config.on_connection_create_end.append(self._create_end)
+        self.trace_config.on_connection_reuseconn.append(self._reuseconn)
+        self.trace_config.on_request_chunk_sent.append(self._chunk_sent)
+
+    def create_session(self) -> ClientSession:
+        """Create session with the trace config of the instrumentation."""
+        return ClientSession(trace_configs=[self.trace_config])
+
+    def _notify(self, callback: RequestCallback | None, info: RequestInfo) -> None:
+        """Call callback, a failing callback does not fail the request."""
+        if callback:
+            try:
+                callback(info)
+            except Exception:
+                _LOGGER.exception("Error in request callback for %s", info.route)
+
+    def start(self, method: HTTPMethod, uri: str) -> RequestInfo:
+        """Start measuring a request."""
+        info = RequestInfo(method, route_template(uri), uri, time.monotonic())
+        _CURRENT_REQUEST.set(info)
+        self.in_flight[(method, info.route)] += 1
+        self._notify(self._on_start, info)
+        return info
+
+    def end(self, info: RequestInfo) -> None:
+        """End measuring a request and add it to the histogram of its route."""
+        info.ended = time.monotonic()
+        route = (info.method, info.route)
+        self.in_flight[route] -= 1
+        self.received[route] += info.bytes_in or 0
+        self.sent[route] += info.bytes_out or 0
+
+        key = (info.method, info.route, info.status)
+        if (histogram := self.histograms.get(key)) is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.observe(info.ended - info.started)
+        if (decode := info.decode) is not None:
+            if (histogram := self.decode_histograms.get(route)) is None:
+                histogram = self.decode_histograms[route] = LatencyHistogram()
+            histogram.observe(decode)
+        self._notify(self._on_end, info)
+
+    def stream(self, info: RequestInfo, stream: ChunkReader) -> ChunkReader:
+        """Get stream of a response counting bytes received as it is read."""
+        return _CountingChunks(stream, info, self)
+
+    @staticmethod
+    def _info(context: SimpleNamespace) -> RequestInfo | None:
+        """Get info of the request a trace event belongs to."""
+        info = context.trace_request_ctx
+        return info if isinstance(info, RequestInfo) else None
+
+    async def _queued_start(
+        self,
+        session: ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,
+        params: TraceConnectionQueuedStartParams,  # noqa: ARG002
+    ) -> None:
+        context.queued = time.monotonic()
+
+    async def _queued_end(
+        self,
+        session: ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,
+        params: TraceConnectionQueuedEndParams,  # noqa: ARG002
+    ) -> None:
+        if info := self._info(context):
+            info.queue_wait = time.monotonic() - context.queued
+
+    async def _create_start(
+        self,
+        session: ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,
+        params: TraceConnectionCreateStartParams,  # noqa: ARG002
+    ) -> None:
+        context.connecting = time.monotonic()
+
+    async def _create_end(
+        self,
+        session: ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,  # noqa: ARG002
+    ) -> None:
+        if info := self._info(context):
+            info.connect = time.monotonic() - context.connecting
+            info.reused_connection = False
+
+    async def _reuseconn(
+        self,
+        session: ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,  # noqa: ARG002
+    ) -> None:
+        if info := self._info(context):
+            info.reused_connection = True
+
+    async def _chunk_sent(
+        self,
+        session: ClientSession,  # noqa: ARG002
+        context: SimpleNamespace,
+        params: TraceRequestChunkSentParams,
+    ) -> None:
+        if info := self._info(context):
+            info.bytes_out = (info.bytes_out or 0) + len(params.chunk)
@@ -11,8 +11,8 @@ class JobsClient(_SupervisorComponentClient):
 
     async def info(self) -> JobsInfo:
         """Get Jobs info."""
-        result = await self._client.get("jobs/info")
-        return JobsInfo.from_dict(result.data)
+        result = await self._client.get("jobs/info", model=JobsInfo)
+        return result.data
 
     async def set_options(self, options: JobsOptions) -> None:
         """Set Jobs options."""
@@ -24,8 +24,8 @@ class JobsClient(_SupervisorComponentClient):
 
     async def get_job(self, job: UUID) -> Job:
         """Get details of a job."""
-        result = await self._client.get(f"jobs/{job.hex}")
-        return Job.from_dict(result.data)
+        result = await self._client.get(f"jobs/{job.hex}", model=Job)
+        return result.data
 
     async def delete_job(self, job: UUID) -> None:
         """Remove a done job from Supervisor's cache."""
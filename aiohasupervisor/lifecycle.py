@@ -0,0 +1,146 @@
+"""Dependency ordered start, stop and restart of many addons."""
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from enum import StrEnum
+from graphlib import TopologicalSorter
+
+from .addons import AddonsClient
+from .exceptions import SupervisorError
+from .models.addons import AddonStartup
+
+# --- ENUMS ----
+
+
+class LifecycleAction(StrEnum):
+    """LifecycleAction type."""
+
+    START = "start"
+    STOP = "stop"
+    RESTART = "restart"
+
+
+# Order in which Supervisor starts addons on boot
+_STARTUP_ORDER = (
+    AddonStartup.INITIALIZE,
+    AddonStartup.SYSTEM,
+    AddonStartup.SERVICES,
+    AddonStartup.APPLICATION,
+    AddonStartup.ONCE,
+)
+
+
+def startup_dependencies(
+    startups: Mapping[str, AddonStartup],
+) -> dict[str, set[str]]:
+    """Get dependencies of addons from their startup stage.
+
+    Each addon depends on the addons of the closest earlier stage, so stages
+    follow each other the way Supervisor starts addons on boot.
+    """
+    dependencies: dict[str, set[str]] = {}
+    previous: set[str] = set()
+    for stage in _STARTUP_ORDER:
+        current = {slug for slug, startup in startups.items() if startup == stage}
+        if not current:
+            continue
+        for slug in current:
+            dependencies[slug] = previous
+        previous = current
+    return dependencies
+
+
+async def _derive_dependencies(
+    client: AddonsClient, addons: list[str], concurrency: int
+) -> dict[str, set[str]]:
+    """Get dependencies of addons from their startup stage in Supervisor."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _startup(addon: str) -> AddonStartup:
+        async with semaphore:
+            return (await client.addon_info(addon)).startup
+
+    startups = await asyncio.gather(*(_startup(addon) for addon in addons))
+    return startup_dependencies(dict(zip(addons, startups, strict=True)))
+
+
+async def run_lifecycle(
+    client: AddonsClient,
+    action: LifecycleAction,
+    addons: Iterable[str],
+    *,
+    dependencies: Mapping[str, Iterable[str]] | None = None,
+    concurrency: int = 4,
+) -> dict[str, SupervisorError | None]:
+    """Start, stop or restart addons in dependency order.
+
+    Dependencies map an addon to the addons it needs running first. If none are
+    given they are derived from the startup stage of each addon. Start and
+    restart act on dependencies first, stop acts on dependents first. Addons
+    run concurrently, at most concurrency at a time, as soon as the addons they
+    wait for are done.
+
+    Returns a map of addon to None on success or to the error raised. Addons
+    waiting for one that failed are not acted on and are missing from it.
+    """
+    addons = list(dict.fromkeys(addons))
+    if dependencies is None:
+        dependencies = await _derive_dependencies(client, addons, concurrency)
+
+    # Graph maps each addon to the addons which must be done before it
+    graph: dict[str, set[str]] = {addon: set() for addon in addons}
+    for addon in addons:
+        for dependency in dependencies.get(addon, ()):
+            if dependency not in graph:
+                continue
+            if action == LifecycleAction.STOP:
+                graph[dependency].add(addon)
+            else:
+                graph[addon].add(dependency)
+    # Addons which are skipped if this one fails
+    after: dict[str, set[str]] = {addon: set() for addon in addons}
+    for addon, before in graph.items():
+        for other in before:
+            after[other].add(addon)
+
+    method = {
+        LifecycleAction.START: client.start_addon,
+        LifecycleAction.STOP: client.stop_addon,
+        LifecycleAction.RESTART: client.restart_addon,
+    }[action]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(addon: str) -> None:
+        async with semaphore:
+            await method(addon)
+
+    sorter = TopologicalSorter(graph)
+    sorter.prepare()
+    results: dict[str, SupervisorError | None] = {}
+    blocked: set[str] = set()
+    running: dict[asyncio.Task[None], str] = {}
+    try:
+        while sorter.is_active():
+            for addon in sorter.get_ready():
+                if addon in blocked:
+                    blocked.update(after[addon])
+                    sorter.done(addon)
+                else:
+                    running[asyncio.create_task(_run(addon))] = addon
+            if not running:
+                continue
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                addon = running.pop(task)
+                try:
+                    task.result()
+                except SupervisorError as err:
+                    results[addon] = err
+                    blocked.update(after[addon])
+                else:
+                    results[addon] = None
+                sorter.done(addon)
+    finally:
+        for task in running:
+            task.cancel()
+    return results
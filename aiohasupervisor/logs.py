@@ -0,0 +1,231 @@
+"""Helpers for working with logs from Supervisor."""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
+from contextlib import suppress
+from datetime import UTC, datetime
+import gzip
+from heapq import heappop, heappush
+from io import BufferedIOBase
+from itertools import count
+from pathlib import Path
+from queue import Full, Queue
+from time import monotonic
+from typing import Any
+
+from .models.base import LogCompression, LogEntry, LogExport
+
+# Verbose log lines start with a UTC timestamp like "2024-03-04 02:52:56.193"
+_TIMESTAMP_LENGTH = 23
+
+
+def parse_log_timestamp(line: str) -> datetime | None:
+    """Get timestamp from the start of a verbose log line."""
+    if len(line) < _TIMESTAMP_LENGTH or line[4] != "-":
+        return None
+    try:
+        timestamp = datetime.fromisoformat(line[:_TIMESTAMP_LENGTH])
+    except ValueError:
+        return None
+    return timestamp.replace(tzinfo=UTC)
+
+
+def strip_log_prefix(line: str) -> str:
+    """Get message of a verbose log line, without timestamp, host and identifier.
+
+    Lines continuing an entry have no prefix and are returned as they are.
+    """
+    if parse_log_timestamp(line) is None:
+        return line
+    _, _, rest = line[_TIMESTAMP_LENGTH + 1 :].partition(" ")
+    identifier, _, message = rest.partition(" ")
+    return message if identifier.endswith(":") else line
+
+
+async def merge_logs(
+    streams: Mapping[str, AsyncIterator[str]],
+    *,
+    reorder_window: float = 1.0,
+    buffer_size: int = 100,
+) -> AsyncIterator[LogEntry]:
+    """Merge log streams of several sources into one ordered by timestamp.
+
+    Streams should be requested with `LogsOptions(verbose=True)` so each line
+    starts with its timestamp. Lines without one keep their position within
+    their source. Each source has a buffer of at most buffer_size lines.
+
+    A line is yielded once every other source has a line waiting or once
+    reorder_window seconds passed since it was read, so a quiet source delays
+    the merged stream at most that long.
+    """
+    loop = asyncio.get_running_loop()
+    wakeup = asyncio.Event()
+    # Lines are queued with the time they were read from their source
+    queues: dict[str, asyncio.Queue[tuple[str, float]]] = {
+        source: asyncio.Queue(buffer_size) for source in streams
+    }
+
+    async def _read(source: str, stream: AsyncIterator[str]) -> None:
+        async for line in stream:
+            await queues[source].put((line, loop.time()))
+            wakeup.set()
+
+    readers = {
+        source: asyncio.create_task(_read(source, stream))
+        for source, stream in streams.items()
+    }
+    for task in readers.values():
+        task.add_done_callback(lambda _: wakeup.set())
+
+    # Heap holds at most one head line per source
+    heap: list[tuple[datetime, int, str, datetime | None, str, float]] = []
+    waiting = set(streams)
+    last_timestamp = dict.fromkeys(streams, datetime.min.replace(tzinfo=UTC))
+    sequence = count()
+
+    try:
+        while True:
+            wakeup.clear()
+            for source in list(waiting):
+                # Check done first so no line put just before finishing is lost
+                done = readers[source].done()
+                if not queues[source].empty():
+                    line, received = queues[source].get_nowait()
+                    timestamp = parse_log_timestamp(line)
+                    if timestamp:
+                        last_timestamp[source] = timestamp
+                    heappush(
+                        heap,
+                        (
+                            last_timestamp[source],
+                            next(sequence),
+                            source,
+                            timestamp,
+                            line,
+                            received,
+                        ),
+                    )
+                    waiting.discard(source)
+                elif done:
+                    if exc := readers[source].exception():
+                        raise exc
+                    waiting.discard(source)
+
+            if not heap:
+                if not waiting:
+                    return
+                await wakeup.wait()
+                continue
+
+            if waiting and (remaining := heap[0][5] + reorder_window - loop.time()) > 0:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), remaining)
+                continue
+
+            _, _, source, timestamp, line, _ = heappop(heap)
+            waiting.add(source)
+            yield LogEntry(source, timestamp, line)
+    finally:
+        for task in readers.values():
+            task.cancel()
+        await asyncio.gather(*readers.values(), return_exceptions=True)
+
+
+def _zstd_open() -> Any:
+    """Get open function of an available zstd implementation."""
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # noqa: PLC0415
+    except ImportError:
+        pass
+    else:
+        return zstd.open
+    try:
+        import zstandard  # type: ignore[import-not-found]  # noqa: PLC0415
+    except ImportError:
+        raise ValueError(
+            "zstd compression requires Python 3.14 or the zstandard package"
+        ) from None
+    return zstandard.open
+
+
+def _open_export(path: Path, compression: LogCompression | None) -> BufferedIOBase:
+    """Open export file for writing with compression."""
+    match compression:
+        case LogCompression.GZIP:
+            return gzip.open(path, "wb")
+        case LogCompression.ZSTD:
+            return _zstd_open()(path, "wb")
+        case _:
+            return path.open("wb")
+
+
+def _write_export(
+    path: Path, compression: LogCompression | None, chunks: Queue[bytes | None]
+) -> int:
+    """Write chunks from queue to file until None is received, return file size."""
+    try:
+        with _open_export(path, compression) as file:
+            while (chunk := chunks.get()) is not None:
+                file.write(chunk)
+    except BaseException:
+        # Keep draining so the event loop never blocks on a full queue
+        while chunks.get() is not None:
+            pass
+        raise
+    return path.stat().st_size
+
+
+async def export_logs(
+    source: AsyncIterable[str] | AsyncIterable[bytes],
+    path: Path | str,
+    compression: LogCompression | str | None = LogCompression.GZIP,
+    *,
+    chunk_size: int = 65536,
+    max_chunks: int = 16,
+) -> LogExport:
+    """Stream logs to a file, optionally compressed.
+
+    Source is a stream of log lines, as returned by the logs methods of
+    component clients, or of raw bytes. Writing and compression happen in a
+    worker thread fed by a queue of at most max_chunks chunks.
+    """
+    path = Path(path)
+    if compression is not None:
+        compression = LogCompression(compression)
+        if compression == LogCompression.ZSTD:
+            _zstd_open()
+
+    loop = asyncio.get_running_loop()
+    chunks: Queue[bytes | None] = Queue(max_chunks)
+    start = monotonic()
+    writer = loop.run_in_executor(None, _write_export, path, compression, chunks)
+
+    async def _put(chunk: bytes | None) -> None:
+        try:
+            chunks.put_nowait(chunk)
+        except Full:
+            await loop.run_in_executor(None, chunks.put, chunk)
+
+    bytes_read = 0
+    batch: list[bytes] = []
+    batch_size = 0
+    try:
+        async for item in source:
+            data = item.encode() + b"\n" if isinstance(item, str) else item
+            batch.append(data)
+            batch_size += len(data)
+            if batch_size >= chunk_size:
+                if writer.done():
+                    break
+                await _put(b"".join(batch))
+                bytes_read += batch_size
+                batch.clear()
+                batch_size = 0
+        if batch:
+            await _put(b"".join(batch))
+            bytes_read += batch_size
+    finally:
+        await _put(None)
+        bytes_written = await writer
+
+    return LogExport(path, bytes_read, bytes_written, monotonic() - start)
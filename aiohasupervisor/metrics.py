@@ -0,0 +1,244 @@
+"""Export client metrics in OpenMetrics text format.
+
+Metrics come from the Instrumentation passed to the client and from caches
+added to the exporter. Render them with render, for instance from the handler
+of an existing metrics endpoint, or start a server for them on a local port.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from aiohttp import web
+
+    from .instrumentation import Instrumentation, LatencyHistogram, RouteKey
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class CacheStats(Protocol):
+    """Cache counting lookups answered from it and those which were not."""
+
+    hits: int
+    misses: int
+
+
+def _escape(value: str) -> str:
+    """Escape label value."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(**labels: str) -> str:
+    """Format labels of a sample."""
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _number(value: float) -> str:
+    """Format value of a sample."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _hit_ratio(cache: CacheStats) -> float:
+    """Get share of lookups answered from cache, 0 without lookups."""
+    lookups = cache.hits + cache.misses
+    return cache.hits / lookups if lookups else 0.0
+
+
+def _family(
+    name: str, metric_type: str, help_text: str, samples: Iterable[str]
+) -> list[str]:
+    """Format metric family with its metadata."""
+    lines = [f"# TYPE {name} {metric_type}", f"# HELP {name} {help_text}"]
+    if name.endswith("_seconds"):
+        lines.insert(1, f"# UNIT {name} seconds")
+    elif name.endswith("_bytes"):
+        lines.insert(1, f"# UNIT {name} bytes")
+    lines.extend(samples)
+    return lines
+
+
+class MetricsExporter:
+    """Render metrics of a client in OpenMetrics text format."""
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        *,
+        caches: Mapping[str, CacheStats] | None = None,
+        namespace: str = "supervisor_client",
+    ) -> None:
+        """Initialize exporter for the instrumentation of a client."""
+        self._instrumentation = instrumentation
+        self._caches = dict(caches or {})
+        self._namespace = namespace
+        self._runner: web.AppRunner | None = None
+
+    def add_cache(self, name: str, cache: CacheStats) -> None:
+        """Add cache to export hits, misses and hit ratio of."""
+        self._caches[name] = cache
+
+    def _histograms(
+        self,
+        name: str,
+        help_text: str,
+        histograms: Iterable[tuple[str, LatencyHistogram]],
+    ) -> list[str]:
+        """Format latency histograms with their labels."""
+        name = f"{self._namespace}_{name}"
+        samples: list[str] = []
+        for labels, histogram in histograms:
+            samples.extend(
+                f'{name}_bucket{{{labels},le="{_number(bound)}"}} {count}'
+                for bound, count in histogram.buckets()
+            )
+            samples.append(f"{name}_count{{{labels}}} {histogram.count}")
+            samples.append(f"{name}_sum{{{labels}}} {_number(histogram.sum)}")
+        return _family(name, "histogram", help_text, samples)
+
+    def _requests(self) -> list[str]:
+        """Format latency histograms of requests."""
+        return self._histograms(
+            "request_duration_seconds",
+            "Duration of requests to Supervisor by route and status.",
+            (
+                (
+                    _labels(
+                        method=method.value,
+                        route=route,
+                        status="" if status is None else str(status),
+                    ),
+                    histogram,
+                )
+                for (method, route, status), histogram in sorted(
+                    self._instrumentation.histograms.items(),
+                    key=lambda item: (item[0][1], item[0][0], item[0][2] or 0),
+                )
+            ),
+        )
+
+    def _decodes(self) -> list[str]:
+        """Format histograms of time spent decoding responses."""
+        return self._histograms(
+            "response_decode_seconds",
+            "Time spent decoding responses and their models by route.",
+            (
+                (_labels(method=method.value, route=route), histogram)
+                for (method, route), histogram in sorted(
+                    self._instrumentation.decode_histograms.items(),
+                    key=lambda item: (item[0][1], item[0][0]),
+                )
+            ),
+        )
+
+    def _routes(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+        values: Mapping[RouteKey, int],
+    ) -> list[str]:
+        """Format a metric with a value per method and route."""
+        suffix = "_total" if metric_type == "counter" else ""
+        return _family(
+            f"{self._namespace}_{name}",
+            metric_type,
+            help_text,
+            (
+                f"{self._namespace}_{name}{suffix}"
+                f"{{{_labels(method=method.value, route=route)}}} {value}"
+                for (method, route), value in sorted(
+                    values.items(), key=lambda item: (item[0][1], item[0][0])
+                )
+            ),
+        )
+
+    def _cache_metrics(self) -> list[str]:
+        """Format hits, misses and hit ratio of caches."""
+        caches = sorted(self._caches.items())
+        lines: list[str] = []
+        for name, metric_type, help_text, value in (
+            ("cache_hits", "counter", "Lookups answered from cache.", "hits"),
+            ("cache_misses", "counter", "Lookups not answered from cache.", "misses"),
+        ):
+            lines.extend(
+                _family(
+                    f"{self._namespace}_{name}",
+                    metric_type,
+                    help_text,
+                    (
+                        f"{self._namespace}_{name}_total"
+                        f"{{{_labels(cache=cache_name)}}} {getattr(cache, value)}"
+                        for cache_name, cache in caches
+                    ),
+                )
+            )
+        lines.extend(
+            _family(
+                f"{self._namespace}_cache_hit_ratio",
+                "gauge",
+                "Share of lookups answered from cache.",
+                (
+                    f"{self._namespace}_cache_hit_ratio{{{_labels(cache=cache_name)}}}"
+                    f" {_number(_hit_ratio(cache))}"
+                    for cache_name, cache in caches
+                ),
+            )
+        )
+        return lines
+
+    def render(self) -> str:
+        """Render current metrics in OpenMetrics text format."""
+        instrumentation = self._instrumentation
+        lines = [
+            *self._requests(),
+            *self._decodes(),
+            *self._routes(
+                "requests_in_flight",
+                "gauge",
+                "Requests to Supervisor waiting for a response.",
+                instrumentation.in_flight,
+            ),
+            *self._routes(
+                "received_bytes",
+                "counter",
+                "Bytes received from Supervisor, including streamed bodies.",
+                instrumentation.received,
+            ),
+            *self._routes(
+                "sent_bytes",
+                "counter",
+                "Bytes sent to Supervisor, including uploads.",
+                instrumentation.sent,
+            ),
+        ]
+        if self._caches:
+            lines.extend(self._cache_metrics())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    async def _handle(self, request: web.Request) -> web.Response:  # noqa: ARG002
+        """Serve metrics."""
+        from aiohttp import web  # noqa: PLC0415
+
+        return web.Response(text=self.render(), headers={"Content-Type": CONTENT_TYPE})
+
+    async def start(self, host: str = "127.0.0.1", port: int = 9464) -> None:
+        """Serve metrics on /metrics at host and port."""
+        from aiohttp import web  # noqa: PLC0415
+
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+        self._runner = web.AppRunner(app, handle_signals=False)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+    async def stop(self) -> None:
+        """Stop serving metrics."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
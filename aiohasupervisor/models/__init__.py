@@ -1,164 +1,356 @@
-"""Models for supervisor client."""
+"""Models for supervisor client.
 
-from aiohasupervisor.models.addons import (
-    AddonBoot,
-    AddonBootConfig,
-    AddonsConfigValidate,
-    AddonsOptions,
-    AddonsRebuild,
-    AddonsSecurityOptions,
-    AddonsStats,
-    AddonStage,
-    AddonStartup,
-    AddonState,
-    AddonsUninstall,
-    AppArmor,
-    Capability,
-    CpuArch,
-    InstalledAddon,
-    InstalledAddonComplete,
-    Repository,
-    StoreAddon,
-    StoreAddonComplete,
-    StoreAddonInstall,
-    StoreAddonUpdate,
-    StoreAddRepository,
-    StoreInfo,
-    SupervisorRole,
-)
-from aiohasupervisor.models.backups import (
-    LOCATION_CLOUD_BACKUP,
-    LOCATION_LOCAL_STORAGE,
-    AddonSet,
-    Backup,
-    BackupAddon,
-    BackupComplete,
-    BackupContent,
-    BackupJob,
-    BackupLocationAttributes,
-    BackupsInfo,
-    BackupsOptions,
-    BackupType,
-    DownloadBackupOptions,
-    Folder,
-    FreezeOptions,
-    FullBackupOptions,
-    FullRestoreOptions,
-    NewBackup,
-    PartialBackupOptions,
-    PartialRestoreOptions,
-    RemoveBackupOptions,
-    UploadBackupOptions,
-)
-from aiohasupervisor.models.base import ResponseData
-from aiohasupervisor.models.discovery import (
-    Discovery,
-    DiscoveryConfig,
-)
-from aiohasupervisor.models.homeassistant import (
-    HomeAssistantInfo,
-    HomeAssistantOptions,
-    HomeAssistantRebuildOptions,
-    HomeAssistantRestartOptions,
-    HomeAssistantStats,
-    HomeAssistantStopOptions,
-    HomeAssistantUpdateOptions,
-)
-from aiohasupervisor.models.host import (
-    HostInfo,
-    HostOptions,
-    RebootOptions,
-    Service,
-    ServiceState,
-    ShutdownOptions,
-)
-from aiohasupervisor.models.ingress import CreateSessionOptions, IngressPanel
-from aiohasupervisor.models.jobs import (
-    Job,
-    JobCondition,
-    JobError,
-    JobsInfo,
-    JobsOptions,
-)
-from aiohasupervisor.models.mounts import (
-    CIFSMountRequest,
-    CIFSMountResponse,
-    MountCifsVersion,
-    MountsInfo,
-    MountsOptions,
-    MountState,
-    MountType,
-    MountUsage,
-    NFSMountRequest,
-    NFSMountResponse,
-)
-from aiohasupervisor.models.network import (
-    AccessPoint,
-    AuthMethod,
-    DockerNetwork,
-    InterfaceAddrGenMode,
-    InterfaceIp6Privacy,
-    InterfaceMethod,
-    InterfaceType,
-    IPv4,
-    IPv4Config,
-    IPv6,
-    IPv6Config,
-    MulticastDnsMode,
-    NetworkInfo,
-    NetworkInterface,
-    NetworkInterfaceConfig,
-    Vlan,
-    VlanConfig,
-    Wifi,
-    WifiConfig,
-    WifiMode,
-)
-from aiohasupervisor.models.os import (
-    BootSlot,
-    BootSlotName,
-    DataDisk,
-    GreenInfo,
-    GreenOptions,
-    MigrateDataOptions,
-    OSInfo,
-    OSUpdate,
-    RaspberryPiFirmwareInfo,
-    RaucState,
-    SetBootSlotOptions,
-    YellowInfo,
-    YellowOptions,
-)
-from aiohasupervisor.models.resolution import (
-    Check,
-    CheckOptions,
-    CheckType,
-    ContextType,
-    Issue,
-    IssueType,
-    ResolutionInfo,
-    Suggestion,
-    SuggestionType,
-    UnhealthyReason,
-    UnsupportedReason,
-)
-from aiohasupervisor.models.root import (
-    AvailableUpdate,
-    HostFeature,
-    LogLevel,
-    RootInfo,
-    SupervisorState,
-    UpdateChannel,
-    UpdateType,
-)
-from aiohasupervisor.models.supervisor import (
-    DetectBlockingIO,
-    FeatureFlag,
-    SupervisorInfo,
-    SupervisorOptions,
-    SupervisorStats,
-    SupervisorUpdateOptions,
-)
+Model modules are imported on first access of one of their models, so using
+a few models does not pay for defining all of them.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiohasupervisor.models.addons import (
+        AddonBoot,
+        AddonBootConfig,
+        AddonsConfigValidate,
+        AddonsOptions,
+        AddonsRebuild,
+        AddonsSecurityOptions,
+        AddonsStats,
+        AddonStage,
+        AddonStartup,
+        AddonState,
+        AddonsUninstall,
+        AppArmor,
+        Capability,
+        CpuArch,
+        InstalledAddon,
+        InstalledAddonComplete,
+        Repository,
+        StoreAddon,
+        StoreAddonComplete,
+        StoreAddonInstall,
+        StoreAddonJob,
+        StoreAddonUpdate,
+        StoreAddRepository,
+        StoreInfo,
+        SupervisorRole,
+    )
+    from aiohasupervisor.models.backups import (
+        LOCATION_CLOUD_BACKUP,
+        LOCATION_LOCAL_STORAGE,
+        AddonSet,
+        Backup,
+        BackupAddon,
+        BackupComplete,
+        BackupContent,
+        BackupJob,
+        BackupLocationAttributes,
+        BackupsInfo,
+        BackupsOptions,
+        BackupType,
+        DownloadBackupOptions,
+        Folder,
+        FreezeOptions,
+        FullBackupOptions,
+        FullRestoreOptions,
+        NewBackup,
+        PartialBackupOptions,
+        PartialRestoreOptions,
+        RemoveBackupOptions,
+        UploadBackupOptions,
+    )
+    from aiohasupervisor.models.base import (
+        LogCompression,
+        LogCursor,
+        LogEntry,
+        LogExport,
+        LogsOptions,
+        LogsPage,
+        ResponseData,
+    )
+    from aiohasupervisor.models.discovery import (
+        Discovery,
+        DiscoveryConfig,
+    )
+    from aiohasupervisor.models.homeassistant import (
+        HomeAssistantInfo,
+        HomeAssistantOptions,
+        HomeAssistantRebuildOptions,
+        HomeAssistantRestartOptions,
+        HomeAssistantStats,
+        HomeAssistantStopOptions,
+        HomeAssistantUpdateOptions,
+    )
+    from aiohasupervisor.models.host import (
+        HostInfo,
+        HostOptions,
+        RebootOptions,
+        Service,
+        ServiceState,
+        ShutdownOptions,
+    )
+    from aiohasupervisor.models.ingress import CreateSessionOptions, IngressPanel
+    from aiohasupervisor.models.jobs import (
+        Job,
+        JobCondition,
+        JobError,
+        JobsInfo,
+        JobsOptions,
+    )
+    from aiohasupervisor.models.mounts import (
+        CIFSMountRequest,
+        CIFSMountResponse,
+        MountCifsVersion,
+        MountsInfo,
+        MountsOptions,
+        MountState,
+        MountType,
+        MountUsage,
+        NFSMountRequest,
+        NFSMountResponse,
+    )
+    from aiohasupervisor.models.network import (
+        AccessPoint,
+        AuthMethod,
+        DockerNetwork,
+        InterfaceAddrGenMode,
+        InterfaceIp6Privacy,
+        InterfaceMethod,
+        InterfaceType,
+        IPv4,
+        IPv4Config,
+        IPv6,
+        IPv6Config,
+        MulticastDnsMode,
+        NetworkInfo,
+        NetworkInterface,
+        NetworkInterfaceConfig,
+        Vlan,
+        VlanConfig,
+        Wifi,
+        WifiConfig,
+        WifiMode,
+    )
+    from aiohasupervisor.models.os import (
+        BootSlot,
+        BootSlotName,
+        DataDisk,
+        GreenInfo,
+        GreenOptions,
+        MigrateDataOptions,
+        OSInfo,
+        OSUpdate,
+        RaspberryPiFirmwareInfo,
+        RaucState,
+        SetBootSlotOptions,
+        YellowInfo,
+        YellowOptions,
+    )
+    from aiohasupervisor.models.resolution import (
+        Check,
+        CheckOptions,
+        CheckType,
+        ContextType,
+        Issue,
+        IssueType,
+        ResolutionInfo,
+        Suggestion,
+        SuggestionType,
+        UnhealthyReason,
+        UnsupportedReason,
+    )
+    from aiohasupervisor.models.root import (
+        AvailableUpdate,
+        HostFeature,
+        LogLevel,
+        RootInfo,
+        SupervisorState,
+        UpdateChannel,
+        UpdateType,
+    )
+    from aiohasupervisor.models.supervisor import (
+        DetectBlockingIO,
+        FeatureFlag,
+        SupervisorInfo,
+        SupervisorOptions,
+        SupervisorStats,
+        SupervisorUpdateOptions,
+    )
+
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "addons": (
+        "AddonBoot",
+        "AddonBootConfig",
+        "AddonsConfigValidate",
+        "AddonsOptions",
+        "AddonsRebuild",
+        "AddonsSecurityOptions",
+        "AddonsStats",
+        "AddonStage",
+        "AddonStartup",
+        "AddonState",
+        "AddonsUninstall",
+        "AppArmor",
+        "Capability",
+        "CpuArch",
+        "InstalledAddon",
+        "InstalledAddonComplete",
+        "Repository",
+        "StoreAddon",
+        "StoreAddonComplete",
+        "StoreAddonInstall",
+        "StoreAddonJob",
+        "StoreAddonUpdate",
+        "StoreAddRepository",
+        "StoreInfo",
+        "SupervisorRole",
+    ),
+    "backups": (
+        "LOCATION_CLOUD_BACKUP",
+        "LOCATION_LOCAL_STORAGE",
+        "AddonSet",
+        "Backup",
+        "BackupAddon",
+        "BackupComplete",
+        "BackupContent",
+        "BackupJob",
+        "BackupLocationAttributes",
+        "BackupsInfo",
+        "BackupsOptions",
+        "BackupType",
+        "DownloadBackupOptions",
+        "Folder",
+        "FreezeOptions",
+        "FullBackupOptions",
+        "FullRestoreOptions",
+        "NewBackup",
+        "PartialBackupOptions",
+        "PartialRestoreOptions",
+        "RemoveBackupOptions",
+        "UploadBackupOptions",
+    ),
+    "base": (
+        "LogCompression",
+        "LogCursor",
+        "LogEntry",
+        "LogExport",
+        "LogsOptions",
+        "LogsPage",
+        "ResponseData",
+    ),
+    "discovery": (
+        "Discovery",
+        "DiscoveryConfig",
+    ),
+    "homeassistant": (
+        "HomeAssistantInfo",
+        "HomeAssistantOptions",
+        "HomeAssistantRebuildOptions",
+        "HomeAssistantRestartOptions",
+        "HomeAssistantStats",
+        "HomeAssistantStopOptions",
+        "HomeAssistantUpdateOptions",
+    ),
+    "host": (
+        "HostInfo",
+        "HostOptions",
+        "RebootOptions",
+        "Service",
+        "ServiceState",
+        "ShutdownOptions",
+    ),
+    "ingress": (
+        "CreateSessionOptions",
+        "IngressPanel",
+    ),
+    "jobs": (
+        "Job",
+        "JobCondition",
+        "JobError",
+        "JobsInfo",
+        "JobsOptions",
+    ),
+    "mounts": (
+        "CIFSMountRequest",
+        "CIFSMountResponse",
+        "MountCifsVersion",
+        "MountsInfo",
+        "MountsOptions",
+        "MountState",
+        "MountType",
+        "MountUsage",
+        "NFSMountRequest",
+        "NFSMountResponse",
+    ),
+    "network": (
+        "AccessPoint",
+        "AuthMethod",
+        "DockerNetwork",
+        "InterfaceAddrGenMode",
+        "InterfaceIp6Privacy",
+        "InterfaceMethod",
+        "InterfaceType",
+        "IPv4",
+        "IPv4Config",
+        "IPv6",
+        "IPv6Config",
+        "MulticastDnsMode",
+        "NetworkInfo",
+        "NetworkInterface",
+        "NetworkInterfaceConfig",
+        "Vlan",
+        "VlanConfig",
+        "Wifi",
+        "WifiConfig",
+        "WifiMode",
+    ),
+    "os": (
+        "BootSlot",
+        "BootSlotName",
+        "DataDisk",
+        "GreenInfo",
+        "GreenOptions",
+        "MigrateDataOptions",
+        "OSInfo",
+        "OSUpdate",
+        "RaspberryPiFirmwareInfo",
+        "RaucState",
+        "SetBootSlotOptions",
+        "YellowInfo",
+        "YellowOptions",
+    ),
+    "resolution": (
+        "Check",
+        "CheckOptions",
+        "CheckType",
+        "ContextType",
+        "Issue",
+        "IssueType",
+        "ResolutionInfo",
+        "Suggestion",
+        "SuggestionType",
+        "UnhealthyReason",
+        "UnsupportedReason",
+    ),
+    "root": (
+        "AvailableUpdate",
+        "HostFeature",
+        "LogLevel",
+        "RootInfo",
+        "SupervisorState",
+        "UpdateChannel",
+        "UpdateType",
+    ),
+    "supervisor": (
+        "DetectBlockingIO",
+        "FeatureFlag",
+        "SupervisorInfo",
+        "SupervisorOptions",
+        "SupervisorStats",
+        "SupervisorUpdateOptions",
+    ),
+}
+_MODULES = {name: module for module, names in _LAZY_IMPORTS.items() for name in names}
 
 __all__ = [
     "LOCATION_CLOUD_BACKUP",
@@ -240,7 +432,13 @@ __all__ = [
     "JobError",
     "JobsInfo",
     "JobsOptions",
+    "LogCompression",
+    "LogCursor",
+    "LogEntry",
+    "LogExport",
     "LogLevel",
+    "LogsOptions",
+    "LogsPage",
     "MigrateDataOptions",
     "MountCifsVersion",
     "MountState",
@@ -275,6 +473,7 @@ __all__ = [
     "StoreAddon",
     "StoreAddonComplete",
     "StoreAddonInstall",
+    "StoreAddonJob",
     "StoreAddonUpdate",
     "StoreInfo",
     "Suggestion",
@@ -298,3 +497,17 @@ __all__ = [
     "YellowInfo",
     "YellowOptions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import model from its module on first access."""
+    if (module := _MODULES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List models including those not imported yet."""
+    return sorted({*globals(), *__all__})
@@ -5,11 +5,19 @@ from dataclasses import dataclass, field
 from enum import StrEnum
 from ipaddress import IPv4Address
 from typing import Any
+from uuid import UUID
 
 from mashumaro import field_options
-from mashumaro.config import TO_DICT_ADD_BY_ALIAS_FLAG, BaseConfig
-
-from .base import DEFAULT, ContainerStats, Options, Request, RequestConfig, ResponseData
+from mashumaro.config import TO_DICT_ADD_BY_ALIAS_FLAG
+
+from .base import (
+    DEFAULT,
+    ContainerStats,
+    Options,
+    Request,
+    RequestConfig,
+    ResponseData,
+)
 
 # --- ENUMS ----
 
@@ -164,7 +172,7 @@ class AddonInfoStoreExtFields(ABC):
         metadata=field_options(alias="hassio_role"),
     )
 
-    class Config(BaseConfig):
+    class Config(ResponseData.Config):
         """Mashumaro config options."""
 
         code_generation_options = [TO_DICT_ADD_BY_ALIAS_FLAG]  # noqa: RUF012
@@ -359,6 +367,13 @@ class StoreAddonUpdate(Request):
     background: bool | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class StoreAddonJob(ResponseData):
+    """StoreAddonJob model."""
+
+    job_id: UUID | None = None
+
+
 @dataclass(frozen=True, slots=True)
 class StoreAddonInstall(Request):
     """StoreAddonInstall model."""
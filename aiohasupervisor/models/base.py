@@ -2,7 +2,9 @@
 
 from abc import ABC
 from dataclasses import dataclass
+from datetime import datetime
 from enum import StrEnum
+from pathlib import Path
 from typing import Any, Literal
 
 from mashumaro import DataClassDictMixin
@@ -29,10 +31,21 @@ class DEFAULT(metaclass=SentinelMeta):
     """Sentinel for default value when None is valid."""
 
 
+class ResponseConfig(BaseConfig):
+    """Default Mashumaro config for all response models.
+
+    Code to convert from and to dictionaries is compiled on first use rather
+    than when the model is defined to keep importing the models fast.
+    """
+
+    lazy_compilation = True
+
+
 class RequestConfig(BaseConfig):
     """Default Mashumaro config for all request models."""
 
     omit_default = True
+    lazy_compilation = True
 
 
 @dataclass(frozen=True)
@@ -68,6 +81,9 @@ class Options(ABC, DataClassDictMixin):
 class ResponseData(ABC, DataClassDictMixin):
     """Superclass for all response data objects."""
 
+    class Config(ResponseConfig):
+        """Mashumaro config."""
+
 
 class ResultType(StrEnum):
     """ResultType type."""
@@ -100,3 +116,69 @@ class ContainerStats(ResponseData):
     network_tx: int
     blk_read: int
     blk_write: int
+
+
+@dataclass(frozen=True, slots=True)
+class LogsOptions(Request):
+    """LogsOptions model.
+
+    Boot is either a boot ID or an offset relative to the current boot (0 is
+    the current boot, -1 the one before it, etc.).
+    """
+
+    follow: bool | None = None
+    boot: int | str | None = None
+    lines: int | None = None
+    verbose: bool | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LogCursor(DataClassDictMixin):
+    """LogCursor model.
+
+    Position in the journal to continue reading from. The defaults start at the
+    oldest entry, a negative skip without cursor starts that many entries before
+    the newest one. Can be persisted with `to_dict` to resume after a restart.
+    """
+
+    cursor: str = ""
+    skip: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class LogsPage:
+    """LogsPage model.
+
+    Entries are the lines received, an entry such as a traceback can span
+    several. Next cursor skips the entries received, whether the page is full
+    or not, so it resumes right after the last one.
+    """
+
+    entries: list[str]
+    next_cursor: LogCursor
+
+
+@dataclass(frozen=True, slots=True)
+class LogEntry:
+    """LogEntry model."""
+
+    source: str
+    timestamp: datetime | None
+    line: str
+
+
+class LogCompression(StrEnum):
+    """LogCompression type."""
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+@dataclass(frozen=True, slots=True)
+class LogExport:
+    """LogExport model."""
+
+    path: Path
+    bytes_read: int
+    bytes_written: int
+    duration: float
@@ -9,8 +9,8 @@ class MountsClient(_SupervisorComponentClient):
 
     async def info(self) -> MountsInfo:
         """Get mounts info."""
-        result = await self._client.get("mounts")
-        return MountsInfo.from_dict(result.data)
+        result = await self._client.get("mounts", model=MountsInfo)
+        return result.data
 
     async def options(self, options: MountsOptions) -> None:
         """Set mounts options."""
@@ -16,8 +16,8 @@ class NetworkClient(_SupervisorComponentClient):
 
     async def info(self) -> NetworkInfo:
         """Get network info."""
-        result = await self._client.get("network/info")
-        return NetworkInfo.from_dict(result.data)
+        result = await self._client.get("network/info", model=NetworkInfo)
+        return result.data
 
     async def reload(self) -> None:
         """Reload network info caches."""
@@ -25,8 +25,10 @@ class NetworkClient(_SupervisorComponentClient):
 
     async def interface_info(self, interface: str) -> NetworkInterface:
         """Get network interface info."""
-        result = await self._client.get(f"network/interface/{interface}/info")
-        return NetworkInterface.from_dict(result.data)
+        result = await self._client.get(
+            f"network/interface/{interface}/info", model=NetworkInterface
+        )
+        return result.data
 
     async def update_interface(
         self, interface: str, config: NetworkInterfaceConfig
@@ -38,8 +40,10 @@ class NetworkClient(_SupervisorComponentClient):
 
     async def access_points(self, interface: str) -> list[AccessPoint]:
         """Get access points visible to a wireless interface."""
-        result = await self._client.get(f"network/interface/{interface}/accesspoints")
-        return AccessPointList.from_dict(result.data).accesspoints
+        result = await self._client.get(
+            f"network/interface/{interface}/accesspoints", model=AccessPointList
+        )
+        return result.data.accesspoints
 
     async def save_vlan(
         self, interface: str, vlan: int, config: VlanConfig | None = None
@@ -0,0 +1,255 @@
+"""Local validation of addon options against the schema of the addon."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+import re
+from typing import Any
+from urllib.parse import urlparse
+
+from .models.addons import AddonsConfigValidate, AddonsOptions, InstalledAddonComplete
+from .models.base import DEFAULT
+from .utils.cache import LRUCache
+
+# Same limit as voluptuous uses for the offending value in messages
+_MAX_SUMMARY_LENGTH = 500
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_BOOLEAN_TRUE = {"1", "true", "yes", "on", "enable"}
+_BOOLEAN_FALSE = {"0", "false", "no", "off", "disable"}
+
+type _Check = Callable[[Any], Any]
+
+
+class _Invalid(Exception):  # noqa: N818
+    """Option value failed validation."""
+
+
+def _coerce(kind: type) -> _Check:
+    """Get check coercing value to kind."""
+
+    def check(value: Any) -> Any:
+        try:
+            return kind(value)
+        except (TypeError, ValueError):
+            raise _Invalid(f"expected {kind.__name__}") from None
+
+    return check
+
+
+def _boolean(value: Any) -> bool:
+    """Check value is a boolean the way voluptuous interprets one."""
+    if isinstance(value, str):
+        if value.lower() in _BOOLEAN_TRUE:
+            return True
+        if value.lower() in _BOOLEAN_FALSE:
+            return False
+        raise _Invalid("expected boolean")
+    return bool(value)
+
+
+def _email(value: Any) -> str:
+    """Check value is an email address."""
+    if not isinstance(value, str) or not _EMAIL.match(value):
+        raise _Invalid("expected an email address")
+    return value
+
+
+def _url(value: Any) -> str:
+    """Check value is a URL."""
+    parsed = urlparse(str(value))
+    if not parsed.scheme or not parsed.netloc:
+        raise _Invalid("expected a URL")
+    return str(value)
+
+
+def _range(
+    check: _Check, minimum: float | None, maximum: float | None, *, length: bool
+) -> _Check:
+    """Get check limiting value, or its length, to a range."""
+    if minimum is None and maximum is None:
+        return check
+    label = "length of value" if length else "value"
+
+    def check_range(value: Any) -> Any:
+        value = check(value)
+        measure = len(value) if length else value
+        if minimum is not None and measure < minimum:
+            raise _Invalid(f"{label} must be at least {float(minimum)}")
+        if maximum is not None and measure > maximum:
+            raise _Invalid(f"{label} must be at most {float(maximum)}")
+        return value
+
+    return check_range
+
+
+def _select(options: list[str]) -> _Check:
+    """Get check that value is one of options."""
+
+    def check(value: Any) -> str:
+        if str(value) not in options:
+            raise _Invalid(f"value must be one of {sorted(options)}")
+        return str(value)
+
+    return check
+
+
+@dataclass(frozen=True, slots=True)
+class _Option:
+    """Compiled schema element."""
+
+    required: bool
+    multiple: bool
+    check: _Check | dict[str, "_Option"]
+
+
+class OptionsValidator:
+    """Validator of addon options compiled from the schema of the addon.
+
+    Produces the same result as `addons.addon_config_validate` without a call
+    to Supervisor. Passwords are not checked against known breaches, so pwned
+    is always None. References to secrets are accepted as is.
+    """
+
+    def __init__(self, schema: list[dict[str, Any]], *, name: str, slug: str) -> None:
+        """Initialize validator for schema of addon."""
+        self._name = name
+        self._slug = slug
+        self._schema = self._compile(schema)
+
+    def _compile(self, schema: list[dict[str, Any]]) -> dict[str, _Option]:
+        """Compile schema elements into options."""
+        options: dict[str, _Option] = {}
+        for element in schema:
+            multiple = element.get("multiple", False)
+            if element["type"] == "schema":
+                # Supervisor always requires nested schemas, optional or not
+                options[element["name"]] = _Option(
+                    required=True,
+                    multiple=multiple,
+                    check=self._compile(element["schema"]),
+                )
+                continue
+            options[element["name"]] = _Option(
+                required=element.get("required", False),
+                multiple=multiple,
+                check=self._check(element),
+            )
+        return options
+
+    @staticmethod
+    def _check(element: dict[str, Any]) -> _Check:
+        """Get check for a single element."""
+        match element["type"], element.get("format"):
+            case "integer", _:
+                check = _range(
+                    _coerce(int),
+                    element.get("valueMin"),
+                    element.get("valueMax"),
+                    length=False,
+                )
+            case "float", _:
+                check = _range(
+                    _coerce(float),
+                    element.get("valueMin"),
+                    element.get("valueMax"),
+                    length=False,
+                )
+            case "boolean", _:
+                check = _boolean
+            case "select", _:
+                check = _select(element.get("options", []))
+            case "string", "email":
+                check = _email
+            case "string", "url":
+                check = _url
+            case _:
+                check = _range(
+                    _coerce(str),
+                    element.get("lengthMin"),
+                    element.get("lengthMax"),
+                    length=True,
+                )
+        return check
+
+    def _error(self, message: str) -> _Invalid:
+        """Get error with addon in message."""
+        return _Invalid(f"{message} in {self._name} ({self._slug})")
+
+    def _validate_dict(
+        self, schema: dict[str, _Option], struct: Any, path: str
+    ) -> dict[str, Any]:
+        """Validate a dictionary of options."""
+        if not isinstance(struct, dict):
+            raise self._error(f"Invalid dict for option '{path}'")
+        options: dict[str, Any] = {}
+        for key, value in struct.items():
+            # Supervisor drops unknown options with a warning
+            if (option := schema.get(key)) is None:
+                continue
+            if option.multiple:
+                if not isinstance(value, list):
+                    raise self._error(f"Invalid list for option '{key}'")
+                options[key] = [
+                    self._validate_value(option, item, key) for item in value
+                ]
+            else:
+                options[key] = self._validate_value(option, value, key)
+        for key, option in schema.items():
+            if option.required and key not in options:
+                raise self._error(f"Missing option '{key}' in {path}")
+        return options
+
+    def _validate_value(self, option: _Option, value: Any, key: str) -> Any:
+        """Validate value of an option."""
+        if isinstance(option.check, dict):
+            return self._validate_dict(option.check, value, key)
+        if value is None:
+            raise self._error(f"Missing required option '{key}'")
+        if isinstance(value, str) and value.startswith("!secret "):
+            return value
+        return option.check(value)
+
+    def validate(self, options: dict[str, Any]) -> AddonsConfigValidate:
+        """Validate options of addon."""
+        try:
+            self._validate_dict(self._schema, options, "root")
+        except _Invalid as err:
+            summary = repr(options)
+            if len(summary) > _MAX_SUMMARY_LENGTH:
+                summary = summary[: _MAX_SUMMARY_LENGTH - 3] + "..."
+            return AddonsConfigValidate(
+                message=f"{err}. Got {summary}", valid=False, pwned=None
+            )
+        return AddonsConfigValidate(message="", valid=True, pwned=None)
+
+
+_VALIDATORS: LRUCache[tuple[str, str | None], OptionsValidator] = LRUCache(64)
+
+
+def options_validator(addon: InstalledAddonComplete) -> OptionsValidator:
+    """Get options validator of addon, cached per slug and version."""
+    key = (addon.slug, addon.version)
+    if (validator := _VALIDATORS.get(key)) is None:
+        validator = OptionsValidator(
+            addon.schema or [], name=addon.name, slug=addon.slug
+        )
+        _VALIDATORS.set(key, validator)
+    return validator
+
+
+def options_changes(
+    addon: InstalledAddonComplete, options: AddonsOptions
+) -> AddonsOptions | None:
+    """Get the fields of options which differ from the current state of addon.
+
+    Returns None if nothing differs. Supervisor replaces the config of an addon
+    as a whole, so config is compared in depth but sent in full if it differs.
+    """
+    changes: dict[str, Any] = {}
+    for field in fields(options):
+        value = getattr(options, field.name)
+        if value is DEFAULT or (value is None and field.default is None):
+            continue
+        current = getattr(addon, "options" if field.name == "config" else field.name)
+        if value != current:
+            changes[field.name] = value
+    return AddonsOptions(**changes) if changes else None
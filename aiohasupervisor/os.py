@@ -23,8 +23,8 @@ class OSClient(_SupervisorComponentClient):
 
     async def info(self) -> OSInfo:
         """Get OS info."""
-        result = await self._client.get("os/info")
-        return OSInfo.from_dict(result.data)
+        result = await self._client.get("os/info", model=OSInfo)
+        return result.data
 
     async def update(self, options: OSUpdate | None = None) -> None:
         """Update OS."""
@@ -34,8 +34,8 @@ class OSClient(_SupervisorComponentClient):
 
     async def swap_info(self) -> SwapInfo:
         """Get swap settings."""
-        result = await self._client.get("os/config/swap")
-        return SwapInfo.from_dict(result.data)
+        result = await self._client.get("os/config/swap", model=SwapInfo)
+        return result.data
 
     async def set_swap_options(self, options: SwapOptions) -> None:
         """Set swap settings."""
@@ -51,8 +51,8 @@ class OSClient(_SupervisorComponentClient):
 
     async def list_data_disks(self) -> list[DataDisk]:
         """Get all data disks."""
-        result = await self._client.get("os/datadisk/list")
-        return DataDiskList.from_dict(result.data).disks
+        result = await self._client.get("os/datadisk/list", model=DataDiskList)
+        return result.data.disks
 
     async def wipe_data(self) -> None:
         """Trigger data disk wipe on host and reboot."""
@@ -64,8 +64,8 @@ class OSClient(_SupervisorComponentClient):
 
     async def green_info(self) -> GreenInfo:
         """Get info for green board (if in use)."""
-        result = await self._client.get("os/boards/green")
-        return GreenInfo.from_dict(result.data)
+        result = await self._client.get("os/boards/green", model=GreenInfo)
+        return result.data
 
     async def set_green_options(self, options: GreenOptions) -> None:
         """Set options for green board (if in use)."""
@@ -73,8 +73,8 @@ class OSClient(_SupervisorComponentClient):
 
     async def yellow_info(self) -> YellowInfo:
         """Get info for yellow board (if in use)."""
-        result = await self._client.get("os/boards/yellow")
-        return YellowInfo.from_dict(result.data)
+        result = await self._client.get("os/boards/yellow", model=YellowInfo)
+        return result.data
 
     async def set_yellow_options(self, options: YellowOptions) -> None:
         """Set options for yellow board (if in use)."""
@@ -82,8 +82,10 @@ class OSClient(_SupervisorComponentClient):
 
     async def raspberry_pi_firmware_info(self) -> RaspberryPiFirmwareInfo:
         """Get Raspberry Pi firmware state (if board supports it)."""
-        result = await self._client.get("os/boards/raspberrypi/firmware")
-        return RaspberryPiFirmwareInfo.from_dict(result.data)
+        result = await self._client.get(
+            "os/boards/raspberrypi/firmware", model=RaspberryPiFirmwareInfo
+        )
+        return result.data
 
     async def update_raspberry_pi_firmware(self) -> None:
         """Trigger Raspberry Pi firmware update."""
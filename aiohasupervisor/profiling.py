@@ -0,0 +1,164 @@
+"""Profiling of decoding responses into models.
+
+Decoding large responses blocks the event loop. While a DecodeProfiler is
+installed, every from_dict and from_json call of a model is timed, added to
+aggregates of that model and logged when it takes longer than the threshold.
+Route and payload size are logged for responses to requests made by a client
+with instrumentation, see current_request. Decodes offloaded to an executor
+do not block the event loop, they are counted and logged as off the loop.
+
+Installing replaces the methods on the model classes, so it affects all
+clients and should only be used while looking for a slow decode.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from importlib import import_module
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Self
+
+from mashumaro import DataClassDictMixin
+
+from .instrumentation import current_request
+from .models import _LAZY_IMPORTS
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+_LOGGER = logging.getLogger(__name__)
+
+_METHODS = ("from_dict", "from_json")
+
+
+@dataclass(slots=True)
+class DecodeStats:
+    """Aggregated decodes of a model."""
+
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+    slow: int = 0
+    offloaded: int = 0
+
+    @property
+    def mean(self) -> float:
+        """Get mean seconds per decode."""
+        return self.total / self.count if self.count else 0.0
+
+
+def _models() -> list[type[DataClassDictMixin]]:
+    """Get all models, importing model modules not imported yet."""
+    models: list[type[DataClassDictMixin]] = []
+    for name in _LAZY_IMPORTS:
+        module = import_module(f"{__package__}.models.{name}")
+        models.extend(
+            value
+            for value in vars(module).values()
+            if isinstance(value, type)
+            and issubclass(value, DataClassDictMixin)
+            and value.__module__ == module.__name__
+        )
+    return models
+
+
+class DecodeProfiler:
+    """Measure how long decoding responses into models blocks the event loop.
+
+    Stats are kept per model in models. Decodes on the event loop taking
+    threshold seconds or longer are logged as warnings with the route and
+    payload size, those off the event loop are only logged as info.
+    """
+
+    def __init__(self, *, threshold: float = 0.05) -> None:
+        """Initialize profiler logging decodes slower than threshold."""
+        self.threshold = threshold
+        self.models: dict[type, DecodeStats] = {}
+        self._originals: dict[tuple[type, str], classmethod[Any, ..., Any]] = {}
+        self._wrappers: dict[tuple[type, str], classmethod[Any, ..., Any]] = {}
+
+    def __enter__(self) -> Self:
+        """Install profiler."""
+        self.install()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Uninstall profiler."""
+        self.uninstall()
+
+    def install(self) -> None:
+        """Start timing decodes of all models."""
+        if self._wrappers:
+            return
+        for model in _models():
+            for name in _METHODS:
+                if name in model.__dict__:
+                    self._wrap(model, name)
+
+    def uninstall(self) -> None:
+        """Stop timing decodes and restore methods of models."""
+        for (model, name), wrapper in self._wrappers.items():
+            if model.__dict__.get(name) is wrapper:
+                setattr(model, name, self._originals[(model, name)])
+        self._originals.clear()
+        self._wrappers.clear()
+
+    def _wrap(self, model: type, name: str) -> None:
+        """Replace decode method of model with one timing it."""
+        key = (model, name)
+        self._originals[key] = model.__dict__[name]
+
+        def profiled(cls: type, data: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return self._originals[key].__func__(cls, data, **kwargs)
+            finally:
+                self._record(cls, time.perf_counter() - start, data)
+                # Lazy compilation replaces the method on first call
+                if (method := model.__dict__[name]) is not wrapper:
+                    self._originals[key] = method
+                    setattr(model, name, wrapper)
+
+        wrapper = self._wrappers[key] = classmethod(profiled)
+        setattr(model, name, wrapper)
+
+    def _record(self, model: type, seconds: float, data: Any) -> None:
+        """Add decode to stats of model and log it if slow."""
+        if (stats := self.models.get(model)) is None:
+            stats = self.models[model] = DecodeStats()
+        stats.count += 1
+        stats.total += seconds
+        stats.maximum = max(stats.maximum, seconds)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            on_loop = False
+            stats.offloaded += 1
+        else:
+            on_loop = True
+        if seconds < self.threshold:
+            return
+
+        stats.slow += 1
+        info = current_request()
+        if isinstance(data, str | bytes):
+            size: int | None = len(data)
+        else:
+            size = info.bytes_in if info else None
+        _LOGGER.log(
+            logging.WARNING if on_loop else logging.INFO,
+            "Decoding %s from %s %s (%s bytes) %s for %.3f s",
+            model.__name__,
+            info.method if info else "response to",
+            info.route if info else "unknown route",
+            "unknown" if size is None else size,
+            "blocked the event loop" if on_loop else "ran off the event loop",
+            seconds,
+        )
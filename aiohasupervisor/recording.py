@@ -0,0 +1,217 @@
+"""Record requests to Supervisor and replay them without Supervisor.
+
+A RecordingTransport wraps the transport the client uses and records each
+request with its response, including every chunk of streamed bodies and when
+it arrived. A ReplayTransport answers requests from such a recording, either
+as fast as possible or with the original timing.
+
+Recordings are saved as JSON lines, one exchange per line. Bodies are base64
+encoded and files ending in .gz are compressed.
+"""
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass, field
+import gzip
+from pathlib import Path
+import time
+from typing import IO, Any, Self
+
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+
+from .exceptions import SupervisorError
+from .models.base import ResponseConfig
+from .transport import (
+    ChunkReader,
+    LocalResponse,
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+
+
+@dataclass(slots=True)
+class Exchange(DataClassORJSONMixin):
+    """Request and its response as recorded.
+
+    Times are in seconds, start is from the start of the recording, latency
+    until headers were received and chunks from the start of the request.
+    """
+
+    start: float
+    method: str
+    path: str
+    status: int
+    headers: list[tuple[str, str]]
+    latency: float
+    json: dict[str, Any] | None = None
+    chunks: list[tuple[float, bytes]] = field(default_factory=list)
+
+    class Config(ResponseConfig):
+        """Mashumaro config."""
+
+
+class Recording:
+    """Exchanges recorded from a client in the order requests were made."""
+
+    def __init__(self, exchanges: list[Exchange] | None = None) -> None:
+        """Initialize recording."""
+        self.exchanges = exchanges or []
+
+    @staticmethod
+    def _open(path: Path, mode: str) -> IO[bytes]:
+        """Open file of a recording, compressed if it ends with .gz."""
+        if path.suffix == ".gz":
+            return gzip.open(path, f"{mode}b")  # type: ignore[return-value]
+        return path.open(f"{mode}b")
+
+    def save(self, path: Path) -> None:
+        """Save recording to file, this does blocking I/O."""
+        with self._open(path, "w") as file:
+            for exchange in self.exchanges:
+                file.write(exchange.to_jsonb() + b"\n")
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        """Load recording from file, this does blocking I/O."""
+        with cls._open(path, "r") as file:
+            return cls([Exchange.from_json(line) for line in file if line.strip()])
+
+
+class _RecordingChunks:
+    """Chunk reader recording chunks as they are read."""
+
+    __slots__ = ("_recorder", "_stream")
+
+    def __init__(self, stream: ChunkReader, recorder: "_RecordingResponse") -> None:
+        """Initialize with stream to record."""
+        self._stream = stream
+        self._recorder = recorder
+
+    async def readchunk(self) -> tuple[bytes, bool]:
+        """Get next chunk and record it."""
+        chunk = await self._stream.readchunk()
+        self._recorder.record(chunk[0])
+        return chunk
+
+
+class _RecordingResponse:
+    """Response recording its body as it is read."""
+
+    __slots__ = ("_body_recorded", "_exchange", "_response", "_started")
+
+    def __init__(
+        self, response: TransportResponse, exchange: Exchange, started: float
+    ) -> None:
+        """Initialize with response to record into exchange."""
+        self._response = response
+        self._exchange = exchange
+        self._started = started
+        self._body_recorded = False
+
+    def record(self, chunk: bytes) -> None:
+        """Record chunk of body."""
+        if chunk:
+            self._exchange.chunks.append((time.monotonic() - self._started, chunk))
+
+    @property
+    def status(self) -> int:
+        """HTTP status."""
+        return self._response.status
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Response headers."""
+        return self._response.headers
+
+    @property
+    def content(self) -> ChunkReader:
+        """Body as a stream of chunks."""
+        return _RecordingChunks(self._response.content, self)
+
+    async def read(self) -> bytes:
+        """Read whole body."""
+        body = await self._response.read()
+        if not self._body_recorded:
+            self._body_recorded = True
+            self.record(body)
+        return body
+
+    async def text(self) -> str:
+        """Read whole body as text."""
+        await self.read()
+        return await self._response.text()
+
+
+class RecordingTransport:
+    """Transport recording requests made with another transport."""
+
+    def __init__(
+        self, transport: Transport, recording: Recording | None = None
+    ) -> None:
+        """Initialize with transport making requests and recording to add to."""
+        self._transport = transport
+        self.recording = recording or Recording()
+        self._started = time.monotonic()
+
+    async def request(self, request: TransportRequest) -> TransportResponse:
+        """Perform request and record it."""
+        started = time.monotonic()
+        response = await self._transport.request(request)
+        exchange = Exchange(
+            start=started - self._started,
+            method=request.method.value,
+            path=request.url.path_qs,
+            status=response.status,
+            headers=list(response.headers.items()),
+            latency=time.monotonic() - started,
+            json=request.json,
+        )
+        self.recording.exchanges.append(exchange)
+        return _RecordingResponse(response, exchange, started)
+
+
+async def _replay_chunks(
+    chunks: list[tuple[float, bytes]], started: float, *, timing: bool
+) -> AsyncIterator[bytes]:
+    """Yield recorded chunks, at the time they were received if replaying timing."""
+    loop = asyncio.get_running_loop()
+    for offset, chunk in chunks:
+        if timing:
+            await asyncio.sleep(started + offset - loop.time())
+        yield chunk
+
+
+class ReplayTransport:
+    """Transport answering requests from a recording.
+
+    Requests are matched to exchanges by method and path, in the order they
+    were recorded. With timing, responses and chunks of their body arrive with
+    the delays they were recorded with.
+    """
+
+    def __init__(self, recording: Recording, *, timing: bool = False) -> None:
+        """Initialize with recording to replay."""
+        self._timing = timing
+        self._exchanges: defaultdict[tuple[str, str], deque[Exchange]] = defaultdict(
+            deque
+        )
+        for exchange in recording.exchanges:
+            self._exchanges[(exchange.method, exchange.path)].append(exchange)
+
+    async def request(self, request: TransportRequest) -> TransportResponse:
+        """Get next recorded response for request."""
+        key = (request.method.value, request.url.path_qs)
+        if not (exchanges := self._exchanges.get(key)):
+            raise SupervisorError(f"No recorded response for {key[0]} {key[1]}")
+        exchange = exchanges.popleft()
+
+        started = asyncio.get_running_loop().time()
+        if self._timing:
+            await asyncio.sleep(exchange.latency)
+        return LocalResponse(
+            _replay_chunks(exchange.chunks, started, timing=self._timing),
+            status=exchange.status,
+            headers=exchange.headers,
+        )
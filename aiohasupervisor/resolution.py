@@ -17,8 +17,8 @@ class ResolutionClient(_SupervisorComponentClient):
 
     async def info(self) -> ResolutionInfo:
         """Get resolution center info."""
-        result = await self._client.get("resolution/info")
-        return ResolutionInfo.from_dict(result.data)
+        result = await self._client.get("resolution/info", model=ResolutionInfo)
+        return result.data
 
     async def check_options(
         self, check: CheckType | str, options: CheckOptions
@@ -46,8 +46,10 @@ class ResolutionClient(_SupervisorComponentClient):
 
     async def suggestions_for_issue(self, issue: UUID) -> list[Suggestion]:
         """Get suggestions for issue."""
-        result = await self._client.get(f"resolution/issue/{issue.hex}/suggestions")
-        return SuggestionsList.from_dict(result.data).suggestions
+        result = await self._client.get(
+            f"resolution/issue/{issue.hex}/suggestions", model=SuggestionsList
+        )
+        return result.data.suggestions
 
     async def healthcheck(self) -> None:
         """Run a healthcheck."""
@@ -1,24 +1,32 @@
 """Main client for supervisor."""
 
-from typing import Self
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Self
 
 from aiohttp import ClientSession, ClientTimeout
 
-from .addons import AddonsClient
-from .backups import BackupsClient
 from .client import _SupervisorClient
-from .discovery import DiscoveryClient
-from .homeassistant import HomeAssistantClient
-from .host import HostClient
-from .ingress import IngressClient
-from .jobs import JobsClient
+from .const import OFFLOAD_DECODE_SIZE
 from .models.root import AvailableUpdate, AvailableUpdates, RootInfo
-from .mounts import MountsClient
-from .network import NetworkClient
-from .os import OSClient
-from .resolution import ResolutionClient
-from .store import StoreClient
-from .supervisor import SupervisorManagementClient
+
+if TYPE_CHECKING:
+    from .addons import AddonsClient
+    from .backups import BackupsClient
+    from .discovery import DiscoveryClient
+    from .homeassistant import HomeAssistantClient
+    from .host import HostClient
+    from .ingress import IngressClient
+    from .instrumentation import Instrumentation
+    from .jobs import JobsClient
+    from .mounts import MountsClient
+    from .network import NetworkClient
+    from .os import OSClient
+    from .resolution import ResolutionClient
+    from .store import StoreClient
+    from .supervisor import SupervisorManagementClient
+    from .transport import Transport
 
 
 class SupervisorClient:
@@ -29,92 +37,117 @@ class SupervisorClient:
         api_host: str,
         token: str,
         session: ClientSession | None = None,
+        *,
+        transport: Transport | None = None,
+        instrumentation: Instrumentation | None = None,
+        offload_decode_size: int | None = OFFLOAD_DECODE_SIZE,
     ) -> None:
-        """Initialize client."""
-        self._client = _SupervisorClient(api_host, token, session)
-        self._addons = AddonsClient(self._client)
-        self._os = OSClient(self._client)
-        self._backups = BackupsClient(self._client)
-        self._discovery = DiscoveryClient(self._client)
-        self._jobs = JobsClient(self._client)
-        self._mounts = MountsClient(self._client)
-        self._network = NetworkClient(self._client)
-        self._host = HostClient(self._client)
-        self._resolution = ResolutionClient(self._client)
-        self._store = StoreClient(self._client)
-        self._supervisor = SupervisorManagementClient(self._client)
-        self._homeassistant = HomeAssistantClient(self._client)
-        self._ingress = IngressClient(self._client)
-
-    @property
+        """Initialize client.
+
+        Requests are made with session unless a transport is given. An
+        instrumentation gets measurements of every request. JSON responses of
+        offload decode size bytes or more are decoded in an executor, None
+        decodes all of them in the event loop.
+        """
+        self._client = _SupervisorClient(
+            api_host, token, session, transport, instrumentation, offload_decode_size
+        )
+
+    @cached_property
     def addons(self) -> AddonsClient:
         """Get addons component client."""
-        return self._addons
+        from .addons import AddonsClient  # noqa: PLC0415
 
-    @property
+        return AddonsClient(self._client)
+
+    @cached_property
     def homeassistant(self) -> HomeAssistantClient:
         """Get Home Assistant component client."""
-        return self._homeassistant
+        from .homeassistant import HomeAssistantClient  # noqa: PLC0415
+
+        return HomeAssistantClient(self._client)
 
-    @property
+    @cached_property
     def os(self) -> OSClient:
         """Get OS component client."""
-        return self._os
+        from .os import OSClient  # noqa: PLC0415
 
-    @property
+        return OSClient(self._client)
+
+    @cached_property
     def backups(self) -> BackupsClient:
         """Get backups component client."""
-        return self._backups
+        from .backups import BackupsClient  # noqa: PLC0415
+
+        return BackupsClient(self._client)
 
-    @property
+    @cached_property
     def discovery(self) -> DiscoveryClient:
         """Get discovery component client."""
-        return self._discovery
+        from .discovery import DiscoveryClient  # noqa: PLC0415
 
-    @property
+        return DiscoveryClient(self._client)
+
+    @cached_property
     def jobs(self) -> JobsClient:
         """Get jobs component client."""
-        return self._jobs
+        from .jobs import JobsClient  # noqa: PLC0415
+
+        return JobsClient(self._client)
 
-    @property
+    @cached_property
     def mounts(self) -> MountsClient:
         """Get mounts component client."""
-        return self._mounts
+        from .mounts import MountsClient  # noqa: PLC0415
+
+        return MountsClient(self._client)
 
-    @property
+    @cached_property
     def network(self) -> NetworkClient:
         """Get network component client."""
-        return self._network
+        from .network import NetworkClient  # noqa: PLC0415
 
-    @property
+        return NetworkClient(self._client)
+
+    @cached_property
     def host(self) -> HostClient:
         """Get host component client."""
-        return self._host
+        from .host import HostClient  # noqa: PLC0415
+
+        return HostClient(self._client)
 
-    @property
+    @cached_property
     def resolution(self) -> ResolutionClient:
         """Get resolution center component client."""
-        return self._resolution
+        from .resolution import ResolutionClient  # noqa: PLC0415
 
-    @property
+        return ResolutionClient(self._client)
+
+    @cached_property
     def store(self) -> StoreClient:
         """Get store component client."""
-        return self._store
+        from .store import StoreClient  # noqa: PLC0415
+
+        return StoreClient(self._client)
 
-    @property
+    @cached_property
     def supervisor(self) -> SupervisorManagementClient:
         """Get supervisor component client."""
-        return self._supervisor
+        from .supervisor import SupervisorManagementClient  # noqa: PLC0415
 
-    @property
+        return SupervisorManagementClient(self._client)
+
+    @cached_property
     def ingress(self) -> IngressClient:
         """Get ingress component client."""
-        return self._ingress
+        from .ingress import IngressClient  # noqa: PLC0415
+
+        return IngressClient(self._client)
 
     async def info(self) -> RootInfo:
         """Get root info."""
-        result = await self._client.get("info")
-        return RootInfo.from_dict(result.data)
+        result = await self._client.get("info", model=RootInfo)
+        return result.data
 
     async def reload_updates(self) -> None:
         """Reload updates.
@@ -133,8 +166,8 @@ class SupervisorClient:
 
     async def available_updates(self) -> list[AvailableUpdate]:
         """Get available updates."""
-        result = await self._client.get("available_updates")
-        return AvailableUpdates.from_dict(result.data).available_updates
+        result = await self._client.get("available_updates", model=AvailableUpdates)
+        return result.data.available_updates
 
     async def close(self) -> None:
         """Close open client session."""
@@ -0,0 +1,222 @@
+"""Rolling history and queries over container stats samples."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from enum import StrEnum
+import heapq
+from math import fsum, isnan, nan
+from time import monotonic
+
+from .models.base import ContainerStats
+
+# --- ENUMS ----
+
+
+class StatsMetric(StrEnum):
+    """StatsMetric type.
+
+    Rate metrics are derived from the cumulative counters of two consecutive
+    samples and are expressed in bytes per second.
+    """
+
+    CPU_PERCENT = "cpu_percent"
+    MEMORY_USAGE = "memory_usage"
+    MEMORY_PERCENT = "memory_percent"
+    NETWORK_RX_RATE = "network_rx_rate"
+    NETWORK_TX_RATE = "network_tx_rate"
+    BLK_READ_RATE = "blk_read_rate"
+    BLK_WRITE_RATE = "blk_write_rate"
+
+
+_GAUGES: dict[StatsMetric, str] = {
+    StatsMetric.CPU_PERCENT: "cpu_percent",
+    StatsMetric.MEMORY_USAGE: "memory_usage",
+    StatsMetric.MEMORY_PERCENT: "memory_percent",
+}
+_RATES: dict[StatsMetric, str] = {
+    StatsMetric.NETWORK_RX_RATE: "network_rx",
+    StatsMetric.NETWORK_TX_RATE: "network_tx",
+    StatsMetric.BLK_READ_RATE: "blk_read",
+    StatsMetric.BLK_WRITE_RATE: "blk_write",
+}
+
+
+def _percentile(values: Iterable[float], percentile: float) -> float:
+    """Get percentile of values using linear interpolation between ranks."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percentile / 100
+    low = int(rank)
+    if low + 1 >= len(ordered):
+        return ordered[-1]
+    return ordered[low] + (ordered[low + 1] - ordered[low]) * (rank - low)
+
+
+class _Series:
+    """Column oriented samples of a single container.
+
+    Every metric is kept in its own contiguous array of doubles so window
+    queries work on slices rather than on per-sample objects.
+    """
+
+    __slots__ = ("columns", "counters", "timestamps")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.timestamps = array("d")
+        self.columns = {metric: array("d") for metric in StatsMetric}
+        self.counters = dict.fromkeys(_RATES.values(), 0)
+
+    def append(self, timestamp: float, stats: ContainerStats) -> None:
+        """Append a sample, deriving rates from the previous one."""
+        elapsed = timestamp - self.timestamps[-1] if self.timestamps else 0.0
+        for metric, attr in _GAUGES.items():
+            self.columns[metric].append(getattr(stats, attr))
+        for metric, counter in _RATES.items():
+            value = getattr(stats, counter)
+            if elapsed <= 0:
+                rate = nan
+            else:
+                # Counters restart from zero when the container restarts
+                delta = value - self.counters[counter]
+                rate = (delta if delta >= 0 else value) / elapsed
+            self.columns[metric].append(rate)
+            self.counters[counter] = value
+        self.timestamps.append(timestamp)
+
+    def evict(self, cutoff: float, max_samples: int) -> None:
+        """Drop samples older than cutoff or beyond the sample limit."""
+        count = max(
+            bisect_left(self.timestamps, cutoff), len(self.timestamps) - max_samples
+        )
+        if count > 0:
+            del self.timestamps[:count]
+            for column in self.columns.values():
+                del column[:count]
+
+    def window(self, metric: StatsMetric, start: float, end: float) -> array:
+        """Get slice of a metric column for samples between start and end."""
+        column = self.columns[metric]
+        low = bisect_left(self.timestamps, start)
+        high = bisect_right(self.timestamps, end)
+        # Only a sample without predecessor has no rate
+        while low < high and isnan(column[low]):
+            low += 1
+        return column[low:high]
+
+
+class StatsHistory:
+    """Rolling stats history for many containers.
+
+    Samples are typically collected from the `stats` methods of component
+    clients (e.g. `addons.addon_stats`) and keyed by a name of the caller's
+    choosing such as the addon slug.
+    """
+
+    def __init__(self, max_age: float = 3600.0, max_samples: int = 3600) -> None:
+        """Initialize history keeping at most max_age seconds per container."""
+        self._max_age = max_age
+        self._max_samples = max_samples
+        self._series: dict[str, _Series] = {}
+        self._latest = 0.0
+
+    @property
+    def containers(self) -> list[str]:
+        """Get names of containers with samples."""
+        return list(self._series)
+
+    def add(
+        self, container: str, stats: ContainerStats, timestamp: float | None = None
+    ) -> None:
+        """Add a stats sample, timestamp defaults to monotonic clock.
+
+        Timestamps of a container must increase, no rate can be derived from
+        two samples taken at the same time.
+        """
+        if timestamp is None:
+            timestamp = monotonic()
+        if (series := self._series.get(container)) is None:
+            series = self._series[container] = _Series()
+        elif series.timestamps and timestamp <= series.timestamps[-1]:
+            raise ValueError(
+                "Samples must be added in chronological order, without repeats"
+            )
+        series.append(timestamp, stats)
+        series.evict(timestamp - self._max_age, self._max_samples)
+        self._latest = max(self._latest, timestamp)
+
+    def remove(self, container: str) -> None:
+        """Remove all samples of a container."""
+        self._series.pop(container, None)
+
+    def _values(
+        self, container: str, metric: StatsMetric, window: float, now: float | None
+    ) -> array:
+        """Get values of metric for container within window."""
+        if (series := self._series.get(container)) is None:
+            return array("d")
+        end = self._latest if now is None else now
+        return series.window(metric, end - window, end)
+
+    def mean(
+        self,
+        container: str,
+        metric: StatsMetric,
+        window: float,
+        *,
+        now: float | None = None,
+    ) -> float | None:
+        """Get mean of metric over the last window seconds."""
+        if not (values := self._values(container, metric, window, now)):
+            return None
+        return fsum(values) / len(values)
+
+    def percentile(
+        self,
+        container: str,
+        metric: StatsMetric,
+        window: float,
+        percentile: float = 95.0,
+        *,
+        now: float | None = None,
+    ) -> float | None:
+        """Get percentile of metric over the last window seconds."""
+        if not (values := self._values(container, metric, window, now)):
+            return None
+        return _percentile(values, percentile)
+
+    def maximum(
+        self,
+        container: str,
+        metric: StatsMetric,
+        window: float,
+        *,
+        now: float | None = None,
+    ) -> float | None:
+        """Get maximum of metric over the last window seconds."""
+        if not (values := self._values(container, metric, window, now)):
+            return None
+        return max(values)
+
+    def top(
+        self,
+        metric: StatsMetric,
+        n: int,
+        window: float,
+        *,
+        percentile: float | None = None,
+        now: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Get the n containers consuming the most of metric within window.
+
+        Containers are ranked by the mean of metric unless a percentile is given.
+        """
+        scores: list[tuple[float, str]] = []
+        for container in self._series:
+            if percentile is None:
+                score = self.mean(container, metric, window, now=now)
+            else:
+                score = self.percentile(container, metric, window, percentile, now=now)
+            if score is not None:
+                scores.append((score, container))
+        return [(container, score) for score, container in heapq.nlargest(n, scores)]
@@ -1,38 +1,76 @@
 """Store client for supervisor."""
 
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import replace
+from hashlib import sha256
 from typing import Any
+from uuid import UUID
 
-from .client import _SupervisorComponentClient
+from .client import _SupervisorClient, _SupervisorComponentClient
 from .const import ResponseType
+from .exceptions import (
+    AddonNotSupportedError,
+    SupervisorBadRequestError,
+    SupervisorError,
+)
 from .models.addons import (
     Repository,
     StoreAddon,
     StoreAddonComplete,
     StoreAddonInstall,
+    StoreAddonJob,
     StoreAddonsList,
     StoreAddonUpdate,
     StoreAddRepository,
     StoreInfo,
 )
+from .models.root import RootInfo
+
+type _AvailabilityKey = tuple[str | None, str, str | None, str | None]
 
 
 class StoreClient(_SupervisorComponentClient):
     """Handles store access in Supervisor."""
 
+    def __init__(self, client: _SupervisorClient) -> None:
+        """Initialize store client."""
+        super().__init__(client)
+        self._availability: dict[
+            str, tuple[_AvailabilityKey, type[SupervisorError] | None]
+        ] = {}
+
     async def info(self) -> StoreInfo:
         """Get store info."""
-        result = await self._client.get("store")
-        return StoreInfo.from_dict(result.data)
+        result = await self._client.get("store", model=StoreInfo)
+        return result.data
+
+    async def info_if_changed(
+        self, digest: str | None = None
+    ) -> tuple[str, StoreInfo | None]:
+        """Get store info unless it is unchanged.
+
+        Returns the SHA-256 digest of the store payload along with store info.
+        If the digest matches the one provided the payload is not decoded and
+        None is returned instead of store info.
+        """
+        result = await self._client.get("store", response_type=ResponseType.RAW_JSON)
+        new_digest = sha256(result.data).hexdigest()
+        if new_digest == digest:
+            return new_digest, None
+        return new_digest, (await self._client.decode(result.data, StoreInfo)).data
 
     async def addons_list(self) -> list[StoreAddon]:
         """Get list of store addons."""
-        result = await self._client.get("store/addons")
-        return StoreAddonsList.from_dict(result.data).addons
+        result = await self._client.get("store/addons", model=StoreAddonsList)
+        return result.data.addons
 
     async def addon_info(self, addon: str) -> StoreAddonComplete:
         """Get store addon info."""
-        result = await self._client.get(f"store/addons/{addon}")
-        return StoreAddonComplete.from_dict(result.data)
+        result = await self._client.get(
+            f"store/addons/{addon}", model=StoreAddonComplete
+        )
+        return result.data
 
     async def addon_changelog(self, addon: str) -> str:
         """Get addon changelog."""
@@ -64,6 +102,63 @@ class StoreClient(_SupervisorComponentClient):
             f"store/addons/{addon}/availability", response_type=ResponseType.NONE
         )
 
+    async def availability_many(
+        self, addons: Iterable[str | StoreAddon], *, concurrency: int = 8
+    ) -> dict[str, type[SupervisorError] | None]:
+        """Determine which addons can be installed on this system.
+
+        Returns a map of addon slug to None if its latest version can be
+        installed, otherwise to the error class `addon_availability` raises.
+        Errors checking one addon, like an unknown slug or a timeout, are
+        returned as well. Only results of the check itself are cached, until
+        the latest version of the addon or the architecture, machine or Home
+        Assistant version of the system change.
+
+        Addons are slugs or store addons, for instance from a StoreCatalog.
+        Latest versions of addons given by slug are looked up in the list of
+        store addons, which is only fetched when there are any.
+        """
+        versions: dict[str, str] = {}
+        slugs: list[str] = []
+        for addon in addons:
+            if isinstance(addon, StoreAddon):
+                versions[addon.slug] = addon.version_latest
+                slugs.append(addon.slug)
+            else:
+                slugs.append(addon)
+        slugs = list(dict.fromkeys(slugs))
+
+        if all(slug in versions for slug in slugs):
+            info_result = await self._client.get("info", model=RootInfo)
+        else:
+            info_result, addons_result = await asyncio.gather(
+                self._client.get("info", model=RootInfo),
+                self._client.get("store/addons", model=StoreAddonsList),
+            )
+            versions = {
+                addon.slug: addon.version_latest for addon in addons_result.data.addons
+            } | versions
+        info: RootInfo = info_result.data
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _check(addon: str) -> type[SupervisorError] | None:
+            key = (versions.get(addon), info.arch, info.machine, info.homeassistant)
+            if (cached := self._availability.get(addon)) and cached[0] == key:
+                return cached[1]
+            result: type[SupervisorError] | None = None
+            async with semaphore:
+                try:
+                    await self.addon_availability(addon)
+                except (AddonNotSupportedError, SupervisorBadRequestError) as err:
+                    result = type(err)
+                except SupervisorError as err:
+                    return type(err)
+            self._availability[addon] = (key, result)
+            return result
+
+        results = await asyncio.gather(*(_check(addon) for addon in slugs))
+        return dict(zip(slugs, results, strict=True))
+
     async def install_addon(
         self, addon: str, options: StoreAddonInstall | None = None
     ) -> None:
@@ -104,6 +199,22 @@ class StoreClient(_SupervisorComponentClient):
             **kwargs,
         )
 
+    async def update_addon_job(
+        self, addon: str, options: StoreAddonUpdate | None = None
+    ) -> UUID | None:
+        """Start updating an addon in the background.
+
+        Returns the ID of the job to follow with `jobs.get_job`, or None if the
+        update already completed before Supervisor responded.
+        """
+        options = replace(options or StoreAddonUpdate(), background=True)
+        result = await self._client.post(
+            f"store/addons/{addon}/update",
+            json=options.to_dict(),
+            response_type=ResponseType.JSON,
+        )
+        return StoreAddonJob.from_dict(result.data or {}).job_id
+
     async def reload(self) -> None:
         """Reload the store."""
         await self._client.post("store/reload")
@@ -118,8 +229,10 @@ class StoreClient(_SupervisorComponentClient):
 
     async def repository_info(self, repository: str) -> Repository:
         """Get repository info."""
-        result = await self._client.get(f"store/repositories/{repository}")
-        return Repository.from_dict(result.data)
+        result = await self._client.get(
+            f"store/repositories/{repository}", model=Repository
+        )
+        return result.data
 
     async def add_repository(self, options: StoreAddRepository) -> None:
         """Add a repository to the store."""
@@ -133,4 +246,30 @@ class StoreClient(_SupervisorComponentClient):
         """Repair/reset an addon repository in the store."""
         await self._client.post(f"store/repositories/{repository}/repair")
 
-    # Omitted for now - Icon/Logo endpoints
+    async def addon_icon(self, addon: str) -> bytes:
+        """Get addon icon (only if addon has one)."""
+        result = await self._client.get(
+            f"store/addons/{addon}/icon", response_type=ResponseType.BYTES
+        )
+        return result.data
+
+    async def addon_icon_stream(self, addon: str) -> AsyncIterator[bytes]:
+        """Get addon icon as a stream (only if addon has one)."""
+        result = await self._client.get(
+            f"store/addons/{addon}/icon", response_type=ResponseType.STREAM
+        )
+        return result.data
+
+    async def addon_logo(self, addon: str) -> bytes:
+        """Get addon logo (only if addon has one)."""
+        result = await self._client.get(
+            f"store/addons/{addon}/logo", response_type=ResponseType.BYTES
+        )
+        return result.data
+
+    async def addon_logo_stream(self, addon: str) -> AsyncIterator[bytes]:
+        """Get addon logo as a stream (only if addon has one)."""
+        result = await self._client.get(
+            f"store/addons/{addon}/logo", response_type=ResponseType.STREAM
+        )
+        return result.data
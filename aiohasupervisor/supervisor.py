@@ -1,9 +1,12 @@
 """Supervisor client for supervisor."""
 
+from collections.abc import AsyncIterator
+
 from aiohttp import ClientTimeout
 
 from .client import _SupervisorComponentClient
 from .const import ResponseType
+from .models.base import LogsOptions
 from .models.supervisor import (
     SupervisorInfo,
     SupervisorOptions,
@@ -25,13 +28,13 @@ class SupervisorManagementClient(_SupervisorComponentClient):
 
     async def info(self) -> SupervisorInfo:
         """Get supervisor info."""
-        result = await self._client.get("supervisor/info")
-        return SupervisorInfo.from_dict(result.data)
+        result = await self._client.get("supervisor/info", model=SupervisorInfo)
+        return result.data
 
     async def stats(self) -> SupervisorStats:
         """Get supervisor stats."""
-        result = await self._client.get("supervisor/stats")
-        return SupervisorStats.from_dict(result.data)
+        result = await self._client.get("supervisor/stats", model=SupervisorStats)
+        return result.data
 
     async def update(self, options: SupervisorUpdateOptions | None = None) -> None:
         """Update supervisor.
@@ -61,3 +64,7 @@ class SupervisorManagementClient(_SupervisorComponentClient):
     async def repair(self) -> None:
         """Repair local supervisor and docker setup."""
         await self._client.post("supervisor/repair")
+
+    async def logs(self, options: LogsOptions | None = None) -> AsyncIterator[str]:
+        """Get supervisor logs as a stream of lines."""
+        return await self._get_logs("supervisor/logs", options)
@@ -0,0 +1,177 @@
+"""Transports performing requests to Supervisor for the client."""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from http import HTTPMethod, HTTPStatus
+from typing import Any, Protocol, Self
+
+from aiohttp import ClientResponse, ClientSession, ClientTimeout
+from multidict import CIMultiDict, CIMultiDictProxy, MultiDict
+import orjson
+from yarl import URL
+
+from .instrumentation import RequestInfo
+
+
+@dataclass(slots=True, frozen=True)
+class TransportRequest:
+    """Request to Supervisor as prepared by the client."""
+
+    method: HTTPMethod
+    url: URL
+    headers: dict[str, str]
+    params: dict[str, str] | MultiDict[str] | None = None
+    json: dict[str, Any] | None = None
+    data: Any = None
+    timeout: ClientTimeout | None = None
+    info: RequestInfo | None = None
+
+
+class ChunkReader(Protocol):
+    """Body of a response read in chunks as they arrive."""
+
+    async def readchunk(self) -> tuple[bytes, bool]:
+        """Get next chunk, (b"", False) at the end of the body."""
+
+
+class TransportResponse(Protocol):
+    """Response from a transport, the part of ClientResponse the client uses."""
+
+    @property
+    def status(self) -> int:
+        """HTTP status."""
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Response headers."""
+
+    @property
+    def content(self) -> ChunkReader:
+        """Body as a stream of chunks."""
+
+    async def read(self) -> bytes:
+        """Read whole body."""
+
+    async def text(self) -> str:
+        """Read whole body as text."""
+
+
+class Transport(Protocol):
+    """Performs requests for the client."""
+
+    async def request(self, request: TransportRequest) -> TransportResponse:
+        """Perform request and get response once headers are received."""
+
+
+class SessionTransport:
+    """Transport performing requests with an aiohttp client session."""
+
+    def __init__(self, session: ClientSession) -> None:
+        """Initialize transport with session to use."""
+        self._session = session
+
+    async def request(self, request: TransportRequest) -> ClientResponse:
+        """Perform request with session."""
+        return await self._session.request(
+            request.method.value,
+            request.url,
+            timeout=request.timeout,
+            headers=request.headers,
+            params=request.params,
+            json=request.json,
+            data=request.data,
+            trace_request_ctx=request.info,
+        )
+
+
+class _LocalChunks:
+    """Chunk reader over the body of a local response."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        """Initialize with chunks of body."""
+        self._chunks = chunks
+
+    async def readchunk(self) -> tuple[bytes, bool]:
+        """Get next chunk."""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk, True
+        return b"", False
+
+
+async def _single(body: bytes) -> AsyncIterator[bytes]:
+    """Yield body as one chunk."""
+    yield body
+
+
+class LocalResponse:
+    """Response made in process, without HTTP, for a transport.
+
+    Body can be bytes, text or an async iterable of chunks to stream.
+    """
+
+    __slots__ = ("_body", "content", "headers", "status")
+
+    def __init__(
+        self,
+        body: bytes | str | AsyncIterable[bytes] = b"",
+        *,
+        status: int = HTTPStatus.OK,
+        headers: Mapping[str, str] | list[tuple[str, str]] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        """Initialize response."""
+        if isinstance(body, str):
+            body = body.encode()
+        self._body = body if isinstance(body, bytes) else None
+        chunks = _single(body) if isinstance(body, bytes) else aiter(body)
+
+        self.status = int(status)
+        self.content = _LocalChunks(chunks)
+        all_headers = CIMultiDict(headers or {})
+        if content_type:
+            all_headers["Content-Type"] = content_type
+        self.headers = CIMultiDictProxy(all_headers)
+
+    @classmethod
+    def json(cls, data: Any, *, status: int = HTTPStatus.OK) -> Self:
+        """Get response with data encoded as JSON."""
+        return cls(orjson.dumps(data), status=status, content_type="application/json")
+
+    async def read(self) -> bytes:
+        """Read whole body."""
+        if self._body is None:
+            chunks = []
+            while chunk := (await self.content.readchunk())[0]:
+                chunks.append(chunk)
+            self._body = b"".join(chunks)
+        return self._body
+
+    async def text(self) -> str:
+        """Read whole body as text in the charset of its content type."""
+        _, _, charset = self.headers.get("Content-Type", "").partition("charset=")
+        return (await self.read()).decode(charset.split(";")[0].strip() or "utf-8")
+
+
+type Handler = Callable[[TransportRequest], Awaitable[TransportResponse]]
+
+
+class HandlerTransport:
+    """Transport calling a handler in process, without sockets or HTTP.
+
+    The handler gets the request as the client prepared it, JSON and data are
+    not serialized, and usually answers with a LocalResponse. Total timeout of
+    the request applies to the handler.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        """Initialize transport with handler answering requests."""
+        self._handler = handler
+
+    async def request(self, request: TransportRequest) -> TransportResponse:
+        """Get response from handler."""
+        async with asyncio.timeout(request.timeout.total if request.timeout else None):
+            return await self._handler(request)
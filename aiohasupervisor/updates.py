@@ -0,0 +1,199 @@
+"""Planning and running updates of Supervisor, OS, Home Assistant and addons."""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass
+from time import monotonic
+from uuid import UUID
+
+from .exceptions import SupervisorError, SupervisorTimeoutError
+from .models.addons import StoreAddonUpdate
+from .models.homeassistant import HomeAssistantUpdateOptions
+from .models.root import UpdateType
+from .root import SupervisorClient
+
+# Supervisor first so the rest is updated by the latest Supervisor
+_ORDER = {
+    UpdateType.SUPERVISOR: 0,
+    UpdateType.OS: 1,
+    UpdateType.CORE: 2,
+    UpdateType.ADDON: 3,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedUpdate:
+    """Update of a component, name is the addon slug for addons."""
+
+    update_type: UpdateType
+    name: str
+    version_latest: str
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateResult:
+    """Outcome of a planned update and how long it took in seconds.
+
+    Deferred updates were not applied because the host reboots to finish an
+    OS update, plan them again once it is back.
+    """
+
+    update: PlannedUpdate
+    duration: float
+    error: SupervisorError | None = None
+    deferred: bool = False
+
+
+async def plan_updates(client: SupervisorClient) -> list[PlannedUpdate]:
+    """Get available updates in the order they should be applied.
+
+    Supervisor is updated first, then OS, then Home Assistant and finally
+    addons sorted by slug.
+    """
+    available, addons = await asyncio.gather(
+        client.available_updates(), client.addons.list()
+    )
+    plan = [
+        PlannedUpdate(
+            update.update_type, update.update_type.value, update.version_latest
+        )
+        for update in available
+        if update.update_type != UpdateType.ADDON
+    ]
+    plan.extend(
+        PlannedUpdate(UpdateType.ADDON, addon.slug, addon.version_latest)
+        for addon in addons
+        if addon.update_available
+    )
+    plan.sort(key=lambda update: (_ORDER[update.update_type], update.name))
+    return plan
+
+
+async def _wait_for_supervisor(
+    client: SupervisorClient,
+    version: str,
+    poll_interval: float,
+    restart_timeout: float,
+) -> None:
+    """Wait until Supervisor restarted and responds with the updated version.
+
+    The old Supervisor keeps responding for a while after the update was
+    started, so responding alone does not mean it restarted.
+    """
+    try:
+        async with asyncio.timeout(restart_timeout):
+            while True:
+                try:
+                    if (await client.supervisor.info()).version == version:
+                        return
+                except SupervisorError:
+                    pass
+                await asyncio.sleep(poll_interval)
+    except TimeoutError as err:
+        raise SupervisorTimeoutError("Supervisor did not respond after update") from err
+
+
+async def _wait_for_job(
+    client: SupervisorClient, job_id: UUID, poll_interval: float, job_timeout: float
+) -> None:
+    """Wait for a job to be done, raise its first error if it failed."""
+    try:
+        async with asyncio.timeout(job_timeout):
+            while not (job := await client.jobs.get_job(job_id)).done:  # noqa: ASYNC110
+                await asyncio.sleep(poll_interval)
+    except TimeoutError as err:
+        raise SupervisorTimeoutError(
+            "Job did not finish in time", job_id=job_id.hex
+        ) from err
+    if job.errors:
+        raise SupervisorError(job.errors[0].message, job_id=job_id.hex)
+
+
+async def _timed(update: PlannedUpdate, action: Awaitable[None]) -> UpdateResult:
+    """Run update action and time it."""
+    start = monotonic()
+    try:
+        await action
+    except SupervisorError as err:
+        return UpdateResult(update, monotonic() - start, err)
+    return UpdateResult(update, monotonic() - start)
+
+
+async def run_updates(
+    client: SupervisorClient,
+    plan: Iterable[PlannedUpdate],
+    *,
+    concurrency: int = 4,
+    backup: bool | None = None,
+    poll_interval: float = 5.0,
+    restart_timeout: float = 300.0,
+    job_timeout: float = 3600.0,
+) -> list[UpdateResult]:
+    """Apply planned updates and report the outcome of each in plan order.
+
+    Supervisor, OS and Home Assistant are updated one after another, waiting
+    for Supervisor to respond with its new version after it updated itself.
+    Addons are then updated at most concurrency at a time as background jobs
+    which are polled every poll_interval seconds for up to job_timeout seconds,
+    so no connection is held open for the length of an update. A failed update
+    does not stop the others, its result holds the error.
+
+    The host reboots after an OS update, so updates planned after it are not
+    applied and their results are deferred.
+    """
+
+    async def _update_component(update: PlannedUpdate) -> None:
+        match update.update_type:
+            case UpdateType.SUPERVISOR:
+                await client.supervisor.update()
+                await _wait_for_supervisor(
+                    client, update.version_latest, poll_interval, restart_timeout
+                )
+            case UpdateType.OS:
+                await client.os.update()
+            case UpdateType.CORE:
+                await client.homeassistant.update(
+                    None
+                    if backup is None
+                    else HomeAssistantUpdateOptions(backup=backup)
+                )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _update_addon(update: PlannedUpdate) -> None:
+        job_id = await client.store.update_addon_job(
+            update.name, StoreAddonUpdate(backup=backup)
+        )
+        if job_id:
+            await _wait_for_job(client, job_id, poll_interval, job_timeout)
+
+    async def _limited(update: PlannedUpdate) -> UpdateResult:
+        # Time spent waiting for a slot does not count towards duration
+        async with semaphore:
+            return await _timed(update, _update_addon(update))
+
+    plan = list(plan)
+    # Results by position in plan, addons are updated after the components
+    results: dict[int, UpdateResult] = {}
+    addons: dict[int, PlannedUpdate] = {}
+    rebooting = False
+    for index, update in enumerate(plan):
+        if update.update_type == UpdateType.ADDON:
+            addons[index] = update
+        elif rebooting:
+            results[index] = UpdateResult(update, 0.0, deferred=True)
+        else:
+            results[index] = await _timed(update, _update_component(update))
+            rebooting = (
+                update.update_type == UpdateType.OS and results[index].error is None
+            )
+
+    if rebooting:
+        for index, update in addons.items():
+            results[index] = UpdateResult(update, 0.0, deferred=True)
+    else:
+        addon_results = await asyncio.gather(
+            *(_limited(update) for update in addons.values())
+        )
+        results.update(zip(addons, addon_results, strict=True))
+    return [results[index] for index in range(len(plan))]
@@ -1,8 +1,9 @@
 """Utilities for interacting with aiohttp."""
 
+from collections.abc import AsyncIterator, Mapping
 from typing import Self
 
-from aiohttp import StreamReader
+from aiohasupervisor.transport import ChunkReader
 
 
 class ChunkAsyncStreamIterator:
@@ -13,11 +14,14 @@ class ChunkAsyncStreamIterator:
     Borrowed from home-assistant/core.
     """
 
-    __slots__ = ("_stream",)
+    __slots__ = ("_stream", "headers")
 
-    def __init__(self, stream: StreamReader) -> None:
-        """Initialize."""
+    def __init__(
+        self, stream: ChunkReader, headers: Mapping[str, str] | None = None
+    ) -> None:
+        """Initialize with stream and headers of the response it belongs to."""
         self._stream = stream
+        self.headers: Mapping[str, str] = headers or {}
 
     def __aiter__(self) -> Self:
         """Iterate."""
@@ -29,3 +33,44 @@ class ChunkAsyncStreamIterator:
         if rv == (b"", False):
             raise StopAsyncIteration
         return rv[0]
+
+
+class LineAsyncStreamIterator:
+    """Async iterator splitting a stream of chunks into lines of text.
+
+    Chunks are appended to a single buffer which is only compacted once all
+    complete lines in it have been yielded, so no line copies the whole buffer.
+    Yielded lines do not include the trailing newline.
+    """
+
+    __slots__ = ("_buffer", "_chunks", "_eof", "_pos")
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        """Initialize."""
+        self._chunks = chunks
+        self._buffer = bytearray()
+        self._pos = 0
+        self._eof = False
+
+    def __aiter__(self) -> Self:
+        """Iterate."""
+        return self
+
+    async def __anext__(self) -> str:
+        """Yield next line."""
+        while (end := self._buffer.find(b"\n", self._pos)) == -1:
+            if self._eof:
+                if self._pos >= len(self._buffer):
+                    raise StopAsyncIteration
+                end = len(self._buffer)
+                break
+            del self._buffer[: self._pos]
+            self._pos = 0
+            try:
+                self._buffer += await anext(self._chunks)
+            except StopAsyncIteration:
+                self._eof = True
+
+        line = str(memoryview(self._buffer)[self._pos : end], "utf-8", "replace")
+        self._pos = end + 1
+        return line
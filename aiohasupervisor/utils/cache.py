@@ -0,0 +1,155 @@
+"""Size-bounded caches used internally in library."""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from hashlib import sha256
+import os
+from pathlib import Path
+from threading import Lock
+
+
+class LRUCache[K, V]:
+    """In-memory cache evicting least recently used entries beyond max size.
+
+    Size of an entry is determined by the sizer, by default every entry has a
+    size of one so max size is a number of entries. Lookups are counted as hits
+    and misses.
+    """
+
+    def __init__(self, max_size: int, sizer: Callable[[V], int] = lambda _: 1) -> None:
+        """Initialize cache."""
+        self._max_size = max_size
+        self._sizer = sizer
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get number of entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if key is cached."""
+        return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        """Get value for key and mark it as recently used."""
+        if (entry := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: K, value: V) -> None:
+        """Set value for key, values larger than max size are not cached."""
+        self.pop(key)
+        if (size := self._sizer(value)) > self._max_size:
+            return
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self._max_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+    def pop(self, key: K) -> V | None:
+        """Remove key and return its value if it was cached."""
+        if (entry := self._entries.pop(key, None)) is None:
+            return None
+        self.size -= entry[1]
+        return entry[0]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size = 0
+
+
+class DiskCache:
+    """Directory of cached files evicting least recently used beyond max size.
+
+    Files are named after the SHA-256 digest of their key. Methods do blocking
+    IO and should be called from an executor, they are safe to call from
+    several threads at once.
+    """
+
+    def __init__(self, path: Path | str, max_size: int) -> None:
+        """Initialize cache in directory path."""
+        self._path = Path(path)
+        self._max_size = max_size
+        self._files: OrderedDict[str, int] | None = None
+        self._lock = Lock()
+        self.size = 0
+
+    def _load(self) -> OrderedDict[str, int]:
+        """Get cached files and their size, scanning the directory once."""
+        if self._files is None:
+            self._path.mkdir(parents=True, exist_ok=True)
+            stats = [
+                (entry.stat().st_mtime_ns, entry.name, entry.stat().st_size)
+                for entry in os.scandir(self._path)
+                if entry.is_file() and not entry.name.endswith(".tmp")
+            ]
+            self._files = OrderedDict((name, size) for _, name, size in sorted(stats))
+            self.size = sum(self._files.values())
+        return self._files
+
+    @staticmethod
+    def filename(key: str) -> str:
+        """Get name of file for key."""
+        return sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Get cached data for key and mark it as recently used."""
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> bytes | None:
+        """Get cached data for key, lock must be held."""
+        files = self._load()
+        if (name := self.filename(key)) not in files:
+            return None
+        path = self._path / name
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            self.size -= files.pop(name)
+            return None
+        files.move_to_end(name)
+        return data
+
+    def set(self, key: str, data: bytes) -> None:
+        """Write data for key, data larger than max size is not cached."""
+        with self._lock:
+            self._set(key, data)
+
+    def _set(self, key: str, data: bytes) -> None:
+        """Write data for key, lock must be held."""
+        files = self._load()
+        name = self.filename(key)
+        self._pop(key)
+        if len(data) > self._max_size:
+            return
+        temp_path = self._path / f"{name}.tmp"
+        temp_path.write_bytes(data)
+        temp_path.replace(self._path / name)
+        files[name] = len(data)
+        self.size += len(data)
+        while self.size > self._max_size:
+            evicted, size = files.popitem(last=False)
+            (self._path / evicted).unlink(missing_ok=True)
+            self.size -= size
+
+    def pop(self, key: str) -> None:
+        """Remove cached data for key."""
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key: str) -> None:
+        """Remove cached data for key, lock must be held."""
+        files = self._load()
+        if (size := files.pop(self.filename(key), None)) is not None:
+            (self._path / self.filename(key)).unlink(missing_ok=True)
+            self.size -= size
@@ -0,0 +1 @@
+"""Benchmarks of import time and model decoding for aiohasupervisor."""
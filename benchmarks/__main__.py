@@ -0,0 +1,243 @@
+"""Benchmark import time and model decoding, results are written as JSON.
+
+Run from the repository root:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json
+
+Import time and first decode of each model are measured in fresh interpreters
+so code compiled by earlier measurements does not hide their cost. Decode
+throughput is measured for every fixture in tests/fixtures and for synthetic
+payloads of production size, scaled with --scale.
+"""
+
+import argparse
+from datetime import UTC, datetime
+from importlib.metadata import version
+import json
+from pathlib import Path
+import platform
+from statistics import median
+import subprocess
+import sys
+from timeit import Timer
+import tracemalloc
+from typing import Any
+
+import orjson
+
+from aiohasupervisor.models.base import Response
+
+from .fixtures import FIXTURE_MODELS, FIXTURES, model_decoder
+from .payloads import PAYLOADS, response
+
+ROOT = Path(__file__).parent.parent
+
+_IMPORT = """
+import time
+start = time.perf_counter()
+import aiohasupervisor
+print(time.perf_counter() - start)
+"""
+
+_FIRST_DECODE = """
+import sys, time
+from aiohasupervisor.models.base import Response
+from benchmarks.fixtures import model_decoder
+data = Response.from_json(open(sys.argv[1], "rb").read()).data
+decode = model_decoder(sys.argv[2])
+start = time.perf_counter()
+decode(data)
+first = time.perf_counter() - start
+start = time.perf_counter()
+decode(data)
+print(first, time.perf_counter() - start)
+"""
+
+
+def _run(code: str, *args: str) -> list[float]:
+    """Run code in a fresh interpreter and get the numbers it printed."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code, *args],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return [float(value) for value in output.split()]
+
+
+def _per_second(func: Any, *args: Any) -> float:
+    """Get how many times per second func can be called."""
+    timer = Timer(lambda: func(*args))
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=3, number=number))
+
+
+def bench_import(repeat: int) -> dict[str, float]:
+    """Measure wall time of importing aiohasupervisor."""
+    times = [_run(_IMPORT)[0] for _ in range(repeat)]
+    return {"min": min(times), "median": median(times)}
+
+
+def bench_first_decode() -> dict[str, dict[str, Any]]:
+    """Measure first and second decode of each model in a fresh interpreter."""
+    results: dict[str, dict[str, Any]] = {}
+    for fixture, spec in FIXTURE_MODELS.items():
+        if spec is None:
+            continue
+        first, second = _run(_FIRST_DECODE, str(FIXTURES / fixture), spec)
+        results[fixture] = {"model": spec, "first": first, "second": second}
+    return results
+
+
+def bench_decode() -> dict[str, dict[str, Any]]:
+    """Measure decode throughput of every fixture per second."""
+    results: dict[str, dict[str, Any]] = {}
+    for path in sorted(FIXTURES.iterdir()):
+        if path.suffix != ".json":
+            continue
+        raw = path.read_bytes()
+        result: dict[str, Any] = {
+            "bytes": len(raw),
+            "json": _per_second(orjson.loads, raw),
+        }
+        if path.name in FIXTURE_MODELS:
+            result["response"] = _per_second(Response.from_json, raw)
+            if spec := FIXTURE_MODELS[path.name]:
+                decode = model_decoder(spec)
+                data = Response.from_json(raw).data
+                result["model"] = spec
+                result["data"] = _per_second(decode, data)
+        results[path.name] = result
+    return results
+
+
+def _peak_memory(func: Any, *args: Any) -> int:
+    """Get peak memory in bytes allocated while calling func."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_payloads(scale: float) -> dict[str, dict[str, Any]]:
+    """Measure decode throughput and peak memory of synthetic payloads."""
+    results: dict[str, dict[str, Any]] = {}
+    for name, payload in PAYLOADS.items():
+        count = max(1, round(payload.size * scale))
+        raw = response(payload.generate(count))
+        decode = model_decoder(payload.model)
+
+        def _decode(raw: bytes = raw, decode: Any = decode) -> Any:
+            return decode(Response.from_json(raw).data)
+
+        _decode()
+        results[name] = {
+            "model": payload.model,
+            "count": count,
+            "bytes": len(raw),
+            "items_per_second": _per_second(_decode) * count,
+            "peak_memory": _peak_memory(_decode),
+        }
+    return results
+
+
+def _commit() -> str | None:
+    """Get commit of the working tree if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(repeat: int, scale: float) -> dict[str, Any]:
+    """Run all benchmarks."""
+    return {
+        "meta": {
+            "created": datetime.now(UTC).isoformat(),
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "mashumaro": version("mashumaro"),
+            "orjson": version("orjson"),
+        },
+        "import": bench_import(repeat),
+        "first_decode": bench_first_decode(),
+        "decode": bench_decode(),
+        "payloads": bench_payloads(scale) if scale else {},
+    }
+
+
+def _metrics(results: dict[str, Any]) -> dict[str, tuple[float, bool]]:
+    """Flatten results into metric name to value and whether higher is better."""
+    metrics = {
+        f"import.{key}": (value, False) for key, value in results["import"].items()
+    }
+    for fixture, result in results["first_decode"].items():
+        metrics[f"first_decode.{fixture}"] = (result["first"], False)
+    for fixture, result in results["decode"].items():
+        for key in ("json", "response", "data"):
+            if key in result:
+                metrics[f"decode.{fixture}.{key}"] = (result[key], True)
+    for name, result in results.get("payloads", {}).items():
+        metrics[f"payloads.{name}.items_per_second"] = (
+            result["items_per_second"],
+            True,
+        )
+        metrics[f"payloads.{name}.peak_memory"] = (result["peak_memory"], False)
+    return metrics
+
+
+def compare(
+    baseline: dict[str, Any], results: dict[str, Any], threshold: float
+) -> list[str]:
+    """Get lines describing metrics which regressed by more than threshold."""
+    regressions = []
+    current = _metrics(results)
+    for name, (before, higher_is_better) in _metrics(baseline).items():
+        if name not in current or not before:
+            continue
+        change = current[name][0] / before - 1
+        if (-change if higher_is_better else change) > threshold:
+            regressions.append(f"{name}: {before:.6g} -> {current[name][0]:.6g}")
+    return regressions
+
+
+def main() -> int:
+    """Run benchmarks from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--output", type=Path, help="write results to file")
+    parser.add_argument("--compare", type=Path, help="baseline results to compare")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="size of payloads, 0 to skip"
+    )
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.scale)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if regressions := compare(baseline, results, args.threshold):
+            sys.stderr.write("Regressions:\n" + "\n".join(regressions) + "\n")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
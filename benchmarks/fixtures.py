@@ -0,0 +1,82 @@
+"""Models used to decode the data of each test fixture."""
+
+from collections.abc import Callable
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# Model as "module:Class" within aiohasupervisor.models, suffix [] for a list of
+# them. Fixtures with None are Supervisor responses without a model for data.
+FIXTURE_MODELS: dict[str, str | None] = {
+    "addon_stats.json": "addons:AddonsStats",
+    "addons_config_validate.json": "addons:AddonsConfigValidate",
+    "addons_info.json": "addons:InstalledAddonComplete",
+    "addons_list.json": "addons:AddonsList",
+    "addons_options_config.json": None,
+    "backup_background.json": "backups:NewBackup",
+    "backup_foreground.json": "backups:NewBackup",
+    "backup_info.json": "backups:BackupComplete",
+    "backup_info_location_attributes.json": "backups:BackupComplete",
+    "backup_info_no_homeassistant.json": "backups:BackupComplete",
+    "backup_info_with_extra.json": "backups:BackupComplete",
+    "backup_info_with_locations.json": "backups:BackupComplete",
+    "backup_restore.json": "backups:BackupJob",
+    "backup_uploaded.json": "backups:UploadedBackup",
+    "backups_info.json": "backups:BackupsInfo",
+    "backups_list.json": "backups:BackupList",
+    "backups_list_location_attributes.json": "backups:BackupList",
+    "create_session.json": "ingress:Session",
+    "discovery_get.json": "discovery:Discovery",
+    "discovery_list.json": "discovery:DiscoveryList",
+    "discovery_set.json": "discovery:SetDiscovery",
+    "homeassistant_info.json": "homeassistant:HomeAssistantInfo",
+    "homeassistant_stats.json": "homeassistant:HomeAssistantStats",
+    "host_disk_usage.json": "host:DiskUsage",
+    "host_info.json": "host:HostInfo",
+    "host_services.json": "host:ServiceList",
+    "ingress_panels.json": "ingress:IngressPanels",
+    "jobs_get_job.json": "jobs:Job",
+    "jobs_get_job_extra.json": "jobs:Job",
+    "jobs_info.json": "jobs:JobsInfo",
+    "jobs_info_no_stage.json": "jobs:JobsInfo",
+    "mounts_info.json": "mounts:MountsInfo",
+    "network_access_points.json": "network:AccessPointList",
+    "network_info.json": "network:NetworkInfo",
+    "network_interface_info.json": "network:NetworkInterface",
+    "os_config_swap.json": "os:SwapInfo",
+    "os_datadisk_list.json": "os:DataDiskList",
+    "os_green_info.json": "os:GreenInfo",
+    "os_info.json": "os:OSInfo",
+    "os_raspberrypi_info.json": "os:RaspberryPiFirmwareInfo",
+    "os_yellow_info.json": "os:YellowInfo",
+    "resolution_info.json": "resolution:ResolutionInfo",
+    "resolution_suggestions_for_issue.json": "resolution:SuggestionsList",
+    "root_available_updates.json": "root:AvailableUpdates",
+    "root_info.json": "root:RootInfo",
+    "store_addon_availability_error_architecture.json": None,
+    "store_addon_availability_error_home_assistant.json": None,
+    "store_addon_availability_error_machine.json": None,
+    "store_addon_availability_error_other.json": None,
+    "store_addon_info.json": "addons:StoreAddonComplete",
+    "store_addons_list.json": "addons:StoreAddonsList",
+    "store_info.json": "addons:StoreInfo",
+    "store_repositories_list.json": "addons:Repository[]",
+    "store_repository_info.json": "addons:Repository",
+    "supervisor_info.json": "supervisor:SupervisorInfo",
+    "supervisor_stats.json": "supervisor:SupervisorStats",
+}
+
+
+def model_decoder(spec: str) -> Callable[[Any], Any]:
+    """Get function decoding response data with the model of spec.
+
+    from_dict is looked up on each call as models compile it lazily on first use
+    and replace it, holding on to the original would compile on every call.
+    """
+    module, name = spec.removesuffix("[]").split(":")
+    model = getattr(import_module(f"aiohasupervisor.models.{module}"), name)
+    if spec.endswith("[]"):
+        return lambda data: [model.from_dict(item) for item in data]
+    return lambda data: model.from_dict(data)  # noqa: PLW0108
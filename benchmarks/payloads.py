@@ -0,0 +1,147 @@
+"""Synthetic Supervisor responses scaled up from the test fixtures.
+
+Items are copied from the fixtures in turn with identifying fields made unique,
+so payloads keep the shape and mix of values Supervisor returns.
+"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import random
+from typing import Any, NamedTuple
+
+import orjson
+
+from .fixtures import FIXTURES
+
+_START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _items(fixture: str, key: str) -> list[dict[str, Any]]:
+    """Get list of items in data of a fixture."""
+    return orjson.loads((FIXTURES / fixture).read_bytes())["data"][key]
+
+
+def _copies(
+    fixture: str, key: str, count: int
+) -> list[tuple[int, random.Random, dict[str, Any]]]:
+    """Get count copies of the items of a fixture with an index and seeded rng."""
+    items = _items(fixture, key)
+    rng = random.Random(count)  # noqa: S311
+    return [(i, rng, dict(items[i % len(items)])) for i in range(count)]
+
+
+def _tree(nodes: list[dict[str, Any]], key: str, breadth: int) -> dict[str, Any]:
+    """Arrange nodes into a tree with breadth children per node, get the root."""
+    for i, node in enumerate(nodes[1:], 1):
+        parent = nodes[(i - 1) // breadth]
+        if parent[key] is None:
+            parent[key] = []
+        parent[key].append(node)
+    return nodes[0]
+
+
+def backups(count: int) -> dict[str, Any]:
+    """Get data of backups list with count backups."""
+    result = []
+    for i, rng, backup in _copies("backups_list.json", "backups", count):
+        date = _START + timedelta(hours=i, seconds=rng.randrange(3600))
+        size_bytes = rng.randrange(10_000, 10_000_000_000)
+        backup |= {
+            "slug": f"{i:08x}",
+            "name": f"{backup['type'].title()} Backup {date:%Y-%m-%d %H:%M:%S}",
+            "date": date.isoformat(),
+            "size": round(size_bytes / 1_000_000, 2),
+            "size_bytes": size_bytes,
+            "location_attributes": {
+                ".local": {"protected": backup["protected"], "size_bytes": size_bytes}
+            },
+        }
+        result.append(backup)
+    return {"backups": result}
+
+
+def store_addons(count: int) -> dict[str, Any]:
+    """Get data of store addons list with count addons."""
+    result = []
+    for i, rng, addon in _copies("store_addons_list.json", "addons", count):
+        addon |= {
+            "slug": f"{addon['repository']}_addon_{i}",
+            "name": f"{addon['name']} {i}",
+            "version_latest": f"{rng.randrange(10)}.{rng.randrange(50)}.{i % 10}",
+        }
+        result.append(addon)
+    return {"addons": result}
+
+
+def addons(count: int) -> dict[str, Any]:
+    """Get data of installed addons list with count addons."""
+    result = []
+    for i, _, addon in _copies("addons_list.json", "addons", count):
+        addon |= {"slug": f"{addon['repository']}_addon_{i}"}
+        result.append(addon)
+    return {"addons": result}
+
+
+def jobs(count: int, breadth: int = 4) -> dict[str, Any]:
+    """Get data of jobs info with one job tree of count jobs."""
+    templates = []
+    pending = _items("jobs_info.json", "jobs")
+    while pending:
+        job = pending.pop()
+        pending.extend(job["child_jobs"])
+        templates.append(job)
+
+    nodes = []
+    rng = random.Random(count)  # noqa: S311
+    for i in range(count):
+        job = templates[i % len(templates)] | {
+            "uuid": f"{i:032x}",
+            "progress": rng.randrange(101),
+            "created": (_START + timedelta(milliseconds=i)).isoformat(),
+            "child_jobs": None,
+        }
+        nodes.append(job)
+    root = _tree(nodes, "child_jobs", breadth)
+    for job in nodes:
+        job["child_jobs"] = job["child_jobs"] or []
+    return {"ignore_conditions": [], "jobs": [root]}
+
+
+def disk_usage(count: int, breadth: int = 10) -> dict[str, Any]:
+    """Get data of disk usage with a tree of count nodes."""
+    rng = random.Random(count)  # noqa: S311
+    nodes: list[dict[str, Any]] = [
+        {
+            "id": f"node_{i}",
+            "label": f"Node {i}",
+            "used_bytes": rng.randrange(1_000_000_000),
+            "children": None,
+        }
+        for i in range(count)
+    ]
+    root = _tree(nodes, "children", breadth)
+    root["total_bytes"] = 2 * sum(node["used_bytes"] for node in nodes)
+    return root
+
+
+class Payload(NamedTuple):
+    """Generator of a synthetic payload and model decoding it."""
+
+    generate: Callable[[int], dict[str, Any]]
+    model: str
+    size: int
+
+
+# Sizes seen on large production systems
+PAYLOADS: dict[str, Payload] = {
+    "backups": Payload(backups, "backups:BackupList", 5_000),
+    "store_addons": Payload(store_addons, "addons:StoreAddonsList", 2_000),
+    "addons": Payload(addons, "addons:AddonsList", 500),
+    "jobs": Payload(jobs, "jobs:JobsInfo", 10_000),
+    "disk_usage": Payload(disk_usage, "host:DiskUsage", 100_000),
+}
+
+
+def response(data: dict[str, Any]) -> bytes:
+    """Get body of a successful Supervisor response with data."""
+    return orjson.dumps({"result": "ok", "data": data})
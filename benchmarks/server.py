@@ -0,0 +1,365 @@
+"""Stand-in Supervisor serving the test fixtures for load and latency testing.
+
+Endpoints used by the client answer with the fixture for them, other POST, PUT
+and DELETE requests succeed without data. Latency, jitter and errors can be
+injected and backups download as a synthetic body of any size with Range
+support. Logs of every component are a synthetic journal, paged with a Range
+header of entries and verbose for text/x-log like Supervisor does. Run it on
+its own with:
+
+    python -m benchmarks.server --port 8080 --latency 0.05 --error-rate 0.01
+
+Or in process with serve, pass path to listen on a Unix socket and connect
+with a session using aiohttp.UnixConnector.
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from http import HTTPStatus
+import random
+import re
+
+from aiohttp import web
+import orjson
+
+from .fixtures import FIXTURES
+
+_CHUNK_SIZE = 64 * 1024
+# Backup content is bytes 0 to 255 repeating, so any offset can be sliced from it
+_PATTERN = bytes(range(256)) * (_CHUNK_SIZE // 256 + 1)
+# Only the signature, icons and logos are opaque bytes to the client
+_PNG = b"\x89PNG\r\n\x1a\n"
+# Log entries are the journal of an addon throwing now and then
+_TRACEBACK_EVERY = 10
+_LOG_START = datetime(2026, 1, 1, tzinfo=UTC)
+_ENTRIES_RANGE = re.compile(
+    r"entries=(?P<cursor>[^:]*)(?:(?::(?P<skip>-?\d+))?:(?P<count>\d*))?"
+)
+
+ROUTES: dict[tuple[str, str], str] = {
+    ("GET", "/addons"): "addons_list.json",
+    ("GET", "/addons/{addon}/info"): "addons_info.json",
+    ("GET", "/addons/{addon}/stats"): "addon_stats.json",
+    ("GET", "/addons/{addon}/options/config"): "addons_options_config.json",
+    ("POST", "/addons/{addon}/options/validate"): "addons_config_validate.json",
+    ("GET", "/available_updates"): "root_available_updates.json",
+    ("GET", "/backups"): "backups_list.json",
+    ("GET", "/backups/info"): "backups_info.json",
+    ("POST", "/backups/new/full"): "backup_background.json",
+    ("POST", "/backups/new/partial"): "backup_background.json",
+    ("GET", "/backups/{backup}/info"): "backup_info.json",
+    ("POST", "/backups/{backup}/restore/full"): "backup_restore.json",
+    ("POST", "/backups/{backup}/restore/partial"): "backup_restore.json",
+    ("GET", "/core/info"): "homeassistant_info.json",
+    ("GET", "/core/stats"): "homeassistant_stats.json",
+    ("GET", "/discovery"): "discovery_list.json",
+    ("POST", "/discovery"): "discovery_set.json",
+    ("GET", "/discovery/{uuid}"): "discovery_get.json",
+    ("GET", "/host/disks/default/usage"): "host_disk_usage.json",
+    ("GET", "/host/info"): "host_info.json",
+    ("GET", "/host/services"): "host_services.json",
+    ("GET", "/info"): "root_info.json",
+    ("GET", "/ingress/panels"): "ingress_panels.json",
+    ("POST", "/ingress/session"): "create_session.json",
+    ("GET", "/jobs/info"): "jobs_info.json",
+    ("GET", "/jobs/{job}"): "jobs_get_job.json",
+    ("GET", "/mounts"): "mounts_info.json",
+    ("GET", "/network/info"): "network_info.json",
+    ("GET", "/network/interface/{interface}/info"): "network_interface_info.json",
+    (
+        "GET",
+        "/network/interface/{interface}/accesspoints",
+    ): "network_access_points.json",
+    ("GET", "/os/boards/green"): "os_green_info.json",
+    ("GET", "/os/boards/raspberrypi/firmware"): "os_raspberrypi_info.json",
+    ("GET", "/os/boards/yellow"): "os_yellow_info.json",
+    ("GET", "/os/config/swap"): "os_config_swap.json",
+    ("GET", "/os/datadisk/list"): "os_datadisk_list.json",
+    ("GET", "/os/info"): "os_info.json",
+    ("GET", "/resolution/info"): "resolution_info.json",
+    (
+        "GET",
+        "/resolution/issue/{issue}/suggestions",
+    ): "resolution_suggestions_for_issue.json",
+    ("GET", "/store"): "store_info.json",
+    ("GET", "/store/addons"): "store_addons_list.json",
+    ("GET", "/store/addons/{addon}"): "store_addon_info.json",
+    ("GET", "/store/addons/{addon}/changelog"): "store_addon_changelog.txt",
+    ("GET", "/store/addons/{addon}/documentation"): "store_addon_documentation.txt",
+    ("GET", "/store/repositories"): "store_repositories_list.json",
+    ("GET", "/store/repositories/{repository}"): "store_repository_info.json",
+    ("GET", "/supervisor/info"): "supervisor_info.json",
+    ("GET", "/supervisor/stats"): "supervisor_stats.json",
+}
+
+
+class InjectedError(StrEnum):
+    """Errors the stand-in Supervisor can inject."""
+
+    UNAVAILABLE = "503"
+    TIMEOUT = "timeout"
+    RESET = "reset"
+
+
+@dataclass(slots=True, frozen=True)
+class ServerOptions:
+    """Behaviour of the stand-in Supervisor."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    errors: tuple[InjectedError, ...] = tuple(InjectedError)
+    hang: float = 600.0
+    backup_size: int = 64 * 1024 * 1024
+    log_entries: int = 1000
+    seed: int | None = None
+
+
+_OPTIONS = web.AppKey("options", ServerOptions)
+_RANDOM = web.AppKey("random", random.Random)
+
+type _Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def _error(status: HTTPStatus, message: str) -> web.Response:
+    """Get an error response as Supervisor returns it."""
+    return web.json_response(
+        {"result": "error", "message": message, "data": {}},
+        status=status,
+        dumps=lambda obj: orjson.dumps(obj).decode(),
+    )
+
+
+def _fixture(name: str) -> _Handler:
+    """Get handler answering with a fixture."""
+    body = (FIXTURES / name).read_bytes()
+    content_type = "application/json" if name.endswith(".json") else "text/plain"
+
+    async def _handler(request: web.Request) -> web.Response:  # noqa: ARG001
+        return web.Response(body=body, content_type=content_type)
+
+    return _handler
+
+
+async def _ok(request: web.Request) -> web.Response:
+    """Succeed without data."""
+    await request.read()
+    return web.json_response({"result": "ok", "data": {}})
+
+
+async def _not_found(request: web.Request) -> web.Response:
+    """Answer unknown GET requests."""
+    return _error(HTTPStatus.NOT_FOUND, f"{request.path} not found")
+
+
+async def _image(request: web.Request) -> web.Response:  # noqa: ARG001
+    """Answer with a tiny PNG for addon icons and logos."""
+    return web.Response(body=_PNG, content_type="image/png")
+
+
+async def _upload(request: web.Request) -> web.Response:
+    """Consume an uploaded backup."""
+    async for _ in request.content.iter_chunked(_CHUNK_SIZE):
+        pass
+    return web.Response(
+        body=(FIXTURES / "backup_uploaded.json").read_bytes(),
+        content_type="application/json",
+    )
+
+
+async def _download(request: web.Request) -> web.StreamResponse:
+    """Stream a synthetic backup, honouring a Range header."""
+    size = request.app[_OPTIONS].backup_size
+    try:
+        start, stop, _ = request.http_range.indices(size)
+    except ValueError:
+        return _error(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, "Invalid range")
+    if start >= stop and size:
+        return _error(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, "Invalid range")
+
+    response = web.StreamResponse(
+        status=HTTPStatus.PARTIAL_CONTENT if "Range" in request.headers else 200,
+        headers={
+            "Content-Type": "application/x-tar",
+            "Accept-Ranges": "bytes",
+        },
+    )
+    if "Range" in request.headers:
+        response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+    response.content_length = stop - start
+    await response.prepare(request)
+    for offset in range(start, stop, _CHUNK_SIZE):
+        shift = offset % 256
+        await response.write(_PATTERN[shift : shift + min(_CHUNK_SIZE, stop - offset)])
+    await response.write_eof()
+    return response
+
+
+def _log_entry(index: int, *, verbose: bool) -> bytes:
+    """Get an entry of the synthetic journal, some span two lines.
+
+    Verbose entries start with timestamp, host and identifier like Supervisor
+    formats them, lines continuing an entry do not.
+    """
+    entry = f"INFO (MainThread) [benchmarks.server] Entry {index}\n"
+    if verbose:
+        timestamp = _LOG_START + timedelta(milliseconds=index)
+        entry = f"{timestamp:%Y-%m-%d %H:%M:%S.%f}"[:-3] + f" ha addon[1]: {entry}"
+    if index % _TRACEBACK_EVERY == _TRACEBACK_EVERY - 1:
+        entry += f"  Traceback of entry {index}\n"
+    return entry.encode()
+
+
+def _entries_range(value: str, total: int) -> tuple[int, int]:
+    """Get start and stop of a Range header of entries=cursor[[:skip]:count].
+
+    Cursors are the index of an entry. Without cursor a negative skip starts
+    that many entries before the newest one, otherwise at the oldest.
+    """
+    if not (match := _ENTRIES_RANGE.fullmatch(value)):
+        raise ValueError(value)
+    cursor, skip, count = match.group("cursor", "skip", "count")
+    start = int(skip or 0)
+    if cursor:
+        start += int(cursor)
+    elif start < 0:
+        start += total
+    start = min(max(start, 0), total)
+    return start, min(start + int(count), total) if count else total
+
+
+async def _logs(request: web.Request) -> web.Response:
+    """Answer with entries of the journal, honouring a Range header of entries."""
+    total = request.app[_OPTIONS].log_entries
+    start, stop = max(total - int(request.query.get("lines", total)), 0), total
+    if "Range" in request.headers:
+        try:
+            start, stop = _entries_range(request.headers["Range"], total)
+        except ValueError:
+            return _error(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, "Invalid range")
+
+    verbose = request.headers.get("Accept") == "text/x-log"
+    response = web.Response(
+        body=b"".join(
+            _log_entry(index, verbose=verbose) for index in range(start, stop)
+        ),
+        content_type="text/x-log" if verbose else "text/plain",
+    )
+    if start < stop:
+        response.headers["X-First-Cursor"] = str(start)
+    return response
+
+
+@web.middleware
+async def _inject(request: web.Request, handler: _Handler) -> web.StreamResponse:
+    """Delay responses and inject errors as configured."""
+    options = request.app[_OPTIONS]
+    rng = request.app[_RANDOM]
+    if delay := options.latency + rng.uniform(0, options.jitter):
+        await asyncio.sleep(delay)
+
+    if options.errors and rng.random() < options.error_rate:
+        match rng.choice(options.errors):
+            case InjectedError.UNAVAILABLE:
+                return _error(
+                    HTTPStatus.SERVICE_UNAVAILABLE, "Supervisor is not available"
+                )
+            case InjectedError.TIMEOUT:
+                await asyncio.sleep(options.hang)
+            case InjectedError.RESET:
+                if request.transport:
+                    request.transport.abort()
+                raise asyncio.CancelledError
+
+    return await handler(request)
+
+
+def create_app(options: ServerOptions | None = None) -> web.Application:
+    """Create application of the stand-in Supervisor."""
+    options = options or ServerOptions()
+    app = web.Application(middlewares=[_inject], client_max_size=0)
+    app[_OPTIONS] = options
+    app[_RANDOM] = random.Random(options.seed)  # noqa: S311
+
+    app.router.add_get("/backups/{backup}/download", _download)
+    app.router.add_post("/backups/new/upload", _upload)
+    app.router.add_get("/store/addons/{addon}/icon", _image)
+    app.router.add_get("/store/addons/{addon}/logo", _image)
+    app.router.add_get("/store/addons/{addon}/availability", _ok)
+    app.router.add_get("/supervisor/ping", _ok)
+    app.router.add_get(r"/{component:.+}/logs{options:(/.+)?}", _logs)
+    for (method, path), fixture in ROUTES.items():
+        app.router.add_route(method, path, _fixture(fixture))
+    app.router.add_get("/{path:.*}", _not_found)
+    for method in ("POST", "PUT", "DELETE"):
+        app.router.add_route(method, "/{path:.*}", _ok)
+    return app
+
+
+@asynccontextmanager
+async def serve(
+    options: ServerOptions | None = None,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    path: str | None = None,
+) -> AsyncIterator[str]:
+    """Run the stand-in Supervisor and get the URL to use as its api host."""
+    runner = web.AppRunner(create_app(options), handle_signals=False)
+    await runner.setup()
+    try:
+        if path:
+            await web.UnixSite(runner, path).start()
+            yield "http://localhost"
+        else:
+            await web.TCPSite(runner, host, port).start()
+            host, port = runner.addresses[0][:2]
+            yield f"http://{host}:{port}"
+    finally:
+        await runner.cleanup()
+
+
+def _errors(value: str) -> tuple[InjectedError, ...]:
+    """Parse comma separated errors to inject."""
+    return tuple(InjectedError(error) for error in value.split(","))
+
+
+def main(args: Iterable[str] | None = None) -> None:
+    """Run the stand-in Supervisor from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--path", help="listen on a Unix socket instead")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--errors", type=_errors, default=tuple(InjectedError), help="503,timeout,reset"
+    )
+    parser.add_argument("--backup-size", type=int, default=64 * 1024 * 1024)
+    parser.add_argument("--log-entries", type=int, default=1000)
+    parser.add_argument("--seed", type=int)
+    parsed = parser.parse_args(args)
+
+    options = ServerOptions(
+        latency=parsed.latency,
+        jitter=parsed.jitter,
+        error_rate=parsed.error_rate,
+        errors=parsed.errors,
+        backup_size=parsed.backup_size,
+        log_entries=parsed.log_entries,
+        seed=parsed.seed,
+    )
+    if parsed.path:
+        web.run_app(create_app(options), path=parsed.path)
+    else:
+        web.run_app(create_app(options), host=parsed.host, port=parsed.port)
+
+
+if __name__ == "__main__":
+    main()
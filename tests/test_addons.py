@@ -1,8 +1,12 @@
 """Test addons supervisor client."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from io import BytesIO
 from ipaddress import IPv4Address
 
 from aiointercept import aiointercept
+import pytest
 from yarl import URL
 
 from aiohasupervisor import SupervisorClient
@@ -17,6 +21,8 @@ from aiohasupervisor.models import (
     AddonsUninstall,
     Capability,
     InstalledAddonComplete,
+    LogCursor,
+    LogsOptions,
     StoreAddonComplete,
     SupervisorRole,
 )
@@ -149,6 +155,40 @@ async def test_addons_options(
     }
 
 
+async def test_addons_set_options_if_changed(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test only changed addon options are sent."""
+    responses.post(f"{SUPERVISOR_URL}/addons/core_ssh/options", status=200)
+    addon = InstalledAddonComplete.from_dict(
+        Response.from_json(load_fixture("addons_info.json")).data
+    )
+    config = {**addon.options, "server": {"tcp_forwarding": False}}
+
+    # Same state, Supervisor is not called
+    assert (
+        await supervisor_client.addons.set_addon_options_if_changed(
+            addon,
+            AddonsOptions(config=config, boot=AddonBoot.AUTO, network={"22/tcp": None}),
+        )
+        is None
+    )
+    assert not responses.requests
+
+    config["server"] = {"tcp_forwarding": True}
+    sent = await supervisor_client.addons.set_addon_options_if_changed(
+        addon,
+        AddonsOptions(
+            config=config, boot=AddonBoot.AUTO, watchdog=True, audio_input=None
+        ),
+    )
+    assert sent == AddonsOptions(config=config, watchdog=True)
+    request = responses.requests[
+        ("POST", URL(f"{SUPERVISOR_URL}/addons/core_ssh/options"))
+    ]
+    assert request[0].kwargs["json"] == {"options": config, "watchdog": True}
+
+
 async def test_addons_config_validate(
     responses: aiointercept, supervisor_client: SupervisorClient
 ) -> None:
@@ -231,6 +271,57 @@ async def test_addons_stdin(
     assert request[0].captured_body == b"hello world"
 
 
+async def test_addons_stdin_stream(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test streaming addon stdin from an async iterable and a file."""
+
+    async def _lines() -> AsyncIterator[bytes]:
+        for line in (b"hello\n", b"world\n"):
+            yield line
+
+    url = f"{SUPERVISOR_URL}/addons/core_ssh/stdin"
+    responses.post(url, status=200)
+    responses.post(url, status=200)
+    await supervisor_client.addons.write_addon_stdin_stream("core_ssh", _lines())
+    await supervisor_client.addons.write_addon_stdin_stream(
+        "core_ssh", BytesIO(b"from file")
+    )
+    requests = responses.requests[("POST", URL(url))]
+    assert [request.captured_body for request in requests] == [
+        b"hello\nworld\n",
+        b"from file",
+    ]
+
+
+async def test_addons_stdin_writer(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test small stdin writes are coalesced into fewer requests."""
+    url = f"{SUPERVISOR_URL}/addons/core_ssh/stdin"
+    for _ in range(3):
+        responses.post(url, status=200)
+
+    async with supervisor_client.addons.addon_stdin_writer(
+        "core_ssh", max_delay=0.01, max_size=8
+    ) as writer:
+        # Reaching max size sends at once
+        await writer.write(b"1234")
+        await writer.write(b"5678")
+        # Small writes within max delay share a request
+        await writer.write(b"a")
+        await writer.write(b"b")
+        await asyncio.sleep(0.05)
+        await writer.write(b"c")
+
+    requests = responses.requests[("POST", URL(url))]
+    assert [request.captured_body for request in requests] == [
+        b"12345678",
+        b"ab",
+        b"c",
+    ]
+
+
 async def test_addons_security(
     responses: aiointercept, supervisor_client: SupervisorClient
 ) -> None:
@@ -266,6 +357,114 @@ async def test_addons_stats(
     assert stats.network_rx == 1717120021
 
 
+@pytest.mark.parametrize(
+    ("options", "path", "accept"),
+    [
+        (None, "logs", "text/plain"),
+        (LogsOptions(follow=True), "logs/follow", "text/plain"),
+        (LogsOptions(boot=-1, verbose=True), "logs/boots/-1", "text/x-log"),
+        (
+            LogsOptions(boot="ccc7bc1b", follow=True, lines=50),
+            "logs/boots/ccc7bc1b/follow?lines=50",
+            "text/plain",
+        ),
+    ],
+)
+async def test_addons_logs(
+    responses: aiointercept,
+    supervisor_client: SupervisorClient,
+    options: LogsOptions | None,
+    path: str,
+    accept: str,
+) -> None:
+    """Test addon logs API."""
+    url = f"{SUPERVISOR_URL}/addons/core_ssh/{path}"
+    responses.get(
+        url,
+        status=200,
+        body=b"[s6-init] starting\nServer listening on :: port 22.\n",
+        content_type="text/plain",
+    )
+    lines = [
+        line
+        async for line in await supervisor_client.addons.addon_logs("core_ssh", options)
+    ]
+    assert lines == ["[s6-init] starting", "Server listening on :: port 22."]
+    assert (
+        responses.requests[("GET", URL(url))][0].kwargs["headers"]["Accept"] == accept
+    )
+
+
+async def test_addons_logs_page(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test paging through addon logs with a cursor."""
+    url = f"{SUPERVISOR_URL}/addons/core_ssh/logs"
+    responses.get(
+        url,
+        status=200,
+        body=(
+            b"2024-03-04 02:52:56.100 ha sshd[127]: line 1\n"
+            b"2024-03-04 02:52:56.200 ha sshd[127]: line 2\n"
+        ),
+        content_type="text/x-log",
+        headers={"X-First-Cursor": "s=b1;i=2a"},
+    )
+    page = await supervisor_client.addons.addon_logs_page("core_ssh", entries=2)
+    assert page.entries == ["line 1", "line 2"]
+    assert page.next_cursor == LogCursor("s=b1;i=2a", 2)
+    assert LogCursor.from_dict(page.next_cursor.to_dict()) == page.next_cursor
+    headers = responses.requests[("GET", URL(url))][0].kwargs["headers"]
+    assert headers["Range"] == "entries=:0:2"
+    assert headers["Accept"] == "text/x-log"
+
+    # Nothing new yet, resume from the same position next time
+    responses.clear()
+    responses.get(url, status=200, body=b"", content_type="text/plain")
+    next_page = await supervisor_client.addons.addon_logs_page(
+        "core_ssh", page.next_cursor, entries=2
+    )
+    assert next_page.entries == []
+    assert next_page.next_cursor == page.next_cursor
+    assert (
+        responses.requests[("GET", URL(url))][0].kwargs["headers"]["Range"]
+        == "entries=s=b1;i=2a:2:2"
+    )
+
+
+@pytest.mark.parametrize(("entries", "verbose"), [(2, False), (5, False), (5, True)])
+async def test_addons_logs_page_multiline_entry(
+    responses: aiointercept,
+    supervisor_client: SupervisorClient,
+    entries: int,
+    verbose: bool,  # noqa: FBT001
+) -> None:
+    """Test next cursor skips the entries received, not the lines."""
+    url = f"{SUPERVISOR_URL}/addons/core_ssh/logs"
+    lines = [
+        "2024-03-04 02:52:56.100 ha sshd[127]: line 1",
+        "2024-03-04 02:52:56.200 ha sshd[127]: Traceback (most recent call last):",
+        "  ValueError",
+    ]
+    responses.get(
+        url,
+        status=200,
+        body="".join(f"{line}\n" for line in lines),
+        content_type="text/x-log",
+        headers={"X-First-Cursor": "s=b1;i=2a"},
+    )
+    # A partial page ending in a traceback resumes after it
+    page = await supervisor_client.addons.addon_logs_page(
+        "core_ssh", entries=entries, options=LogsOptions(verbose=verbose)
+    )
+    assert page.entries == (
+        lines
+        if verbose
+        else ["line 1", "Traceback (most recent call last):", "  ValueError"]
+    )
+    assert page.next_cursor == LogCursor("s=b1;i=2a", 2)
+
+
 async def test_addons_serialize_by_alias() -> None:
     """Test serializing addons by alias."""
     response = Response.from_json(load_fixture("store_addon_info.json"))
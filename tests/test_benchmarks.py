@@ -0,0 +1,154 @@
+"""Test benchmark helpers."""
+
+from pathlib import Path
+
+from aiohttp import ClientSession, UnixConnector
+from benchmarks.__main__ import compare
+from benchmarks.fixtures import FIXTURE_MODELS, FIXTURES, model_decoder
+from benchmarks.payloads import PAYLOADS, response
+from benchmarks.server import InjectedError, ServerOptions, serve
+import pytest
+
+from aiohasupervisor import (
+    SupervisorClient,
+    SupervisorConnectionError,
+    SupervisorServiceUnavailableError,
+)
+from aiohasupervisor.models import LogCursor, LogsOptions
+from aiohasupervisor.models.base import Response
+
+
+async def test_fixture_models() -> None:
+    """Test every fixture which is a response decodes with its model."""
+    for fixture, spec in FIXTURE_MODELS.items():
+        response = Response.from_json((FIXTURES / fixture).read_bytes())
+        if spec:
+            assert model_decoder(spec)(response.data)
+
+    responses = {
+        path.name
+        for path in FIXTURES.glob("*.json")
+        if b'"result"' in path.read_bytes()
+    }
+    assert responses == FIXTURE_MODELS.keys()
+
+
+async def test_payloads() -> None:
+    """Test synthetic payloads decode with their model at the requested size."""
+    for payload in PAYLOADS.values():
+        data = Response.from_json(response(payload.generate(50))).data
+        decoded = model_decoder(payload.model)(data)
+        match payload.model:
+            case "jobs:JobsInfo":
+                nodes, key = decoded.jobs, "child_jobs"
+            case "host:DiskUsage":
+                nodes, key = [decoded], "children"
+            case _:
+                assert len(next(iter(data.values()))) == 50
+                continue
+        count = 0
+        while nodes:
+            count += len(nodes)
+            nodes = [child for node in nodes for child in getattr(node, key) or []]
+        assert count == 50
+
+
+async def test_compare() -> None:
+    """Test regressions beyond threshold are reported."""
+    baseline = {
+        "import": {"min": 1.0},
+        "first_decode": {"a.json": {"first": 1.0}},
+        "decode": {"a.json": {"json": 100.0, "data": 100.0}},
+    }
+    results = {
+        "import": {"min": 1.1},
+        "first_decode": {"a.json": {"first": 2.0}},
+        "decode": {"a.json": {"json": 200.0, "data": 50.0}},
+    }
+    assert compare(baseline, results, 0.2) == [
+        "first_decode.a.json: 1 -> 2",
+        "decode.a.json.data: 100 -> 50",
+    ]
+
+
+async def test_server(tmp_path: Path) -> None:
+    """Test stand-in Supervisor serves fixtures and ranges of backups."""
+    async with (
+        serve(ServerOptions(backup_size=200_000)) as url,
+        ClientSession() as session,
+        SupervisorClient(url, "abc123", session=session) as client,
+    ):
+        assert (await client.store.info()).addons[0].slug == "d5369777_music_assistant"
+        await client.supervisor.ping()
+        await client.addons.start_addon("core_ssh")
+        stream = await client.backups.download_backup("abc123")
+        assert len(b"".join([chunk async for chunk in stream])) == 200_000
+
+        async with session.get(
+            f"{url}/backups/abc123/download", headers={"Range": "bytes=70000-70003"}
+        ) as resp:
+            assert resp.status == 206
+            assert resp.headers["Content-Range"] == "bytes 70000-70003/200000"
+            assert await resp.read() == bytes([112, 113, 114, 115])
+
+    path = str(tmp_path / "supervisor.sock")
+    async with (
+        serve(path=path) as url,
+        ClientSession(connector=UnixConnector(path=path)) as session,
+        SupervisorClient(url, "abc123", session=session) as client,
+    ):
+        assert len(await client.addons.list()) == 2
+
+
+async def test_server_logs() -> None:
+    """Test stand-in Supervisor pages logs with Range and X-First-Cursor."""
+    async with (
+        serve(ServerOptions(log_entries=25)) as url,
+        SupervisorClient(url, "abc123") as client,
+    ):
+        pages = []
+        cursor = None
+        while not pages or pages[-1].entries:
+            pages.append(await client.addons.addon_logs_page("core_ssh", cursor, 10))
+            cursor = pages[-1].next_cursor
+        entries = [entry for page in pages for entry in page.entries]
+        assert [entry.split()[-1] for entry in entries if "Entry" in entry] == [
+            str(index) for index in range(25)
+        ]
+        assert len(entries) == 27
+        assert pages[1].next_cursor == LogCursor("10", 10)
+        assert pages[2].next_cursor == LogCursor("20", 5)
+
+        page = await client.host.logs_page(
+            LogCursor(skip=-3), 2, LogsOptions(boot=-1), identifier="kernel"
+        )
+        assert page.entries == [
+            "INFO (MainThread) [benchmarks.server] Entry 22",
+            "INFO (MainThread) [benchmarks.server] Entry 23",
+        ]
+        page = await client.host.logs_page(
+            LogCursor(skip=-1), 1, LogsOptions(verbose=True)
+        )
+        assert page.entries == [
+            (
+                "2026-01-01 00:00:00.024 ha addon[1]: "
+                "INFO (MainThread) [benchmarks.server] Entry 24"
+            )
+        ]
+        lines = [line async for line in await client.supervisor.logs()]
+        assert len(lines) == 27
+
+
+@pytest.mark.parametrize(
+    ("error", "exc_type"),
+    [
+        (InjectedError.UNAVAILABLE, SupervisorServiceUnavailableError),
+        (InjectedError.RESET, SupervisorConnectionError),
+    ],
+)
+async def test_server_errors(error: InjectedError, exc_type: type[Exception]) -> None:
+    """Test stand-in Supervisor injects errors."""
+    options = ServerOptions(error_rate=1, errors=(error,))
+    async with serve(options) as url, SupervisorClient(url, "abc123") as client:
+        with pytest.raises(exc_type):
+            await client.addons.list()
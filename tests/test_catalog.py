@@ -0,0 +1,371 @@
+"""Tests for store catalog."""
+
+import asyncio
+from dataclasses import replace
+from pathlib import Path
+
+from aiointercept import aiointercept
+import orjson
+import pytest
+
+from aiohasupervisor import SupervisorClient
+from aiohasupervisor.catalog import (
+    CACHE_VERSION,
+    StoreCatalog,
+    StoreCatalogCache,
+    StoreDocsCache,
+    StoreImageCache,
+)
+from aiohasupervisor.models import AddonStage, CpuArch, StoreInfo
+from aiohasupervisor.models.base import Response
+from aiohasupervisor.utils.cache import DiskCache, LRUCache
+
+from . import load_fixture
+from .const import SUPERVISOR_URL
+
+
+def _file_count(path: Path) -> int:
+    """Count files in directory."""
+    return len(list(path.iterdir()))
+
+
+def _store_info() -> StoreInfo:
+    """Get store info from fixture."""
+    return StoreInfo.from_dict(Response.from_json(load_fixture("store_info.json")).data)
+
+
+async def test_catalog_lookup() -> None:
+    """Test looking up addons and repositories by slug."""
+    info = _store_info()
+    catalog = StoreCatalog(info.addons, info.repositories)
+
+    assert len(catalog) == 88
+    assert "a0d7b954_grafana" in catalog
+    assert catalog.get("a0d7b954_grafana").name == "Grafana"
+    assert catalog.get("missing") is None
+    assert catalog.repository("local").name == "Local add-ons"
+    assert len(catalog.repositories) == 6
+    assert catalog.addons == info.addons
+
+
+async def test_catalog_search() -> None:
+    """Test searching by words and facets."""
+    info = _store_info()
+    catalog = StoreCatalog(info.addons, info.repositories)
+
+    assert [addon.slug for addon in catalog.search("grafana")] == ["a0d7b954_grafana"]
+    # Partially typed words and description matches
+    assert "a0d7b954_grafana" in {
+        addon.slug for addon in catalog.search("analyt MONITOR")
+    }
+    assert catalog.search("grafana", repository="local") == []
+    assert catalog.search("no such words") == []
+
+    results = catalog.search(stage=AddonStage.STABLE, arch=CpuArch.I386)
+    assert results
+    assert all(
+        addon.stage == AddonStage.STABLE and CpuArch.I386 in addon.arch
+        for addon in results
+    )
+    assert [addon.name for addon in results] == sorted(
+        (addon.name for addon in results), key=str.casefold
+    )
+    assert len(catalog.search(limit=5)) == 5
+    assert len(catalog.search()) == 88
+    assert {addon.slug for addon in catalog.search(installed=True)} == {
+        addon.slug for addon in info.addons if addon.installed
+    }
+
+
+async def test_catalog_incremental_update() -> None:
+    """Test only changed addons are reindexed on update."""
+    info = _store_info()
+    catalog = StoreCatalog(info.addons, info.repositories)
+    grafana = catalog.get("a0d7b954_grafana")
+
+    addons = [
+        addon for addon in info.addons if addon.slug != "d5369777_music_assistant"
+    ]
+    addons[addons.index(grafana)] = replace(
+        grafana, description="Dashboards", update_available=True
+    )
+    assert catalog.update(addons) == {"d5369777_music_assistant", "a0d7b954_grafana"}
+    assert catalog.update(addons) == set()
+
+    assert len(catalog) == 87
+    assert len(catalog.repositories) == 6
+    assert "d5369777_music_assistant" not in {
+        addon.slug for addon in catalog.search("music assistant")
+    }
+    assert grafana not in catalog.search("analytics")
+    assert [addon.slug for addon in catalog.search("dashboards")] == [
+        "a0d7b954_grafana"
+    ]
+    assert "a0d7b954_grafana" in {
+        addon.slug for addon in catalog.search(update_available=True)
+    }
+
+
+async def test_catalog_refresh(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test refreshing catalog from store after reload."""
+    responses.post(f"{SUPERVISOR_URL}/store/reload", status=200)
+    responses.get(
+        f"{SUPERVISOR_URL}/store",
+        status=200,
+        body=load_fixture("store_info.json"),
+        repeat=True,
+    )
+    catalog = StoreCatalog()
+    assert len(await catalog.refresh(supervisor_client.store, reload=True)) == 88
+    assert await catalog.refresh(supervisor_client.store) == set()
+    assert len(catalog.repositories) == 6
+
+
+async def test_catalog_cache(
+    responses: aiointercept, supervisor_client: SupervisorClient, tmp_path: Path
+) -> None:
+    """Test store info is persisted and only refreshed when it changed."""
+    responses.get(
+        f"{SUPERVISOR_URL}/store",
+        status=200,
+        body=load_fixture("store_info.json"),
+        repeat=True,
+    )
+    path = tmp_path / "store.json"
+    cache = StoreCatalogCache(path)
+    assert await cache.load() is None
+
+    catalog = StoreCatalog()
+    assert len(await catalog.refresh(supervisor_client.store, cache=cache)) == 88
+    assert path.exists()
+    mtime = path.stat().st_mtime_ns
+    assert await catalog.refresh(supervisor_client.store, cache=cache) == set()
+    assert path.stat().st_mtime_ns == mtime
+
+    # Cold start from the file
+    cache = StoreCatalogCache(path)
+    info = await cache.load()
+    assert info == _store_info()
+    assert cache.digest is not None
+    assert await cache.refresh(supervisor_client.store) is None
+
+    # An empty catalog is seeded from the cache when store info is unchanged
+    catalog = StoreCatalog()
+    assert len(await catalog.refresh(supervisor_client.store, cache=cache)) == 88
+    assert len(catalog.repositories) == 6
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"not json", orjson.dumps({"version": 0, "digest": "abc", "info": {}})],
+)
+async def test_catalog_cache_unusable(tmp_path: Path, content: bytes) -> None:
+    """Test unusable cache files are ignored."""
+    path = tmp_path / "store.json"
+    path.write_bytes(content)
+    cache = StoreCatalogCache(path)
+    assert await cache.load() is None
+    assert cache.digest is None
+
+
+async def test_catalog_cache_without_digest(tmp_path: Path) -> None:
+    """Test a cache file without digest is ignored."""
+    path = tmp_path / "store.json"
+    path.write_bytes(
+        orjson.dumps({"version": CACHE_VERSION, "info": _store_info().to_dict()})
+    )
+    cache = StoreCatalogCache(path)
+    assert await cache.load() is None
+    assert cache.digest is None
+
+
+async def test_docs_cache(
+    responses: aiointercept, supervisor_client: SupervisorClient, tmp_path: Path
+) -> None:
+    """Test changelog and documentation are cached by addon version."""
+    changelog = load_fixture("store_addon_changelog.txt")
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/core_mosquitto/changelog",
+        status=200,
+        body=changelog,
+        content_type="text/plain",
+    )
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/core_mosquitto/documentation",
+        status=200,
+        body=load_fixture("store_addon_documentation.txt"),
+        content_type="text/plain",
+    )
+    cache = StoreDocsCache(supervisor_client.store, tmp_path)
+
+    # Concurrent misses share one request, mock only responds once
+    results = await asyncio.gather(
+        cache.changelog("core_mosquitto", "6.4.1"),
+        cache.changelog("core_mosquitto", "6.4.1"),
+    )
+    assert results == [changelog, changelog]
+    assert await cache.changelog("core_mosquitto", "6.4.1") == changelog
+    assert (await cache.documentation("core_mosquitto", "6.4.1")).startswith(
+        "# Home Assistant Add-on: Mosquitto broker"
+    )
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # A new instance reads from disk
+    cache = StoreDocsCache(supervisor_client.store, tmp_path)
+    assert await cache.changelog("core_mosquitto", "6.4.1") == changelog
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+async def test_docs_cache_size(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test texts are measured in bytes against the memory limit."""
+    for _ in range(2):
+        responses.get(
+            f"{SUPERVISOR_URL}/store/addons/core_mosquitto/changelog",
+            status=200,
+            body="äöü".encode(),
+            content_type="text/plain",
+        )
+    # Three characters but six bytes, too large to keep in memory
+    cache = StoreDocsCache(supervisor_client.store, max_memory=5)
+    assert await cache.changelog("core_mosquitto", "6.4.1") == "äöü"
+    assert await cache.changelog("core_mosquitto", "6.4.1") == "äöü"
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+async def test_docs_cache_prefetch(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test prefetching changelogs of addons with an update."""
+    info = _store_info()
+    addons = [
+        replace(info.addons[0], update_available=True),
+        replace(info.addons[1], update_available=True),
+        info.addons[2],
+    ]
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/{addons[0].slug}/changelog",
+        status=200,
+        body="Changelog",
+        content_type="text/plain",
+    )
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/{addons[1].slug}/changelog",
+        status=400,
+        json={"result": "error", "message": "No changelog found"},
+    )
+    cache = StoreDocsCache(supervisor_client.store)
+    await cache.prefetch(addons)
+    assert len(responses.requests) == 2
+
+    responses.clear()
+    assert (
+        await cache.changelog(addons[0].slug, addons[0].version_latest) == "Changelog"
+    )
+
+
+async def test_image_cache(
+    responses: aiointercept, supervisor_client: SupervisorClient, tmp_path: Path
+) -> None:
+    """Test icons are cached by addon version and stored once per content."""
+    addon = _store_info().addons[0]
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/{addon.slug}/icon",
+        status=200,
+        body=b"icon",
+        content_type="image/png",
+    )
+    cache = StoreImageCache(supervisor_client.store, tmp_path)
+    assert await asyncio.gather(cache.icon(addon), cache.icon(addon)) == [
+        b"icon",
+        b"icon",
+    ]
+    assert await cache.logo(replace(addon, logo=False)) is None
+    assert await cache.icon(replace(addon, icon=False)) is None
+
+    # New version with same icon reuses the stored image
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/{addon.slug}/icon",
+        status=200,
+        body=b"icon",
+        content_type="image/png",
+    )
+    updated = replace(addon, version_latest="99.0.0")
+    assert await cache.icon(updated) == b"icon"
+    assert _file_count(tmp_path) == 3
+
+    # A new instance reads from disk
+    responses.clear()
+    cache = StoreImageCache(supervisor_client.store, tmp_path)
+    assert await cache.icon(updated) == b"icon"
+
+
+async def test_image_cache_prefetch(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test prefetching icons and logos."""
+    info = _store_info()
+    addons = [info.addons[0], replace(info.addons[1], icon=False)]
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/{addons[0].slug}/icon",
+        status=200,
+        body=b"icon",
+        content_type="image/png",
+    )
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/{addons[0].slug}/logo",
+        status=200,
+        body=b"logo",
+        content_type="image/png",
+    )
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/{addons[1].slug}/logo",
+        status=404,
+        json={"result": "error", "message": "No logo found"},
+    )
+    cache = StoreImageCache(supervisor_client.store)
+    await cache.prefetch(addons, logos=True)
+    assert len(responses.requests) == 3
+
+    responses.clear()
+    assert await cache.icon(addons[0]) == b"icon"
+    assert await cache.logo(addons[0]) == b"logo"
+
+
+async def test_lru_cache() -> None:
+    """Test memory cache is bounded by size of entries."""
+    cache: LRUCache[str, str] = LRUCache(10, len)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+    assert cache.get("a") == "aaaa"
+    cache.set("c", "cccc")
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.size == 8
+    cache.set("big", "x" * 11)
+    assert "big" not in cache
+    assert cache.pop("a") == "aaaa"
+    assert len(cache) == 1
+
+
+async def test_disk_cache(tmp_path: Path) -> None:
+    """Test disk cache is bounded by size of files."""
+    cache = DiskCache(tmp_path / "cache", 10)
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"
+    cache.set("c", b"cccc")
+    assert cache.get("b") is None
+    assert cache.size == 8
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    # Usage is restored from the directory
+    cache = DiskCache(tmp_path / "cache", 10)
+    assert cache.get("c") == b"cccc"
+    assert cache.size == 8
+    cache.pop("c")
+    assert cache.get("c") is None
@@ -1,10 +1,19 @@
 """Tests for client."""
 
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from aiointercept import aiointercept
 import pytest
 
+from aiohasupervisor import SupervisorClient
 from aiohasupervisor.client import _SupervisorClient
 from aiohasupervisor.exceptions import SupervisorError
+from aiohasupervisor.utils.aiohttp import LineAsyncStreamIterator
 
+from . import load_fixture
 from .const import SUPERVISOR_URL
 
 
@@ -22,3 +31,60 @@ async def test_path_manipulation_blocked(method: str) -> None:
     with pytest.raises(SupervisorError):
         # relative path with percent encoding
         await action("test/%2E%2E/bad")
+
+
+@pytest.mark.parametrize(
+    ("chunks", "lines"),
+    [
+        ([], []),
+        ([b"one\ntwo\n"], ["one", "two"]),
+        ([b"one\ntw", b"o\nthr", b"ee"], ["one", "two", "three"]),
+        ([b"\n\n", b"x", b"", b"\n"], ["", "", "x"]),
+        ([b"caf\xc3", b"\xa9\n\xff\n"], ["caf\u00e9", "\ufffd"]),
+    ],
+)
+async def test_line_stream_iterator(chunks: list[bytes], lines: list[str]) -> None:
+    """Test splitting a chunked stream into lines."""
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    assert [line async for line in LineAsyncStreamIterator(_chunks())] == lines
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Executor counting functions submitted to it."""
+
+    submitted = 0
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """Count and submit function."""
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("offload_decode_size", "submitted"), [(None, 0), (1024, 1), (10**6, 0)]
+)
+async def test_offload_decode(
+    responses: aiointercept, offload_decode_size: int | None, submitted: int
+) -> None:
+    """Test large JSON responses are decoded into models in an executor."""
+    responses.get(
+        f"{SUPERVISOR_URL}/backups",
+        status=200,
+        body=load_fixture("backups_list.json"),
+    )
+    executor = _CountingExecutor(max_workers=1)
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    async with SupervisorClient(
+        SUPERVISOR_URL, "abc123", offload_decode_size=offload_decode_size
+    ) as client:
+        backups = await client.backups.list()
+
+    assert backups[0].slug == "58bc7491"
+    assert executor.submitted == submitted
@@ -13,6 +13,7 @@ from aiohasupervisor.models import (
     HomeAssistantRestartOptions,
     HomeAssistantStopOptions,
     HomeAssistantUpdateOptions,
+    LogsOptions,
 )
 
 from . import RequestTimeouts, assert_request_timeout, load_fixture
@@ -184,3 +185,21 @@ async def test_homeassistant_rebuild(
         f"{SUPERVISOR_URL}/core/rebuild",
         has_timeout=False,
     )
+
+
+async def test_homeassistant_logs(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test Home Assistant logs API."""
+    responses.get(
+        f"{SUPERVISOR_URL}/core/logs/follow?lines=1",
+        status=200,
+        body=b"s6-rc: info: service legacy-services successfully started\n",
+        content_type="text/plain",
+    )
+    result = await supervisor_client.homeassistant.logs(
+        LogsOptions(follow=True, lines=1)
+    )
+    assert [line async for line in result] == [
+        "s6-rc: info: service legacy-services successfully started"
+    ]
@@ -7,7 +7,13 @@ import pytest
 from yarl import URL
 
 from aiohasupervisor import SupervisorClient
-from aiohasupervisor.models import HostOptions, RebootOptions, ShutdownOptions
+from aiohasupervisor.models import (
+    HostOptions,
+    LogCursor,
+    LogsOptions,
+    RebootOptions,
+    ShutdownOptions,
+)
 
 from . import load_fixture
 from .const import SUPERVISOR_URL
@@ -202,3 +208,62 @@ async def test_host_disk_usage_with_custom_depth(
     # Test that the custom max_depth parameter was used
     assert result.total_bytes == 503312781312
     assert result.used_bytes == 430243422208
+
+
+@pytest.mark.parametrize(
+    ("options", "identifier", "path"),
+    [
+        (None, None, "host/logs"),
+        (None, "kernel", "host/logs/identifiers/kernel"),
+        (
+            LogsOptions(boot=0, follow=True),
+            "kernel",
+            "host/logs/boots/0/identifiers/kernel/follow",
+        ),
+    ],
+)
+async def test_host_logs(
+    responses: aiointercept,
+    supervisor_client: SupervisorClient,
+    options: LogsOptions | None,
+    identifier: str | None,
+    path: str,
+) -> None:
+    """Test host logs API."""
+    responses.get(
+        f"{SUPERVISOR_URL}/{path}",
+        status=200,
+        body=b"kernel: Linux version 6.6.31-haos\nkernel: Command line: rootwait",
+        content_type="text/plain",
+    )
+    result = await supervisor_client.host.logs(options, identifier)
+    assert [line async for line in result] == [
+        "kernel: Linux version 6.6.31-haos",
+        "kernel: Command line: rootwait",
+    ]
+
+
+async def test_host_logs_page(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test paging through host logs with a cursor."""
+    url = f"{SUPERVISOR_URL}/host/logs/boots/0/identifiers/kernel"
+    responses.get(
+        url,
+        status=200,
+        body=b"kernel: Linux version 6.6.31-haos\n",
+        content_type="text/plain",
+        headers={"X-First-Cursor": "s=b1;i=3f"},
+    )
+    page = await supervisor_client.host.logs_page(
+        LogCursor(skip=-1), 1, LogsOptions(boot=0), "kernel"
+    )
+    assert page.entries == ["kernel: Linux version 6.6.31-haos"]
+    assert page.next_cursor == LogCursor("s=b1;i=3f", 1)
+    assert (
+        responses.requests[("GET", URL(url))][0].kwargs["headers"]["Range"]
+        == "entries=:-1:1"
+    )
+
+    with pytest.raises(ValueError, match="cannot be used when paging"):
+        await supervisor_client.host.logs_page(options=LogsOptions(follow=True))
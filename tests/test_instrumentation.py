@@ -0,0 +1,137 @@
+"""Test instrumentation of requests."""
+
+from http import HTTPMethod
+
+from aiointercept import aiointercept
+import pytest
+
+from aiohasupervisor import SupervisorClient, SupervisorNotFoundError
+from aiohasupervisor.instrumentation import (
+    Instrumentation,
+    LatencyHistogram,
+    RequestInfo,
+    route_template,
+)
+from aiohasupervisor.models import AddonsOptions
+
+from . import load_fixture
+from .const import SUPERVISOR_URL
+
+
+@pytest.mark.parametrize(
+    ("uri", "route"),
+    [
+        ("addons", "addons"),
+        ("addons/core_ssh/info", "addons/{addon}/info"),
+        (
+            "addons/core_ssh/logs/boots/-1/follow",
+            "addons/{addon}/logs/boots/{boot}/follow",
+        ),
+        ("host/logs/identifiers/sshd", "host/logs/identifiers/{identifier}"),
+        ("backups/new/upload", "backups/new/upload"),
+        ("backups/abc123/restore/full", "backups/{backup}/restore/full"),
+        ("network/interface/end0/vlan/10", "network/interface/{interface}/vlan/{vlan}"),
+        ("store/addons/core_ssh/install", "store/addons/{addon}/install"),
+        ("jobs/info", "jobs/info"),
+        ("resolution/check/backups/run", "resolution/check/{check}/run"),
+    ],
+)
+async def test_route_template(uri: str, route: str) -> None:
+    """Test names of resources in a uri are replaced with parameters."""
+    assert route_template(uri) == route
+
+
+async def test_latency_histogram() -> None:
+    """Test latencies are counted in buckets doubling in size."""
+    histogram = LatencyHistogram()
+    assert histogram.quantile(0.5) is None
+    for seconds in (0.0005, 0.003, 0.003, 100):
+        histogram.observe(seconds)
+
+    buckets = histogram.buckets()
+    assert buckets[:3] == [(0.001, 1), (0.002, 1), (0.004, 3)]
+    assert buckets[-1] == (float("inf"), 4)
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(100.0065)
+    assert histogram.quantile(0.5) == 0.004
+    assert histogram.quantile(1) == float("inf")
+
+
+async def test_instrumentation(responses: aiointercept) -> None:
+    """Test requests are measured and added to histograms of their route."""
+    body = load_fixture("addons_info.json")
+    for _ in range(2):
+        responses.get(f"{SUPERVISOR_URL}/addons/core_ssh/info", status=200, body=body)
+    responses.post(f"{SUPERVISOR_URL}/addons/core_ssh/options", status=200)
+    responses.get(
+        f"{SUPERVISOR_URL}/addons/bad/info",
+        status=404,
+        body='{"result": "error", "message": "Addon bad does not exist"}',
+    )
+
+    started: list[RequestInfo] = []
+    ended: list[RequestInfo] = []
+    instrumentation = Instrumentation(on_start=started.append, on_end=ended.append)
+    async with SupervisorClient(
+        SUPERVISOR_URL, "abc123", instrumentation=instrumentation
+    ) as client:
+        await client.addons.addon_info("core_ssh")
+        await client.addons.addon_info("core_ssh")
+        await client.addons.set_addon_options("core_ssh", AddonsOptions(config={}))
+        with pytest.raises(SupervisorNotFoundError):
+            await client.addons.addon_info("bad")
+
+    assert started == ended
+    first, second, options, error = ended
+    assert first.route == "addons/{addon}/info"
+    assert first.status == 200
+    assert first.bytes_in == len(body.encode())
+    assert first.reused_connection is False
+    assert first.connect is not None
+    assert second.reused_connection is True
+    for info in (first, second):
+        assert info.network is not None
+        assert info.decode is not None
+        assert info.decoded is not None
+        assert info.ended is not None
+        assert info.decoded <= info.ended
+        assert info.network + info.decode <= info.duration
+
+    assert options.method == HTTPMethod.POST
+    assert options.bytes_out == len(b'{"options": {}}')
+    assert options.decode is None
+
+    assert error.status == 404
+    assert isinstance(error.error, SupervisorNotFoundError)
+
+    histograms = instrumentation.histograms
+    assert histograms[(HTTPMethod.GET, "addons/{addon}/info", 200)].count == 2
+    assert histograms[(HTTPMethod.GET, "addons/{addon}/info", 404)].count == 1
+    assert histograms[(HTTPMethod.POST, "addons/{addon}/options", 200)].count == 1
+    decode_histograms = instrumentation.decode_histograms
+    assert decode_histograms[(HTTPMethod.GET, "addons/{addon}/info")].count == 2
+    assert (HTTPMethod.POST, "addons/{addon}/options") not in decode_histograms
+    assert instrumentation.in_flight[(HTTPMethod.GET, "addons/{addon}/info")] == 0
+    assert instrumentation.received[(HTTPMethod.GET, "addons/{addon}/info")] == (
+        2 * len(body.encode())
+    )
+    assert instrumentation.sent[(HTTPMethod.POST, "addons/{addon}/options")] == len(
+        b'{"options": {}}'
+    )
+
+
+async def test_instrumentation_callback_error(
+    responses: aiointercept, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing callback does not fail the request."""
+    responses.get(f"{SUPERVISOR_URL}/supervisor/ping", status=200)
+
+    def _fail(info: RequestInfo) -> None:
+        raise ValueError(info.route)
+
+    async with SupervisorClient(
+        SUPERVISOR_URL, "abc123", instrumentation=Instrumentation(on_end=_fail)
+    ) as client:
+        await client.supervisor.ping()
+
+    assert "Error in request callback for supervisor/ping" in caplog.text
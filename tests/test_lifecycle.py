@@ -0,0 +1,117 @@
+"""Test dependency ordered addon lifecycle."""
+
+from typing import Any
+
+from aiointercept import CallbackResult, aiointercept
+import orjson
+import pytest
+from yarl import URL
+
+from aiohasupervisor import SupervisorBadRequestError, SupervisorClient
+from aiohasupervisor.lifecycle import (
+    LifecycleAction,
+    run_lifecycle,
+    startup_dependencies,
+)
+from aiohasupervisor.models import AddonStartup
+
+from . import load_fixture
+from .const import SUPERVISOR_URL
+
+DEPENDENCIES = {"web": {"db", "mqtt"}, "db": set(), "mqtt": set(), "cron": {"web"}}
+
+
+def _record(
+    responses: aiointercept, action: str, addons: list[str], failing: str = ""
+) -> list[str]:
+    """Record order in which action is called on addons."""
+    order: list[str] = []
+
+    def _callback(url: URL, **kwargs: Any) -> CallbackResult:  # noqa: ARG001
+        addon = url.path.split("/")[2]
+        order.append(addon)
+        if addon == failing:
+            return CallbackResult(
+                status=400, payload={"result": "error", "message": "Failed"}
+            )
+        return CallbackResult(status=200)
+
+    for addon in addons:
+        responses.post(f"{SUPERVISOR_URL}/addons/{addon}/{action}", callback=_callback)
+    return order
+
+
+async def test_startup_dependencies() -> None:
+    """Test each startup stage depends on the previous one."""
+    assert startup_dependencies(
+        {
+            "a": AddonStartup.APPLICATION,
+            "b": AddonStartup.SERVICES,
+            "c": AddonStartup.SYSTEM,
+            "d": AddonStartup.APPLICATION,
+        }
+    ) == {"c": set(), "b": {"c"}, "a": {"b"}, "d": {"b"}}
+
+
+@pytest.mark.parametrize("action", [LifecycleAction.START, LifecycleAction.RESTART])
+async def test_lifecycle_start_order(
+    responses: aiointercept, supervisor_client: SupervisorClient, action: str
+) -> None:
+    """Test dependencies are started before dependents."""
+    order = _record(responses, action, ["web", "db", "mqtt", "cron"])
+    results = await run_lifecycle(
+        supervisor_client.addons,
+        LifecycleAction(action),
+        ["web", "db", "mqtt", "cron"],
+        dependencies=DEPENDENCIES,
+    )
+    assert results == dict.fromkeys(["db", "mqtt", "web", "cron"])
+    assert set(order[:2]) == {"db", "mqtt"}
+    assert order[2:] == ["web", "cron"]
+
+
+async def test_lifecycle_stop_order(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test dependents are stopped before dependencies."""
+    order = _record(responses, "stop", ["web", "db", "cron"])
+    await run_lifecycle(
+        supervisor_client.addons,
+        LifecycleAction.STOP,
+        ["db", "web", "cron"],
+        dependencies=DEPENDENCIES,
+    )
+    assert order == ["cron", "web", "db"]
+
+
+async def test_lifecycle_failure_skips_dependents(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test addons waiting for a failed addon are skipped."""
+    order = _record(responses, "start", ["db", "mqtt"], failing="db")
+    results = await run_lifecycle(
+        supervisor_client.addons,
+        LifecycleAction.START,
+        ["web", "db", "mqtt", "cron"],
+        dependencies=DEPENDENCIES,
+    )
+    assert set(order) == {"db", "mqtt"}
+    assert results.keys() == {"db", "mqtt"}
+    assert isinstance(results["db"], SupervisorBadRequestError)
+    assert results["mqtt"] is None
+
+
+async def test_lifecycle_derived_dependencies(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test dependencies are derived from startup stage of addons."""
+    for addon, startup in (("core_ssh", "services"), ("frontend", "application")):
+        info = orjson.loads(load_fixture("addons_info.json"))
+        info["data"] |= {"slug": addon, "startup": startup}
+        responses.get(f"{SUPERVISOR_URL}/addons/{addon}/info", status=200, json=info)
+    order = _record(responses, "start", ["core_ssh", "frontend"])
+
+    await run_lifecycle(
+        supervisor_client.addons, LifecycleAction.START, ["frontend", "core_ssh"]
+    )
+    assert order == ["core_ssh", "frontend"]
@@ -0,0 +1,180 @@
+"""Test log helpers."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+import gzip
+from importlib.util import find_spec
+from pathlib import Path
+
+from aiointercept import aiointercept
+import pytest
+
+from aiohasupervisor import SupervisorClient
+from aiohasupervisor.logs import (
+    export_logs,
+    merge_logs,
+    parse_log_timestamp,
+    strip_log_prefix,
+)
+from aiohasupervisor.models import LogCompression, LogEntry
+
+from .const import SUPERVISOR_URL
+
+
+async def _stream(
+    *lines: str, delay: float = 0, error: Exception | None = None
+) -> AsyncIterator[str]:
+    """Yield lines after an optional delay."""
+    await asyncio.sleep(delay)
+    for line in lines:
+        yield line
+    if error:
+        raise error
+
+
+def test_parse_log_timestamp() -> None:
+    """Test parsing timestamp of verbose log lines."""
+    assert parse_log_timestamp(
+        "2024-03-04 02:52:56.193 homeassistant sshd[127]: Accepted"
+    ) == datetime(2024, 3, 4, 2, 52, 56, 193000, UTC)
+    assert parse_log_timestamp("Server listening on :: port 22.") is None
+    assert parse_log_timestamp("2024-13-45 99:99:99.999 not a date") is None
+
+
+def test_strip_log_prefix() -> None:
+    """Test stripping timestamp, host and identifier of verbose log lines."""
+    assert (
+        strip_log_prefix("2024-03-04 02:52:56.193 homeassistant sshd[127]: Accepted")
+        == "Accepted"
+    )
+    assert strip_log_prefix("2024-03-04 02:52:56.193 ha kernel:   indented") == (
+        "  indented"
+    )
+    assert strip_log_prefix("  File main.py, line 1") == "  File main.py, line 1"
+
+
+async def test_merge_logs_ordered() -> None:
+    """Test lines from several sources are merged by timestamp."""
+    merged = merge_logs(
+        {
+            "core": _stream(
+                "2024-03-04 02:52:56.100 ha core[1]: one",
+                "2024-03-04 02:52:56.400 ha core[1]: four",
+            ),
+            "core_ssh": _stream(
+                "2024-03-04 02:52:56.200 ha sshd[2]: two",
+                "continuation without timestamp",
+                "2024-03-04 02:52:56.500 ha sshd[2]: five",
+            ),
+            "empty": _stream(),
+        }
+    )
+    assert [(entry.source, entry.line[-4:]) async for entry in merged] == [
+        ("core", " one"),
+        ("core_ssh", " two"),
+        ("core_ssh", "tamp"),
+        ("core", "four"),
+        ("core_ssh", "five"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("reorder_window", "order"), [(1.0, ["slow", "fast"]), (0.01, ["fast", "slow"])]
+)
+async def test_merge_logs_reorder_window(
+    reorder_window: float, order: list[str]
+) -> None:
+    """Test a quiet source only holds back other sources for the window."""
+    merged = merge_logs(
+        {
+            "fast": _stream("2024-03-04 02:52:57.000 ha fast[1]: later"),
+            "slow": _stream("2024-03-04 02:52:56.000 ha slow[1]: earlier", delay=0.2),
+        },
+        reorder_window=reorder_window,
+    )
+    assert [entry.source async for entry in merged] == order
+
+
+async def test_merge_logs_quiet_source() -> None:
+    """Test lines read together wait for a quiet source only once."""
+    lines = [f"2024-03-04 02:52:56.{i:03} ha core[1]: {i}" for i in range(20)]
+    late = "2024-03-04 02:52:57.000 ha quiet[1]: late"
+    merged = merge_logs(
+        {"core": _stream(*lines), "quiet": _stream(late, delay=1.5)},
+        reorder_window=0.2,
+    )
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert [(await anext(merged)).line for _ in lines] == lines
+    # Waiting the window for each line would take 20 * 0.2 seconds
+    assert loop.time() - start < 1
+    assert [entry.line async for entry in merged] == [late]
+
+
+async def test_merge_logs_error() -> None:
+    """Test errors reading a source are raised."""
+    merged = merge_logs(
+        {"core": _stream("line", error=ConnectionError("lost"))},
+        reorder_window=0,
+    )
+    assert await anext(merged) == LogEntry("core", None, "line")
+    with pytest.raises(ConnectionError, match="lost"):
+        await anext(merged)
+
+
+async def test_export_logs_gzip(
+    responses: aiointercept, supervisor_client: SupervisorClient, tmp_path: Path
+) -> None:
+    """Test exporting a log endpoint to a gzip file."""
+    body = b"".join(f"line {i}\n".encode() for i in range(5000))
+    responses.get(
+        f"{SUPERVISOR_URL}/core/logs", status=200, body=body, content_type="text/plain"
+    )
+    result = await export_logs(
+        await supervisor_client.homeassistant.logs(),
+        tmp_path / "core.log.gz",
+        "gzip",
+        chunk_size=1024,
+        max_chunks=2,
+    )
+    assert result.path == tmp_path / "core.log.gz"
+    assert result.bytes_read == len(body)
+    assert result.bytes_written == result.path.stat().st_size
+    assert result.bytes_written < len(body)
+    assert result.duration > 0
+    assert gzip.decompress(result.path.read_bytes()) == body
+
+
+async def test_export_logs_uncompressed(tmp_path: Path) -> None:
+    """Test exporting raw chunks without compression."""
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        yield b"one\n"
+        yield b"two\n"
+
+    result = await export_logs(_chunks(), tmp_path / "raw.log", None)
+    assert result.bytes_read == result.bytes_written == 8
+    assert (tmp_path / "raw.log").read_bytes() == b"one\ntwo\n"
+
+
+@pytest.mark.skipif(
+    find_spec("compression") is not None or find_spec("zstandard") is not None,
+    reason="zstd is available",
+)
+async def test_export_logs_zstd_unavailable(tmp_path: Path) -> None:
+    """Test zstd compression requires an implementation."""
+    with pytest.raises(ValueError, match="zstd compression requires"):
+        await export_logs(_stream("line"), tmp_path / "core.log.zst", "zstd")
+
+
+async def test_export_logs_write_error(tmp_path: Path) -> None:
+    """Test write errors are raised without blocking the source."""
+    with pytest.raises(FileNotFoundError):
+        await export_logs(
+            _stream(*(f"line {i}" for i in range(1000))),
+            tmp_path / "missing" / "core.log.gz",
+            LogCompression.GZIP,
+            chunk_size=10,
+            max_chunks=1,
+        )
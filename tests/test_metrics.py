@@ -0,0 +1,88 @@
+"""Test export of client metrics."""
+
+from aiohttp import ClientSession
+from aiointercept import aiointercept
+import pytest
+
+from aiohasupervisor import SupervisorClient, SupervisorNotFoundError
+from aiohasupervisor.instrumentation import Instrumentation
+from aiohasupervisor.metrics import CONTENT_TYPE, MetricsExporter
+from aiohasupervisor.utils.cache import LRUCache
+
+from . import load_fixture
+from .const import SUPERVISOR_URL
+
+ERROR = '{"result": "error", "message": "Addon bad does not exist"}'
+
+
+async def _make_requests(responses: aiointercept) -> Instrumentation:
+    """Make some requests with instrumentation and return it."""
+    responses.get(
+        f"{SUPERVISOR_URL}/addons/core_ssh/info",
+        status=200,
+        body=load_fixture("addons_info.json"),
+    )
+    responses.get(f"{SUPERVISOR_URL}/addons/bad/info", status=404, body=ERROR)
+    instrumentation = Instrumentation()
+    async with SupervisorClient(
+        SUPERVISOR_URL, "abc123", instrumentation=instrumentation
+    ) as client:
+        await client.addons.addon_info("core_ssh")
+        with pytest.raises(SupervisorNotFoundError):
+            await client.addons.addon_info("bad")
+    return instrumentation
+
+
+async def test_render(responses: aiointercept) -> None:
+    """Test metrics of requests and caches are rendered as OpenMetrics."""
+    instrumentation = await _make_requests(responses)
+    cache: LRUCache[str, str] = LRUCache(10, len)
+    cache.set("a", "a")
+    cache.get("a")
+    cache.get("b")
+    cache.get("c")
+    exporter = MetricsExporter(instrumentation, caches={"docs": cache})
+    lines = exporter.render().splitlines()
+
+    name = "supervisor_client_request_duration_seconds"
+    labels = 'method="GET",route="addons/{addon}/info"'
+    assert f"# TYPE {name} histogram" in lines
+    assert f"# UNIT {name} seconds" in lines
+    assert f'{name}_bucket{{{labels},status="200",le="+Inf"}} 1' in lines
+    assert f'{name}_count{{{labels},status="404"}} 1' in lines
+    assert f"supervisor_client_response_decode_seconds_count{{{labels}}} 1" in lines
+    assert f"supervisor_client_requests_in_flight{{{labels}}} 0" in lines
+    received = len(load_fixture("addons_info.json").encode())
+    assert f"supervisor_client_received_bytes_total{{{labels}}} {received}" in lines
+    assert 'supervisor_client_cache_hits_total{cache="docs"} 1' in lines
+    assert 'supervisor_client_cache_misses_total{cache="docs"} 2' in lines
+    assert f'supervisor_client_cache_hit_ratio{{cache="docs"}} {1 / 3!r}' in lines
+    assert lines[-1] == "# EOF"
+
+
+async def test_render_escapes_labels() -> None:
+    """Test label values are escaped."""
+    cache: LRUCache[str, str] = LRUCache(10, len)
+    exporter = MetricsExporter(Instrumentation())
+    exporter.add_cache('a "quoted"\\cache', cache)
+
+    assert (
+        'supervisor_client_cache_hit_ratio{cache="a \\"quoted\\"\\\\cache"} 0.0'
+        in exporter.render().splitlines()
+    )
+
+
+async def test_serve(unused_tcp_port: int) -> None:
+    """Test metrics are served on /metrics."""
+    exporter = MetricsExporter(Instrumentation())
+    await exporter.start(port=unused_tcp_port)
+    try:
+        async with (
+            ClientSession() as session,
+            session.get(f"http://127.0.0.1:{unused_tcp_port}/metrics") as response,
+        ):
+            assert response.status == 200
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert (await response.text()).endswith("# EOF\n")
+    finally:
+        await exporter.stop()
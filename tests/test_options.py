@@ -0,0 +1,68 @@
+"""Test local validation of addon options."""
+
+from typing import Any
+
+import pytest
+
+from aiohasupervisor.models import InstalledAddonComplete
+from aiohasupervisor.models.base import Response
+from aiohasupervisor.options import OptionsValidator, options_validator
+
+from . import load_fixture
+
+SCHEMA = [
+    {"name": "port", "required": True, "type": "integer", "valueMin": 1},
+    {"name": "ratio", "optional": True, "type": "float", "valueMax": 1},
+    {"name": "debug", "optional": True, "type": "boolean"},
+    {"name": "name", "optional": True, "type": "string", "lengthMax": 5},
+    {"name": "email", "optional": True, "type": "string", "format": "email"},
+    {"name": "url", "optional": True, "type": "string", "format": "url"},
+    {"name": "level", "optional": True, "type": "select", "options": ["b", "a"]},
+    {"name": "hosts", "required": True, "type": "string", "multiple": True},
+]
+
+
+def _addon() -> InstalledAddonComplete:
+    """Get addon info of core_ssh."""
+    return InstalledAddonComplete.from_dict(
+        Response.from_json(load_fixture("addons_info.json")).data
+    )
+
+
+async def test_options_validator_matches_supervisor() -> None:
+    """Test message matches the one Supervisor returns for missing options."""
+    validator = options_validator(_addon())
+    options = {"authorized_keys": [], "password": "", "apks": [], "bad": "config"}
+    result = validator.validate(options)
+    assert result.valid is False
+    assert result.message == (
+        f"Missing option 'server' in root in Terminal & SSH (core_ssh). Got {options!r}"
+    )
+    assert validator.validate(_addon().options).valid is True
+    assert options_validator(_addon()) is validator
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"port": "8080", "hosts": [], "debug": "on", "level": "a"}, ""),
+        ({"port": 1, "hosts": ["a"], "name": "!secret long_name"}, ""),
+        ({"port": "http", "hosts": []}, "expected int"),
+        ({"port": 0, "hosts": []}, "value must be at least 1.0"),
+        ({"port": 1, "hosts": [], "ratio": 2}, "value must be at most 1.0"),
+        ({"port": 1, "hosts": [], "debug": "maybe"}, "expected boolean"),
+        ({"port": 1, "hosts": [], "name": "toolong"}, "length of value"),
+        ({"port": 1, "hosts": [], "email": "nope"}, "expected an email address"),
+        ({"port": 1, "hosts": [], "url": "nope"}, "expected a URL"),
+        ({"port": 1, "hosts": [], "level": "c"}, "value must be one of ['a', 'b']"),
+        ({"port": 1, "hosts": "a"}, "Invalid list for option 'hosts' in Test"),
+        ({"port": None, "hosts": []}, "Missing required option 'port' in Test"),
+        ({"port": 1}, "Missing option 'hosts' in root in Test (test)"),
+    ],
+)
+async def test_options_validator(options: dict[str, Any], message: str) -> None:
+    """Test types, ranges, lists and optional keys are validated."""
+    result = OptionsValidator(SCHEMA, name="Test", slug="test").validate(options)
+    assert result.valid == (not message)
+    assert result.message.startswith(message)
+    assert result.pwned is None
@@ -0,0 +1,96 @@
+"""Test profiling of decoding responses."""
+
+import logging
+
+from aiointercept import aiointercept
+import pytest
+
+from aiohasupervisor import SupervisorClient
+from aiohasupervisor.instrumentation import Instrumentation, current_request
+from aiohasupervisor.models import InstalledAddonComplete
+from aiohasupervisor.models.backups import BackupList
+from aiohasupervisor.models.base import Response
+from aiohasupervisor.profiling import DecodeProfiler
+
+from . import load_fixture
+from .const import SUPERVISOR_URL
+
+
+async def test_decode_profiler(
+    responses: aiointercept, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test decodes are timed per model and slow ones logged with route."""
+    body = load_fixture("addons_info.json")
+    for _ in range(2):
+        responses.get(f"{SUPERVISOR_URL}/addons/core_ssh/info", status=200, body=body)
+
+    with DecodeProfiler(threshold=0) as profiler:
+        async with SupervisorClient(
+            SUPERVISOR_URL, "abc123", instrumentation=Instrumentation()
+        ) as client:
+            await client.addons.addon_info("core_ssh")
+            await client.addons.addon_info("core_ssh")
+            assert current_request() is not None
+
+    # Nested models are decoded as part of the model holding them
+    assert set(profiler.models) == {Response, InstalledAddonComplete}
+    stats = profiler.models[InstalledAddonComplete]
+    assert stats.count == stats.slow == 2
+    assert stats.offloaded == 0
+    assert 0 < stats.maximum <= stats.total
+    assert stats.mean == pytest.approx(stats.total / 2)
+    assert profiler.models[Response].count == 2
+
+    size = len(body.encode())
+    assert (
+        f"Decoding InstalledAddonComplete from GET addons/{{addon}}/info ({size} bytes)"
+        in caplog.text
+    )
+    assert f"Decoding Response from GET addons/{{addon}}/info ({size} bytes)" in (
+        caplog.text
+    )
+
+
+async def test_decode_profiler_uninstall(caplog: pytest.LogCaptureFixture) -> None:
+    """Test methods are restored and fast decodes are not logged."""
+    data = Response.from_json(load_fixture("addons_info.json")).data
+    profiler = DecodeProfiler()
+    profiler.install()
+    InstalledAddonComplete.from_dict(data)
+    profiler.uninstall()
+    InstalledAddonComplete.from_dict(data)
+
+    method = InstalledAddonComplete.__dict__["from_dict"]
+    assert method.__func__.__name__ == "__mashumaro_from_dict__"
+    assert profiler.models[InstalledAddonComplete].count == 1
+    assert profiler.models[InstalledAddonComplete].slow == 0
+    assert "Decoding" not in caplog.text
+
+
+async def test_decode_profiler_offloaded(
+    responses: aiointercept, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test offloaded decodes keep their request and are not called blocking."""
+    body = load_fixture("backups_list.json")
+    responses.get(f"{SUPERVISOR_URL}/backups", status=200, body=body)
+
+    caplog.set_level(logging.INFO)
+    with DecodeProfiler(threshold=0) as profiler:
+        async with SupervisorClient(
+            SUPERVISOR_URL,
+            "abc123",
+            instrumentation=Instrumentation(),
+            offload_decode_size=0,
+        ) as client:
+            await client.backups.list()
+
+    assert profiler.models[BackupList].offloaded == 1
+    assert profiler.models[BackupList].slow == 1
+    record = next(
+        record for record in caplog.records if "BackupList" in record.getMessage()
+    )
+    assert record.levelno == logging.INFO
+    assert record.getMessage().startswith(
+        f"Decoding BackupList from GET backups ({len(body.encode())} bytes) "
+        "ran off the event loop"
+    )
@@ -0,0 +1,90 @@
+"""Test recording and replaying requests to Supervisor."""
+
+import asyncio
+from pathlib import Path
+
+from aiohttp import ClientSession
+from aiointercept import aiointercept
+import pytest
+
+from aiohasupervisor import SupervisorClient, SupervisorError
+from aiohasupervisor.models import AddonsOptions
+from aiohasupervisor.recording import (
+    Exchange,
+    Recording,
+    RecordingTransport,
+    ReplayTransport,
+)
+from aiohasupervisor.transport import SessionTransport
+
+from . import load_fixture
+from .const import SUPERVISOR_URL
+
+
+async def test_record_and_replay(responses: aiointercept, tmp_path: Path) -> None:
+    """Test requests are recorded and replayed including streamed bodies."""
+    responses.get(
+        f"{SUPERVISOR_URL}/addons", status=200, body=load_fixture("addons_list.json")
+    )
+    responses.post(f"{SUPERVISOR_URL}/addons/core_ssh/options", status=200)
+    responses.get(
+        f"{SUPERVISOR_URL}/backups/abc123/download",
+        status=200,
+        body=b"backup" * 1000,
+        content_type="application/x-tar",
+    )
+
+    async with ClientSession() as session:
+        transport = RecordingTransport(SessionTransport(session))
+        async with SupervisorClient(
+            SUPERVISOR_URL, "abc123", transport=transport
+        ) as client:
+            addons = await client.addons.list()
+            await client.addons.set_addon_options(
+                "core_ssh", AddonsOptions(config={"a": 1})
+            )
+            stream = await client.backups.download_backup("abc123")
+            backup = b"".join([chunk async for chunk in stream])
+
+    recording = transport.recording
+    assert [(exchange.method, exchange.path) for exchange in recording.exchanges] == [
+        ("GET", "/addons"),
+        ("POST", "/addons/core_ssh/options"),
+        ("GET", "/backups/abc123/download"),
+    ]
+    assert recording.exchanges[1].json == {"options": {"a": 1}}
+    assert b"".join(chunk for _, chunk in recording.exchanges[2].chunks) == backup
+
+    recording.save(tmp_path / "recording.jsonl.gz")
+    replay = ReplayTransport(Recording.load(tmp_path / "recording.jsonl.gz"))
+    async with SupervisorClient(SUPERVISOR_URL, "abc123", transport=replay) as client:
+        assert await client.addons.list() == addons
+        await client.addons.set_addon_options(
+            "core_ssh", AddonsOptions(config={"a": 1})
+        )
+        stream = await client.backups.download_backup("abc123")
+        assert b"".join([chunk async for chunk in stream]) == backup
+
+        with pytest.raises(SupervisorError, match="No recorded response for GET"):
+            await client.addons.list()
+
+
+@pytest.mark.parametrize(("timing", "delay"), [(False, 0), (True, 0.2)])
+async def test_replay_timing(*, timing: bool, delay: float) -> None:
+    """Test replay is as fast as possible or keeps the original timing."""
+    exchange = Exchange(
+        start=0,
+        method="GET",
+        path="/backups/abc123/download",
+        status=200,
+        headers=[("Content-Type", "application/x-tar")],
+        latency=0.1,
+        chunks=[(0.15, b"back"), (0.2, b"up")],
+    )
+    replay = ReplayTransport(Recording([exchange]), timing=timing)
+    loop = asyncio.get_running_loop()
+    async with SupervisorClient(SUPERVISOR_URL, "abc123", transport=replay) as client:
+        started = loop.time()
+        stream = await client.backups.download_backup("abc123")
+        assert b"".join([chunk async for chunk in stream]) == b"backup"
+        assert delay <= loop.time() - started < delay + 0.1
@@ -1,6 +1,8 @@
 """Test root services on supervisor client."""
 
 from json import dumps
+import subprocess
+import sys
 
 from aiohttp import ClientSession
 from aiointercept import aiointercept
@@ -15,6 +17,7 @@ from aiohasupervisor import (
     SupervisorForbiddenError,
     SupervisorNotFoundError,
     SupervisorServiceUnavailableError,
+    models,
 )
 from aiohasupervisor.models import HostFeature, SupervisorState, UpdateType
 
@@ -145,3 +148,28 @@ async def test_error_handling(
 
     with pytest.raises(expected_exc, match=message):
         await supervisor_client.refresh_updates()
+
+
+def test_lazy_imports() -> None:
+    """Test component clients and models are only imported when used."""
+    code = (
+        "import sys\n"
+        "from aiohasupervisor import SupervisorClient\n"
+        "client = SupervisorClient('http://localhost', 'token')\n"
+        "assert 'aiohasupervisor.store' not in sys.modules\n"
+        "assert 'aiohasupervisor.models.network' not in sys.modules\n"
+        "assert client.store is client.store\n"
+        "assert 'aiohasupervisor.store' in sys.modules\n"
+        "from aiohasupervisor.models import NetworkInfo\n"
+        "assert 'aiohasupervisor.models.network' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_models_lazy_exports() -> None:
+    """Test every exported model can be resolved."""
+    for name in models.__all__:
+        assert getattr(models, name) is not None
+    assert set(models.__all__) <= set(dir(models))
+    with pytest.raises(AttributeError):
+        _ = models.Missing
@@ -0,0 +1,115 @@
+"""Test container stats history."""
+
+import pytest
+
+from aiohasupervisor.models import AddonsStats
+from aiohasupervisor.models.base import Response
+from aiohasupervisor.stats import StatsHistory, StatsMetric
+
+from . import load_fixture
+
+
+def _stats(
+    cpu_percent: float = 0.0, memory_usage: int = 0, network_rx: int = 0
+) -> AddonsStats:
+    """Get stats sample."""
+    return AddonsStats(
+        cpu_percent=cpu_percent,
+        memory_usage=memory_usage,
+        memory_limit=1000,
+        memory_percent=memory_usage / 10,
+        network_rx=network_rx,
+        network_tx=0,
+        blk_read=0,
+        blk_write=0,
+    )
+
+
+async def test_stats_history_from_fixture() -> None:
+    """Test history accepts stats returned by Supervisor."""
+    stats = AddonsStats.from_dict(
+        Response.from_json(load_fixture("addon_stats.json")).data
+    )
+    history = StatsHistory()
+    history.add("core_ssh", stats, timestamp=1)
+    assert history.containers == ["core_ssh"]
+    assert history.mean("core_ssh", StatsMetric.MEMORY_USAGE, 60) == 24588288
+    # Rates need two samples
+    assert history.mean("core_ssh", StatsMetric.NETWORK_RX_RATE, 60) is None
+
+
+async def test_stats_history_queries() -> None:
+    """Test mean, percentile and maximum over a window."""
+    history = StatsHistory()
+    for second in range(1, 101):
+        history.add("a", _stats(cpu_percent=second), timestamp=second)
+
+    assert history.mean("a", StatsMetric.CPU_PERCENT, 9.5) == 95.5
+    assert history.mean("a", StatsMetric.CPU_PERCENT, 1000) == 50.5
+    assert history.percentile("a", StatsMetric.CPU_PERCENT, 1000) == pytest.approx(
+        95.05
+    )
+    assert history.percentile("a", StatsMetric.CPU_PERCENT, 1000, 50) == 50.5
+    assert history.maximum("a", StatsMetric.CPU_PERCENT, 1000) == 100
+    assert history.mean("a", StatsMetric.CPU_PERCENT, 9.5, now=20) == 15.5
+    assert history.mean("missing", StatsMetric.CPU_PERCENT, 10) is None
+
+
+async def test_stats_history_rates() -> None:
+    """Test rates are derived from counters and survive counter resets."""
+    history = StatsHistory()
+    history.add("a", _stats(network_rx=1000), timestamp=0)
+    history.add("a", _stats(network_rx=3000), timestamp=2)
+    history.add("a", _stats(network_rx=7000), timestamp=4)
+    assert history.mean("a", StatsMetric.NETWORK_RX_RATE, 60) == 1500
+    # Container restarted, counter starts over
+    history.add("a", _stats(network_rx=400), timestamp=5)
+    assert history.maximum("a", StatsMetric.NETWORK_RX_RATE, 0.5) == 400
+
+
+async def test_stats_history_top() -> None:
+    """Test top consumers of a metric."""
+    history = StatsHistory()
+    for second in range(10):
+        history.add("low", _stats(memory_usage=10), timestamp=second)
+        history.add("high", _stats(memory_usage=300), timestamp=second)
+        history.add(
+            "spiky", _stats(memory_usage=500 if second == 9 else 1), timestamp=second
+        )
+
+    assert history.top(StatsMetric.MEMORY_USAGE, 2, 60) == [
+        ("high", 300),
+        ("spiky", 50.9),
+    ]
+    assert history.top(StatsMetric.MEMORY_PERCENT, 1, 60, percentile=100) == [
+        ("spiky", 50)
+    ]
+
+
+async def test_stats_history_repeated_timestamp() -> None:
+    """Test a repeated timestamp is rejected and leaves rates intact."""
+    history = StatsHistory()
+    history.add("a", _stats(network_rx=0), timestamp=0)
+    history.add("a", _stats(network_rx=100), timestamp=1)
+    with pytest.raises(ValueError, match="chronological"):
+        history.add("a", _stats(network_rx=200), timestamp=1)
+    history.add("a", _stats(network_rx=300), timestamp=2)
+
+    assert history.mean("a", StatsMetric.NETWORK_RX_RATE, 10, now=2) == 150
+    assert history.maximum("a", StatsMetric.NETWORK_RX_RATE, 10, now=2) == 200
+
+
+async def test_stats_history_eviction() -> None:
+    """Test old samples are dropped."""
+    history = StatsHistory(max_age=10, max_samples=5)
+    for second in range(20):
+        history.add("a", _stats(cpu_percent=second), timestamp=second)
+    assert history.mean("a", StatsMetric.CPU_PERCENT, 1000) == 17
+
+    with pytest.raises(ValueError, match="chronological"):
+        history.add("a", _stats(), timestamp=1)
+    with pytest.raises(ValueError, match="chronological"):
+        history.add("a", _stats(), timestamp=19)
+
+    history.remove("a")
+    assert history.containers == []
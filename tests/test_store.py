@@ -1,6 +1,7 @@
 """Tests for store supervisor client."""
 
 from json import loads
+from uuid import UUID
 
 from aiointercept import aiointercept
 import pytest
@@ -13,6 +14,7 @@ from aiohasupervisor.exceptions import (
     AddonNotSupportedMachineTypeError,
     SupervisorBadRequestError,
     SupervisorError,
+    SupervisorNotFoundError,
 )
 from aiohasupervisor.models import StoreAddonUpdate, StoreAddRepository
 from aiohasupervisor.models.addons import StoreAddonInstall
@@ -39,6 +41,44 @@ async def test_store_info(
     assert store.addons[0].name == "Music Assistant Server"
 
 
+async def test_store_info_if_changed(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test store info is only decoded when the payload changed."""
+    responses.get(
+        f"{SUPERVISOR_URL}/store",
+        status=200,
+        body=load_fixture("store_info.json"),
+        repeat=True,
+    )
+    digest, store = await supervisor_client.store.info_if_changed()
+    assert len(digest) == 64
+    assert store == await supervisor_client.store.info()
+
+    assert await supervisor_client.store.info_if_changed(digest) == (digest, None)
+    assert (await supervisor_client.store.info_if_changed("outdated"))[1] == store
+
+
+@pytest.mark.parametrize("image", ["icon", "logo"])
+async def test_store_addon_image(
+    responses: aiointercept, supervisor_client: SupervisorClient, image: str
+) -> None:
+    """Test store addon icon and logo APIs."""
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/core_mosquitto/{image}",
+        status=200,
+        body=b"\x89PNG\r\n\x1a\n",
+        content_type="image/png",
+        repeat=True,
+    )
+    get_image = getattr(supervisor_client.store, f"addon_{image}")
+    assert await get_image("core_mosquitto") == b"\x89PNG\r\n\x1a\n"
+
+    stream = getattr(supervisor_client.store, f"addon_{image}_stream")
+    chunks = [chunk async for chunk in await stream("core_mosquitto")]
+    assert b"".join(chunks) == b"\x89PNG\r\n\x1a\n"
+
+
 async def test_store_addons_list(
     responses: aiointercept, supervisor_client: SupervisorClient
 ) -> None:
@@ -176,6 +216,30 @@ async def test_store_addon_update(
     )
 
 
+async def test_store_addon_update_job(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test starting store addon update as a background job."""
+    url = f"{SUPERVISOR_URL}/store/addons/core_mosquitto/update"
+    responses.post(
+        url,
+        status=200,
+        json={"result": "ok", "data": {"job_id": "2febe59311f94d6ba36f6f9f73357ca8"}},
+    )
+    responses.post(url, status=200, json={"result": "ok", "data": {}})
+
+    job_id = await supervisor_client.store.update_addon_job(
+        "core_mosquitto", StoreAddonUpdate(backup=True)
+    )
+    assert job_id == UUID("2febe59311f94d6ba36f6f9f73357ca8")
+    assert responses.requests[("POST", URL(url))][0].kwargs["json"] == {
+        "backup": True,
+        "background": True,
+    }
+    # Update completed before Supervisor responded
+    assert await supervisor_client.store.update_addon_job("core_mosquitto") is None
+
+
 async def test_store_addon_availability(
     responses: aiointercept, supervisor_client: SupervisorClient
 ) -> None:
@@ -187,6 +251,95 @@ async def test_store_addon_availability(
     assert (await supervisor_client.store.addon_availability("core_mosquitto")) is None
 
 
+async def test_store_availability_many(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test bulk availability check with cached results."""
+    root_info = loads(load_fixture("root_info.json"))
+    for _ in range(3):
+        responses.get(
+            f"{SUPERVISOR_URL}/store/addons",
+            status=200,
+            body=load_fixture("store_addons_list.json"),
+        )
+    for _ in range(2):
+        responses.get(f"{SUPERVISOR_URL}/info", status=200, json=root_info)
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/core_mosquitto/availability", status=200
+    )
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/core_ssh/availability",
+        status=400,
+        body=load_fixture("store_addon_availability_error_architecture.json"),
+    )
+    result = await supervisor_client.store.availability_many(
+        ["core_mosquitto", "core_ssh", "core_mosquitto"]
+    )
+    assert result == {
+        "core_mosquitto": None,
+        "core_ssh": AddonNotSupportedArchitectureError,
+    }
+
+    # Cached results need no availability requests
+    assert (
+        await supervisor_client.store.availability_many(["core_ssh", "core_mosquitto"])
+        == result
+    )
+
+    # Change of Home Assistant version invalidates results, versions of store
+    # addons passed in are used without fetching the store addons list
+    store_addons = await supervisor_client.store.addons_list()
+    root_info = {
+        **root_info,
+        "data": {**root_info["data"], "homeassistant": "2099.1.0"},
+    }
+    responses.get(f"{SUPERVISOR_URL}/info", status=200, json=root_info)
+    responses.get(f"{SUPERVISOR_URL}/store/addons/core_ssh/availability", status=200)
+    core_ssh = next(addon for addon in store_addons if addon.slug == "core_ssh")
+    assert await supervisor_client.store.availability_many([core_ssh]) == {
+        "core_ssh": None
+    }
+    assert len(responses.requests[("GET", URL(f"{SUPERVISOR_URL}/store/addons"))]) == 3
+
+
+async def test_store_availability_many_errors(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test errors checking one addon are returned without caching them."""
+    for _ in range(3):
+        responses.get(
+            f"{SUPERVISOR_URL}/store/addons",
+            status=200,
+            body=load_fixture("store_addons_list.json"),
+        )
+    for _ in range(2):
+        responses.get(
+            f"{SUPERVISOR_URL}/info", status=200, body=load_fixture("root_info.json")
+        )
+        responses.get(
+            f"{SUPERVISOR_URL}/store/addons/unknown/availability",
+            status=404,
+            json={"result": "error", "message": "Addon unknown does not exist"},
+        )
+    responses.get(
+        f"{SUPERVISOR_URL}/store/addons/core_mosquitto/availability", status=200
+    )
+    store_addons = await supervisor_client.store.addons_list()
+    core_mosquitto = next(
+        addon for addon in store_addons if addon.slug == "core_mosquitto"
+    )
+
+    assert await supervisor_client.store.availability_many(
+        [core_mosquitto, "unknown"]
+    ) == {"core_mosquitto": None, "unknown": SupervisorNotFoundError}
+    # Errors are checked again, results of the check come from the cache
+    assert await supervisor_client.store.availability_many(
+        [core_mosquitto, "unknown"]
+    ) == {"core_mosquitto": None, "unknown": SupervisorNotFoundError}
+    url = URL(f"{SUPERVISOR_URL}/store/addons/unknown/availability")
+    assert len(responses.requests[("GET", url)]) == 2
+
+
 @pytest.mark.parametrize(
     ("error_fixture", "error_key", "exc_type"),
     [
@@ -8,7 +8,11 @@ import pytest
 from yarl import URL
 
 from aiohasupervisor import SupervisorClient
-from aiohasupervisor.models import SupervisorOptions, SupervisorUpdateOptions
+from aiohasupervisor.models import (
+    LogsOptions,
+    SupervisorOptions,
+    SupervisorUpdateOptions,
+)
 from aiohasupervisor.models.supervisor import DetectBlockingIO, FeatureFlag
 
 from . import load_fixture
@@ -202,3 +206,19 @@ async def test_supervisor_repair(
     assert responses.requests.keys() == {
         ("POST", URL(f"{SUPERVISOR_URL}/supervisor/repair"))
     }
+
+
+async def test_supervisor_logs(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test supervisor logs API."""
+    responses.get(
+        f"{SUPERVISOR_URL}/supervisor/logs/boots/-1",
+        status=200,
+        body=b"INFO (MainThread) [supervisor.bootstrap] Initializing Supervisor\n",
+        content_type="text/plain",
+    )
+    result = await supervisor_client.supervisor.logs(LogsOptions(boot=-1))
+    assert [line async for line in result] == [
+        "INFO (MainThread) [supervisor.bootstrap] Initializing Supervisor"
+    ]
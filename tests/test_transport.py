@@ -0,0 +1,81 @@
+"""Test transports of the client."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from http import HTTPMethod
+
+from aiohttp import ClientTimeout
+import pytest
+from yarl import URL
+
+from aiohasupervisor import SupervisorBadRequestError, SupervisorClient
+from aiohasupervisor.models import AddonsOptions
+from aiohasupervisor.transport import (
+    HandlerTransport,
+    LocalResponse,
+    TransportRequest,
+    TransportResponse,
+)
+
+from . import load_fixture
+from .const import SUPERVISOR_URL
+
+
+async def test_handler_transport() -> None:
+    """Test requests are answered by a handler in process."""
+    requests: list[TransportRequest] = []
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        yield b"back"
+        yield b"up"
+
+    async def _handler(request: TransportRequest) -> TransportResponse:
+        requests.append(request)
+        match request.url.path:
+            case "/addons":
+                return LocalResponse(
+                    load_fixture("addons_list.json"), content_type="application/json"
+                )
+            case "/backups/abc123/download":
+                return LocalResponse(_chunks(), content_type="application/x-tar")
+            case "/addons/bad/options":
+                return LocalResponse.json(
+                    {"result": "error", "message": "Invalid options"}, status=400
+                )
+        return LocalResponse.json({"result": "ok", "data": {}})
+
+    transport = HandlerTransport(_handler)
+    async with SupervisorClient(
+        SUPERVISOR_URL, "abc123", transport=transport
+    ) as client:
+        addons = await client.addons.list()
+        assert addons[0].slug == "core_ssh"
+
+        await client.addons.set_addon_options("core_ssh", AddonsOptions(config={}))
+        assert requests[-1].method == HTTPMethod.POST
+        assert requests[-1].json == {"options": {}}
+        assert requests[-1].headers["Authorization"] == "Bearer abc123"
+
+        stream = await client.backups.download_backup("abc123")
+        assert [chunk async for chunk in stream] == [b"back", b"up"]
+
+        with pytest.raises(SupervisorBadRequestError, match="Invalid options"):
+            await client.addons.set_addon_options("bad", AddonsOptions(config={}))
+
+
+async def test_handler_transport_timeout() -> None:
+    """Test total timeout of the request applies to the handler."""
+
+    async def _handler(request: TransportRequest) -> TransportResponse:  # noqa: ARG001
+        await asyncio.sleep(1)
+        return LocalResponse()
+
+    with pytest.raises(TimeoutError):
+        await HandlerTransport(_handler).request(
+            TransportRequest(
+                HTTPMethod.GET,
+                URL(SUPERVISOR_URL),
+                {},
+                timeout=ClientTimeout(total=0.01),
+            )
+        )
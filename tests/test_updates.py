@@ -0,0 +1,153 @@
+"""Test update planner and bulk updater."""
+
+from typing import Any
+
+from aiointercept import aiointercept
+import orjson
+from yarl import URL
+
+from aiohasupervisor import SupervisorClient, SupervisorError, SupervisorTimeoutError
+from aiohasupervisor.models import UpdateType
+from aiohasupervisor.updates import PlannedUpdate, plan_updates, run_updates
+
+from . import load_fixture
+from .const import SUPERVISOR_URL
+
+
+def _job(uuid: str, *, done: bool, errors: list[dict[str, Any]]) -> dict[str, Any]:
+    """Get job response with state."""
+    job = orjson.loads(load_fixture("jobs_get_job.json"))
+    job["data"] |= {"uuid": uuid, "done": done, "errors": errors, "child_jobs": []}
+    return job
+
+
+async def test_plan_updates(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test updates are ordered Supervisor, OS, core then addons."""
+    available = orjson.loads(load_fixture("root_available_updates.json"))
+    available["data"]["available_updates"].append(
+        {
+            "update_type": "supervisor",
+            "panel_path": "/update-available/supervisor",
+            "version_latest": "2024.08.0",
+        }
+    )
+    addons = orjson.loads(load_fixture("addons_list.json"))
+    addons["data"]["addons"][1]["update_available"] = True
+    responses.get(f"{SUPERVISOR_URL}/available_updates", status=200, json=available)
+    responses.get(f"{SUPERVISOR_URL}/addons", status=200, json=addons)
+
+    assert await plan_updates(supervisor_client) == [
+        PlannedUpdate(UpdateType.SUPERVISOR, "supervisor", "2024.08.0"),
+        PlannedUpdate(UpdateType.OS, "os", "13.0.dev20240802"),
+        PlannedUpdate(UpdateType.CORE, "core", "2024.9.0.dev202408010224"),
+        PlannedUpdate(UpdateType.ADDON, "a0d7b954_vscode", "5.15.0"),
+    ]
+
+
+async def test_run_updates(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test components update in order and addons update as background jobs."""
+    responses.post(f"{SUPERVISOR_URL}/supervisor/update", status=200)
+    # Old Supervisor still responds, then restarts, then responds updated
+    info = orjson.loads(load_fixture("supervisor_info.json"))
+    responses.get(f"{SUPERVISOR_URL}/supervisor/info", status=200, json=info)
+    responses.get(
+        f"{SUPERVISOR_URL}/supervisor/info", status=503, content_type="text/plain"
+    )
+    info["data"]["version"] = "2024.08.0"
+    responses.get(f"{SUPERVISOR_URL}/supervisor/info", status=200, json=info)
+    responses.post(f"{SUPERVISOR_URL}/core/update", status=200)
+    for slug, job_id in (("core_ssh", "aa" * 16), ("core_mosquitto", "bb" * 16)):
+        responses.post(
+            f"{SUPERVISOR_URL}/store/addons/{slug}/update",
+            status=200,
+            json={"result": "ok", "data": {"job_id": job_id}},
+        )
+    responses.get(
+        f"{SUPERVISOR_URL}/jobs/{'aa' * 16}",
+        status=200,
+        json=_job("aa" * 16, done=False, errors=[]),
+    )
+    responses.get(
+        f"{SUPERVISOR_URL}/jobs/{'aa' * 16}",
+        status=200,
+        json=_job("aa" * 16, done=True, errors=[]),
+    )
+    responses.get(
+        f"{SUPERVISOR_URL}/jobs/{'bb' * 16}",
+        status=200,
+        json=_job(
+            "bb" * 16,
+            done=True,
+            errors=[{"type": "AddonsError", "message": "Pull failed", "stage": None}],
+        ),
+    )
+    plan = [
+        PlannedUpdate(UpdateType.SUPERVISOR, "supervisor", "2024.08.0"),
+        PlannedUpdate(UpdateType.CORE, "core", "2024.9.0"),
+        PlannedUpdate(UpdateType.ADDON, "core_ssh", "9.15.0"),
+        PlannedUpdate(UpdateType.ADDON, "core_mosquitto", "6.5.0"),
+    ]
+    results = await run_updates(supervisor_client, plan, backup=True, poll_interval=0)
+
+    assert [result.update for result in results] == plan
+    assert all(result.duration >= 0 for result in results)
+    assert [result.error for result in results[:3]] == [None, None, None]
+    assert not any(result.deferred for result in results)
+    assert isinstance(results[3].error, SupervisorError)
+    assert str(results[3].error) == "Pull failed"
+
+    update_request = responses.requests[
+        ("POST", URL(f"{SUPERVISOR_URL}/store/addons/core_ssh/update"))
+    ][0]
+    assert update_request.kwargs["json"] == {"backup": True, "background": True}
+
+
+async def test_run_updates_os_reboot(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test updates after an OS update are deferred until the host is back."""
+    responses.post(f"{SUPERVISOR_URL}/os/update", status=200)
+    plan = [
+        PlannedUpdate(UpdateType.OS, "os", "13.0"),
+        PlannedUpdate(UpdateType.CORE, "core", "2024.9.0"),
+        PlannedUpdate(UpdateType.ADDON, "core_ssh", "9.15.0"),
+    ]
+    results = await run_updates(supervisor_client, plan, poll_interval=0)
+
+    assert [result.update for result in results] == plan
+    assert [result.deferred for result in results] == [False, True, True]
+    assert results[0].error is None
+    assert ("POST", URL(f"{SUPERVISOR_URL}/core/update")) not in responses.requests
+
+
+async def test_run_updates_plan_order(
+    responses: aiointercept, supervisor_client: SupervisorClient
+) -> None:
+    """Test results follow an interleaved plan and stuck jobs time out."""
+    responses.post(
+        f"{SUPERVISOR_URL}/store/addons/core_ssh/update",
+        status=200,
+        json={"result": "ok", "data": {"job_id": "aa" * 16}},
+    )
+    responses.get(
+        f"{SUPERVISOR_URL}/jobs/{'aa' * 16}",
+        status=200,
+        json=_job("aa" * 16, done=False, errors=[]),
+    )
+    responses.post(f"{SUPERVISOR_URL}/core/update", status=200)
+    plan = [
+        PlannedUpdate(UpdateType.ADDON, "core_ssh", "9.15.0"),
+        PlannedUpdate(UpdateType.CORE, "core", "2024.9.0"),
+    ]
+    results = await run_updates(
+        supervisor_client, plan, poll_interval=1, job_timeout=0.05
+    )
+
+    assert [result.update for result in results] == plan
+    assert isinstance(results[0].error, SupervisorTimeoutError)
+    assert results[0].error.job_id == "aa" * 16
+    assert results[1].error is None